@@ -0,0 +1,229 @@
+import hashlib
+
+from django.db.models import F
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+
+from .readers import values_read_path_enabled
+
+
+class ConditionalRetrieveMixin:
+    """
+    Adds ETag / Last-Modified validation to a retrieve view.
+
+    Before serializing, the object's timestamp is loaded with a single query
+    that reads only the primary key, the fields needed by the object
+    permissions and `last_modified_field`. If the client's If-None-Match or
+    If-Modified-Since still matches, 304 Not Modified is returned without
+    loading or serializing the full object. Unconditional requests skip the
+    lookup and take the validators from the object they serialize.
+
+    Attributes:
+        last_modified_field: Field (or related lookup) holding the modification timestamp
+        validator_fields: Model fields loaded for the object permission checks
+    """
+    last_modified_field = 'updated_at'
+    validator_fields = ()
+
+    def get_validator_queryset(self):
+        """
+        Return the queryset used for the timestamp lookup, without joins or prefetches.
+        """
+        return self.get_queryset().model._default_manager.all()
+
+    def get_validator_object(self):
+        """
+        Return a deferred instance carrying the pk, validator_fields and last_modified,
+        or None if the object does not exist.
+        """
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        return (
+            self.get_validator_queryset()
+            .filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+            .annotate(last_modified=F(self.last_modified_field))
+            .only('pk', *self.validator_fields)
+            .first()
+        )
+
+    def get_last_modified(self, instance):
+        """
+        Return the timestamp of a fully loaded instance by following last_modified_field.
+        """
+        value = instance
+        for attr in self.last_modified_field.split('__'):
+            value = getattr(value, attr)
+        return value
+
+    def get_etag(self, obj, last_modified):
+        """
+        Return a weak ETag derived from the model, primary key and timestamp.
+        """
+        version = f'{obj._meta.label}:{obj.pk}:{last_modified.isoformat()}'
+        return 'W/' + quote_etag(hashlib.sha1(version.encode('utf-8')).hexdigest())
+
+    def is_conditional_request(self, request):
+        return 'HTTP_IF_NONE_MATCH' in request.META or 'HTTP_IF_MODIFIED_SINCE' in request.META
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Answer conditional requests from the cheap timestamp lookup, otherwise
+        serialize the object as usual and attach its validators.
+        """
+        if self.is_conditional_request(request):
+            obj = self.get_validator_object()
+            if obj is not None and obj.last_modified is not None:
+                self.check_object_permissions(request, obj)
+                not_modified = self.get_not_modified_response(obj, obj.last_modified)
+                if not_modified is not None:
+                    return not_modified
+
+        instance = self.get_object()
+        serializer = self.get_serializer(instance)
+        response = Response(serializer.data)
+        self.set_validators(response, instance, self.get_last_modified(instance))
+        return response
+
+    def get_not_modified_response(self, obj, last_modified):
+        """
+        Return 304 Not Modified if the request's validators still match, otherwise None.
+        """
+        return get_conditional_response(
+            self.request._request,
+            etag=self.get_etag(obj, last_modified),
+            last_modified=int(last_modified.timestamp()),
+        )
+
+    def set_validators(self, response, obj, last_modified):
+        if last_modified is not None:
+            response['ETag'] = self.get_etag(obj, last_modified)
+            response['Last-Modified'] = http_date(int(last_modified.timestamp()))
+
+
+class SparseFieldsMixin:
+    """
+    Adds sparse fieldsets to a list view: ?fields=id,title returns only those fields.
+
+    Besides trimming the serializer, the queryset is narrowed with `.only()`
+    to the columns the requested fields read, relations are only joined or
+    prefetched when a field needs them, and nested serializers that were not
+    requested are skipped entirely. Unknown field names return 400.
+
+    Attributes:
+        sparse_field_lookups: Model lookups read by fields without a plain
+            model source, e.g. {'username': ['user__first_name']} for a
+            SerializerMethodField
+    """
+    fields_query_param = 'fields'
+    sparse_field_lookups = {}
+
+    def get_list_serializer_fields(self):
+        serializer = self.get_serializer_class()(context=self.get_serializer_context())
+        return {name: field for name, field in serializer.fields.items() if not field.write_only}
+
+    def get_requested_fields(self):
+        """
+        Return the requested field names in serializer order, or None if all fields are requested.
+
+        Raises:
+            ValidationError: If a requested field does not exist
+        """
+        if self.request.method != 'GET':
+            return None
+        if not hasattr(self, '_requested_fields'):
+            value = self.request.query_params.get(self.fields_query_param, '')
+            names = {name.strip() for name in value.split(',') if name.strip()}
+            if not names:
+                self._requested_fields = None
+            else:
+                available = list(self.get_list_serializer_fields())
+                unknown = sorted(names.difference(available))
+                if unknown:
+                    raise ValidationError({
+                        self.fields_query_param: f"Unknown fields: {', '.join(unknown)}. Available fields: {', '.join(available)}."
+                    })
+                self._requested_fields = [name for name in available if name in names]
+        return self._requested_fields
+
+    def get_required_lookups(self):
+        """
+        Return lookups needed regardless of the requested fields, e.g. keyset pagination positions.
+        """
+        paginator = self.paginator
+        if paginator is not None and hasattr(paginator, 'get_required_fields'):
+            return paginator.get_required_fields(self.request)
+        return []
+
+    def get_sparse_queryset(self, queryset, fields):
+        """
+        Return the queryset loading only the columns and relations the given fields read.
+        """
+        serializer_fields = self.get_list_serializer_fields()
+        only, prefetch = set(self.get_required_lookups()), []
+        for name in fields:
+            field = serializer_fields[name]
+            source = field.source.replace('.', '__')
+            if name in self.sparse_field_lookups:
+                only.update(self.sparse_field_lookups[name])
+            elif isinstance(field, serializers.ListSerializer):
+                prefetch.append(source)
+            elif isinstance(field, serializers.BaseSerializer):
+                only.update(f'{source}__{child.source.replace(".", "__")}' for child in field.fields.values())
+            elif field.source != '*':
+                only.add(source)
+
+        # Relations traversed by a lookup are joined and must be loaded themselves.
+        select = {
+            '__'.join(lookup.split('__')[:depth])
+            for lookup in only for depth in range(1, lookup.count('__') + 1)
+        }
+        return (
+            queryset.select_related(None).prefetch_related(None)
+            .select_related(*select).prefetch_related(*prefetch)
+            .only(queryset.model._meta.pk.name, *only, *select)
+        )
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        fields = self.get_requested_fields()
+        if fields is not None:
+            queryset = self.get_sparse_queryset(queryset, fields)
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        serializer = super().get_serializer(*args, **kwargs)
+        fields = self.get_requested_fields()
+        if fields is not None:
+            target = getattr(serializer, 'child', serializer)
+            for name in list(target.fields):
+                if name not in fields:
+                    target.fields.pop(name)
+        return serializer
+
+
+class ValuesListMixin(SparseFieldsMixin):
+    """
+    Opt-in fast path for list views rendering `.values()` rows with a ValuesReader.
+
+    Filtering, ordering and pagination run on the same queryset as before;
+    only the page is fetched as plain rows and rendered by `values_reader_class`
+    instead of the serializer. Enabled globally with VALUES_READ_PATH = True.
+    Supports ?fields= like SparseFieldsMixin, selecting only the needed columns.
+
+    Attributes:
+        values_reader_class: ValuesReader reproducing the list serializer
+    """
+    values_reader_class = None
+
+    def list(self, request, *args, **kwargs):
+        if self.values_reader_class is None or not values_read_path_enabled():
+            return super().list(request, *args, **kwargs)
+
+        reader = self.values_reader_class(context=self.get_serializer_context(), fields=self.get_requested_fields())
+        rows = reader.get_rows(self.filter_queryset(self.get_queryset()), self.get_required_lookups())
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(reader.to_representation(page))
+        return Response(reader.to_representation(rows))
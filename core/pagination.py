@@ -0,0 +1,186 @@
+import base64
+import json
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination over a timestamp field with the primary key as tie-breaker.
+
+    Instead of counting rows and skipping an OFFSET, every page seeks directly
+    to the position after the last row of the previous page with
+    WHERE (field, id) < (value, id), so deep pages cost the same as the first one.
+    The response contains opaque next/previous cursors but no total count.
+
+    Query Parameters:
+        cursor: Opaque position returned in the next/previous links
+        page_size: Number of results per page (max max_page_size)
+        ordering: One of ordering_fields, optionally prefixed with '-'
+
+    A view may define `get_keyset_branches(queryset)` returning disjoint
+    querysets whose union is the queryset, e.g. one per indexed column of an
+    OR condition. Each branch then seeks on its own and the page is read with
+    a single UNION ALL, which the database merges in index order.
+    """
+    page_size = 5
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    ordering_query_param = 'ordering'
+    ordering_fields = ['created_at']
+    default_ordering = '-created_at'
+    tie_breaker = 'id'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Return one page of results seeking from the position encoded in the cursor.
+        """
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(request)
+
+        field = self.ordering.lstrip('-')
+        cursor = self.decode_cursor(request)
+        reverse = bool(cursor and cursor['reverse'])
+        descending = self.ordering.startswith('-') != reverse
+
+        branches = self.get_branches(queryset, view)
+        if cursor is not None:
+            try:
+                seek = self.get_seek_filter(field, cursor, descending)
+                branches = [branch.filter(seek) for branch in branches]
+            except (DjangoValidationError, TypeError, ValueError):
+                raise NotFound(self.invalid_cursor_message)
+        prefix = '-' if descending else ''
+        ordering = (f'{prefix}{field}', f'{prefix}{self.tie_breaker}')
+        if len(branches) == 1:
+            queryset = branches[0].order_by(*ordering)
+        else:
+            branches = [branch.order_by() for branch in branches]
+            queryset = branches[0].union(*branches[1:], all=True).order_by(*ordering)
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if reverse:
+            results.reverse()
+
+        # Moving backwards we always came from a later page; moving forwards
+        # a previous page exists as soon as we started from a cursor.
+        has_next = reverse or has_more
+        has_previous = has_more if reverse else cursor is not None
+        self.next_position = self.get_position(results[-1], field) if results and has_next else None
+        self.previous_position = self.get_position(results[0], field) if results and has_previous else None
+        return results
+
+    def get_branches(self, queryset, view):
+        """
+        Return the querysets paged together, the view's keyset branches if it defines them.
+        """
+        if view is not None and hasattr(view, 'get_keyset_branches'):
+            return view.get_keyset_branches(queryset)
+        return [queryset]
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+    def get_page_size(self, request):
+        """
+        Return the requested page size, capped at max_page_size.
+        """
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_ordering(self, request):
+        """
+        Return the requested ordering if it is supported by the keyset.
+
+        Raises:
+            ValidationError: If the ordering field cannot be used as a keyset
+        """
+        ordering = request.query_params.get(self.ordering_query_param) or self.default_ordering
+        if ordering.lstrip('-') not in self.ordering_fields:
+            raise ValidationError({
+                self.ordering_query_param: f"Cursor pagination only supports ordering by {self.ordering_fields}."
+            })
+        return ordering
+
+    def get_required_fields(self, request):
+        """
+        Return the fields every row must carry to build the cursors.
+        """
+        return [self.get_ordering(request).lstrip('-'), self.tie_breaker]
+
+    def get_seek_filter(self, field, cursor, descending):
+        """
+        Return the condition selecting rows strictly after the cursor position.
+        """
+        lookup = 'lt' if descending else 'gt'
+        return (
+            Q(**{f'{field}__{lookup}': cursor['value']})
+            | Q(**{field: cursor['value'], f'{self.tie_breaker}__{lookup}': cursor['id']})
+        )
+
+    def get_position(self, obj, field):
+        """
+        Return the cursor position of a model instance or values() row.
+        """
+        if isinstance(obj, dict):
+            value, pk = obj[field], obj[self.tie_breaker]
+        else:
+            value, pk = getattr(obj, field), getattr(obj, self.tie_breaker)
+        if hasattr(value, 'isoformat'):
+            value = value.isoformat()
+        return {'value': value, 'id': pk}
+
+    def decode_cursor(self, request):
+        """
+        Decode the cursor query parameter into a position dictionary.
+
+        Raises:
+            NotFound: If the cursor is malformed
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None
+        try:
+            data = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')).decode('utf-8'))
+            if not isinstance(data['v'], (str, int, float)) or isinstance(data['v'], bool):
+                raise ValueError('Invalid cursor value')
+            return {'value': data['v'], 'id': int(data['id']), 'reverse': bool(data.get('r'))}
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, position, reverse):
+        data = {'v': position['value'], 'id': position['id']}
+        if reverse:
+            data['r'] = 1
+        encoded = base64.urlsafe_b64encode(json.dumps(data).encode('utf-8')).decode('ascii')
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        return self.encode_cursor(self.next_position, reverse=False)
+
+    def get_previous_link(self):
+        if self.previous_position is None:
+            return None
+        return self.encode_cursor(self.previous_position, reverse=True)
@@ -90,6 +90,52 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# The offer list response cache uses OFFER_LIST_CACHE_ALIAS. Any backend works,
+# e.g. a file-based cache shared by several worker processes:
+#   'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+#   'LOCATION': BASE_DIR / 'cache',
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
+
+OFFER_LIST_CACHE_ALIAS = 'default'
+OFFER_LIST_CACHE_TIMEOUT = 60
+
+# Offer list counts are cached per filter combination for OFFER_LIST_COUNT_TIMEOUT
+# seconds or until offers change. With OFFER_LIST_COUNT_ESTIMATE, unfiltered
+# listings report a maintained counter that is recounted when it expires.
+OFFER_LIST_COUNT_TIMEOUT = 300
+OFFER_LIST_COUNT_ESTIMATE = False
+
+# Offer details read by /api/offerdetails/<pk>/ are kept in
+# an in-process LRU cache of OFFER_DETAIL_CACHE_SIZE entries (0 disables it).
+# Other worker processes pick up changes after OFFER_DETAIL_CACHE_TTL seconds.
+OFFER_DETAIL_CACHE_SIZE = 1024
+OFFER_DETAIL_CACHE_TTL = 30
+
+# GET /api/orders/ is paginated with keyset cursors over (created_at, id).
+# ORDER_LIST_PAGINATION = False restores the unpaginated list for old clients.
+ORDER_LIST_PAGINATION = True
+ORDER_LIST_PAGE_SIZE = 20
+ORDER_LIST_MAX_PAGE_SIZE = 100
+
+# `manage.py archive_orders` moves completed and cancelled orders whose last
+# change is older than ORDER_ARCHIVE_AFTER_DAYS into the archive table,
+# ORDER_ARCHIVE_BATCH_SIZE orders per transaction. Run it from cron or with
+# --interval; order list and detail views read the archive with ?include_archived=true.
+ORDER_ARCHIVE_AFTER_DAYS = 90
+ORDER_ARCHIVE_BATCH_SIZE = 1000
+
+# Opt-in: list endpoints with a ValuesReader (offers, orders, reviews) render
+# their pages from values() rows instead of serializing model instances.
+VALUES_READ_PATH = False
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -126,6 +172,13 @@ USE_TZ = True
 
 STATIC_URL = 'static/'
 
+# Uploaded files. Offer images get a thumbnail and a WebP variant, built by
+# OFFER_IMAGE_WORKERS background threads (0 builds them inline after commit).
+
+MEDIA_URL = 'media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+OFFER_IMAGE_WORKERS = 2
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
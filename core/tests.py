@@ -3,7 +3,11 @@ from rest_framework import status
 from django.urls import reverse
 from django.contrib.auth.models import User
 from user_profile.models import Profile
-from offers_app.models import Offer
+import re
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from offers_app.models import Offer, OfferDetail
+from orders_app.models import Order
 from reviews_app.models import Review
 
 class BaseInfoTests(APITestCase):
@@ -62,4 +66,98 @@ class BaseInfoTests(APITestCase):
         self.assertEqual(response.data['review_count'], 0)
         self.assertEqual(response.data['average_rating'], 0.0)
         self.assertEqual(response.data['business_profile_count'], 0)
-        self.assertEqual(response.data['offer_count'], 0)
\ No newline at end of file
+        self.assertEqual(response.data['offer_count'], 0)
+
+
+class HotPathQueryPlanTests(APITestCase):
+    """
+    Runs EXPLAIN QUERY PLAN on every query of the hot endpoints and fails on
+    full table scans or sorts that an index should have answered.
+    """
+
+    def setUp(self):
+        """
+        Create business and customer users with offers, orders and reviews.
+        """
+        self.business_user = User.objects.create_user(username='business@test.com', password='testpassword')
+        Profile.objects.create(user=self.business_user, type='business')
+        self.customer_user = User.objects.create_user(username='customer@test.com', password='testpassword')
+        Profile.objects.create(user=self.customer_user, type='customer')
+        for index in range(3):
+            offer = Offer.objects.create(user=self.business_user, title=f'Offer {index}')
+            OfferDetail.objects.bulk_create([
+                OfferDetail(offer=offer, title=offer_type, revisions=1, delivery_time_in_days=days,
+                            price=100 * days, features=[], offer_type=offer_type)
+                for days, offer_type in enumerate(['basic', 'standard', 'premium'], start=1)
+            ])
+            offer.update_summary()
+            Order.objects.create(
+                customer_user=self.customer_user, business_user=self.business_user, title='Order',
+                revisions=1, delivery_time_in_days=1, price=100, offer_type='basic'
+            )
+        Review.objects.create(
+            business_user=self.business_user, reviewer=self.customer_user, rating=5, description='Great'
+        )
+        self.offer_detail = OfferDetail.objects.first()
+        self.client.force_authenticate(user=self.customer_user)
+
+    def get_plan(self, sql):
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return [row[-1] for row in cursor.fetchall()]
+
+    def assert_indexed(self, url, params=None):
+        """
+        Request the url and assert that none of its queries scans a whole table or sorts without an index.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        selects = [query['sql'] for query in queries if query['sql'].startswith('SELECT')]
+        self.assertTrue(selects)
+        for sql in selects:
+            for line in self.get_plan(sql):
+                with self.subTest(url=url, params=params, sql=sql, plan=line):
+                    self.assertIsNone(re.fullmatch(r'SCAN \S+', line), "Full table scan")
+                    self.assertNotRegex(line, r'USE TEMP B-TREE FOR (RIGHT PART OF )?ORDER BY')
+
+    def test_offer_list_paths_use_indexes(self):
+        """
+        Ensures that the offer list by recency and by creator is answered from indexes.
+        """
+        url = reverse('offer-list')
+        self.assert_indexed(url, {'ordering': '-updated_at'})
+        self.assert_indexed(url, {'ordering': '-updated_at', 'creator_id': self.business_user.id})
+        self.assert_indexed(url, {'pagination': 'cursor', 'creator_id': self.business_user.id})
+        self.assert_indexed(reverse('offerdetail-detail', kwargs={'pk': self.offer_detail.id}))
+
+    def test_order_paths_use_indexes(self):
+        """
+        Ensures that order lists and order counts are answered from indexes.
+        """
+        self.assert_indexed(reverse('order-list'))
+        self.assert_indexed(reverse('order-list'), {'page_size': 1, 'ordering': 'created_at'})
+        self.assert_indexed(self.client.get(reverse('order-list'), {'page_size': 1}).data['next'])
+        self.assert_indexed(reverse('order-list'), {'include_archived': 'true'})
+        self.client.force_authenticate(user=self.business_user)
+        self.assert_indexed(reverse('order-list'))
+        self.assert_indexed(reverse('order-list'), {'include_archived': 'true', 'ordering': 'created_at'})
+        self.assert_indexed(reverse('order-count', kwargs={'business_user_id': self.business_user.id}))
+        self.assert_indexed(reverse('completed-order-count', kwargs={'business_user_id': self.business_user.id}))
+
+    def test_review_paths_use_indexes(self):
+        """
+        Ensures that review lists per business user or reviewer are answered from indexes.
+        """
+        url = reverse('review-list')
+        self.assert_indexed(url)
+        self.assert_indexed(url, {'business_user': self.business_user.id})
+        self.assert_indexed(url, {'business_user': self.business_user.id, 'ordering': 'rating'})
+        self.assert_indexed(url, {'reviewer': self.customer_user.id})
+
+    def test_profile_lists_use_indexes(self):
+        """
+        Ensures that business and customer profile lists are answered from the type index.
+        """
+        self.assert_indexed(reverse('all-business-user'))
+        self.assert_indexed(reverse('all-customer-user'))
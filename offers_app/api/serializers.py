@@ -1,7 +1,60 @@
 from django.contrib.auth.models import User
 from rest_framework import serializers
-from ..models import Offer, OfferDetail
-from django.db.models import Min
+from django.db import transaction
+from core.readers import ValuesReader
+from .. import cards
+from ..images import schedule_image_variants
+from ..models import Offer, OfferDetail, summarize_details
+
+
+def upsert_offer_details(offer, details_data):
+    """
+    Apply partial detail data to an offer, matching details by offer_type.
+
+    Existing details are read once (from the prefetch cache if present) and
+    written back with bulk_update, one statement per distinct set of changed
+    fields (usually a single one). Missing offer types are inserted
+    with a single bulk_create that upserts on (offer, offer_type), so a
+    concurrent request creating the same type cannot cause a duplicate.
+
+    Returns:
+        List of all details of the offer after the update
+    """
+    details_by_type = {detail.offer_type: detail for detail in offer.details.all()}
+    changed_fields = {}
+    created, created_fields = [], set()
+
+    for detail_data in details_data:
+        fields = {key: value for key, value in detail_data.items() if key != 'offer_type'}
+        detail = details_by_type.get(detail_data['offer_type'])
+        if detail is None:
+            detail = OfferDetail(offer=offer, offer_type=detail_data['offer_type'])
+            details_by_type[detail.offer_type] = detail
+            created.append(detail)
+        for key, value in fields.items():
+            setattr(detail, key, value)
+        if detail.pk is None:
+            created_fields.update(fields)
+        else:
+            changed_fields.setdefault(detail, set()).update(fields)
+
+    # Only write the fields each detail received, grouped to one statement per field set
+    groups = {}
+    for detail, fields in changed_fields.items():
+        if fields:
+            groups.setdefault(frozenset(fields), []).append(detail)
+    for fields, details in groups.items():
+        OfferDetail.objects.bulk_update(details, sorted(fields))
+
+    if created:
+        # offer_type is always updated so the upsert stays valid when no other field was sent
+        OfferDetail.objects.bulk_create(
+            created,
+            update_conflicts=True,
+            unique_fields=['offer', 'offer_type'],
+            update_fields=sorted(created_fields | {'offer_type'}),
+        )
+    return list(details_by_type.values())
 
 
 class OfferDetailListSerializer(serializers.ModelSerializer):
@@ -43,12 +96,37 @@ class UserDetailsSerializer(serializers.ModelSerializer):
         fields = ['first_name', 'last_name', 'username']
 
 
+class OfferImageVariantField(serializers.ImageField):
+    """
+    Read-only image field returning the first existing image variant.
+
+    Args:
+        variants: Offer image field names, in order of preference
+    """
+
+    def __init__(self, variants, **kwargs):
+        self.variants = variants
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        for name in self.variants:
+            file = getattr(instance, name)
+            if file:
+                return file
+        return None
+
+
 class OfferListSerializer(serializers.ModelSerializer):
     """
     Serializer for listing offers with summary information.
     Used in list views to provide comprehensive offer data including details,
     pricing information, and user details for paginated responses.
+    The image is the generated thumbnail, or the original until it exists.
+    Offers with a stored card are rendered from it without touching their
+    user or details; `render_card` in the context forces a live rendering.
     """
+    image = OfferImageVariantField(variants=['image_thumbnail', 'image'])
     details = OfferDetailListSerializer(many=True, read_only=True)
     min_price = serializers.SerializerMethodField()
     min_delivery_time = serializers.SerializerMethodField()
@@ -74,19 +152,87 @@ class OfferListSerializer(serializers.ModelSerializer):
 
     def get_min_price(self, obj):
         """
-        Calculate and return the minimum price from all offer details.
+        Return the denormalized minimum price from all offer details.
         Returns: Decimal or None if no details exist
         """
-        details = obj.details.all()
-        return details.aggregate(Min('price'))['price__min'] if details else None
+        return obj.min_price
 
     def get_min_delivery_time(self, obj):
         """
-        Calculate and return the minimum delivery time from all offer details.
+        Return the denormalized minimum delivery time from all offer details.
         Returns: Integer (days) or None if no details exist
         """
-        details = obj.details.all()
-        return details.aggregate(Min('delivery_time_in_days'))['delivery_time_in_days__min'] if details else None
+        return obj.min_delivery_time_in_days
+
+    def to_representation(self, instance):
+        if self.context.get('render_card') or 'card' in instance.get_deferred_fields() or instance.card is None:
+            return super().to_representation(instance)
+        return cards.card_to_representation(instance.card, self.fields, self.context.get('request'))
+
+
+class OfferListReader(ValuesReader):
+    """
+    values() fast path producing the same output as OfferListSerializer.
+
+    A page is read from the stored cards with a single query on the offer
+    table. Offers without a card yet are rendered live from values() rows,
+    with one more query for their details.
+    """
+    serializer_class = OfferListSerializer
+    columns = {'min_price': 'min_price', 'min_delivery_time': 'min_delivery_time_in_days'}
+    method_lookups = {
+        'image': ['image', 'image_thumbnail'],
+        'details': ['id'],
+        'user_details': ['user', 'user__first_name', 'user__last_name', 'user__username'],
+    }
+
+    def __init__(self, context=None, fields=None):
+        super().__init__(context, fields)
+        self.convert_image = self.get_file_converter(self.serializer.fields['image'], 'image')
+        self.card_fields = [name for name, _, _, _ in self.plan]
+
+    def get_rows(self, queryset, extra_lookups=()):
+        lookups = dict.fromkeys(['id', 'card', *extra_lookups])
+        return queryset.select_related(None).prefetch_related(None).values(*lookups)
+
+    def to_representation(self, rows):
+        rows = list(rows)
+        missing = [row['id'] for row in rows if row['card'] is None]
+        live = {}
+        if missing:
+            live_rows = list(super().get_rows(Offer.objects.filter(pk__in=missing), ['id']))
+            live = {row['id']: item for row, item in zip(live_rows, super().to_representation(live_rows))}
+
+        request = self.context.get('request')
+        return [
+            live[row['id']] if row['card'] is None
+            else cards.card_to_representation(row['card'], self.card_fields, request)
+            for row in rows
+        ]
+
+    def load_related(self, rows):
+        self.detail_ids = {}
+        if 'details' not in self.field_names:
+            return
+        details = OfferDetail.objects.filter(offer_id__in=[row['id'] for row in rows]).values_list('offer_id', 'id')
+        for offer_id, detail_id in details:
+            self.detail_ids.setdefault(offer_id, []).append(detail_id)
+
+    def read_image(self, row):
+        name = row['image_thumbnail'] or row['image']
+        return self.convert_image(name) if name else None
+
+    def read_details(self, row):
+        return [{'id': detail_id, 'url': f"/offerdetails/{detail_id}/"} for detail_id in self.detail_ids.get(row['id'], [])]
+
+    def read_user_details(self, row):
+        if row['user'] is None:
+            return None
+        return {
+            'first_name': row['user__first_name'],
+            'last_name': row['user__last_name'],
+            'username': row['user__username'],
+        }
 
 
 class OfferDetailSerializer(serializers.ModelSerializer):
@@ -119,7 +265,9 @@ class OfferRetrieveSerializer(serializers.ModelSerializer):
     Serializer for retrieving individual offers with detailed information.
     Used in detail views to provide complete offer data with absolute URLs
     for offer details and calculated pricing/delivery information.
+    The image is the generated WebP variant, or the original until it exists.
     """
+    image = OfferImageVariantField(variants=['image_webp', 'image'])
     details = OfferDetailRetrieveListSerializer(many=True, read_only=True)
     min_price = serializers.SerializerMethodField()
     min_delivery_time = serializers.SerializerMethodField()
@@ -143,19 +291,17 @@ class OfferRetrieveSerializer(serializers.ModelSerializer):
 
     def get_min_price(self, obj):
         """
-        Calculate and return the minimum price from all offer details.
+        Return the denormalized minimum price from all offer details.
         Returns: Decimal or None if no details exist
         """
-        details = obj.details.all()
-        return details.aggregate(Min('price'))['price__min'] if details else None
+        return obj.min_price
 
     def get_min_delivery_time(self, obj):
         """
-        Calculate and return the minimum delivery time from all offer details.
+        Return the denormalized minimum delivery time from all offer details.
         Returns: Integer (days) or None if no details exist
         """
-        details = obj.details.all()
-        return details.aggregate(Min('delivery_time_in_days'))['delivery_time_in_days__min'] if details else None
+        return obj.min_delivery_time_in_days
 
 
 class OfferUpdateSerializer(serializers.ModelSerializer):
@@ -215,27 +361,32 @@ class OfferUpdateSerializer(serializers.ModelSerializer):
         Returns:
             Updated Offer instance with modified fields and details
             
-        Details are matched by offer_type and updated individually.
+        Existing details are loaded once and matched by offer_type. Changed
+        details are written with one bulk_update, new ones with one upserting
+        bulk_create, and the offer with its recalculated price and delivery
+        summary with a single save, all inside one transaction.
+        The list card is re-rendered once at the end of the transaction.
         Only provided fields are updated, others remain unchanged.
+        A new image resets its variants, which are rebuilt after commit.
         """
         details_data = validated_data.pop('details', None)
-        
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
-        
-        if details_data:
-            for detail_data in details_data:
-                offer_type = detail_data.get('offer_type')
-                if offer_type:
-                    detail_obj = instance.details.filter(offer_type=offer_type).first()
-                    if detail_obj:
-                        for key, val in detail_data.items():
-                            setattr(detail_obj, key, val)
-                        detail_obj.save()
-                    else:
-                        OfferDetail.objects.create(offer=instance, **detail_data)
-        
+        image_changed = 'image' in validated_data
+        if image_changed:
+            for field in Offer.IMAGE_VARIANT_FIELDS:
+                setattr(instance, field, None)
+
+        with transaction.atomic(), cards.batch():
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
+
+            if details_data:
+                details = upsert_offer_details(instance, details_data)
+                instance.update_summary(details=details, save=False)
+
+            instance.save()
+
+        if image_changed:
+            schedule_image_variants(instance)
         return instance
 
 
@@ -287,6 +438,11 @@ class OfferSerializer(serializers.ModelSerializer):
     def create(self, validated_data):
         """
         Create offer with nested details.
+
+        The offer and its details are inserted with two statements in one
+        transaction, with the price and delivery summary denormalized up front,
+        followed by one update storing the list card.
+        Image variants are built in the background after commit.
         
         Args:
             validated_data: Dictionary containing offer and details data
@@ -298,12 +454,15 @@ class OfferSerializer(serializers.ModelSerializer):
         
         # Set user from request context
         validated_data['user'] = self.context['request'].user
-        
-        # Create offer
-        offer = Offer.objects.create(**validated_data)
-        
-        # Create details
-        for detail_data in details_data:
-            OfferDetail.objects.create(offer=offer, **detail_data)
-        
+
+        details = [OfferDetail(**detail_data) for detail_data in details_data]
+        validated_data.update(summarize_details(details))
+
+        with transaction.atomic(), cards.batch():
+            offer = Offer.objects.create(**validated_data)
+            for detail in details:
+                detail.offer = offer
+            OfferDetail.objects.bulk_create(details)
+
+        schedule_image_variants(offer)
         return offer
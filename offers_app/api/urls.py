@@ -1,8 +1,15 @@
 from django.urls import path
-from .views import OfferView, OfferDetailView, OfferDetailObjView
+from .views import (
+    OfferView, OfferDetailView, OfferDetailObjView, OfferListCacheStatsView, OfferImportView,
+    OfferFacetView, OfferDetailCacheStatsView
+)
 
 urlpatterns = [
     path('offers/', OfferView.as_view(), name='offer-list'),  
+    path('offers/facets/', OfferFacetView.as_view(), name='offer-facets'),
+    path('offers/import/', OfferImportView.as_view(), name='offer-import'),
+    path('offers/cache-stats/', OfferListCacheStatsView.as_view(), name='offer-list-cache-stats'),
     path('offers/<int:pk>/', OfferDetailView.as_view(), name='offer-detail'),
+    path('offerdetails/cache-stats/', OfferDetailCacheStatsView.as_view(), name='offerdetail-cache-stats'),
     path('offerdetails/<int:pk>/', OfferDetailObjView.as_view(), name='offerdetail-detail'),  
 ]
\ No newline at end of file
@@ -1,18 +1,40 @@
 
+from functools import partial
+from django.core.paginator import Paginator as DjangoPaginator
+from django.conf import settings
+from django.http import Http404
 from django.shortcuts import get_object_or_404
 from rest_framework import generics, status, filters
 from rest_framework.response import Response
 from rest_framework.pagination import PageNumberPagination
+from rest_framework.settings import api_settings
+from core.mixins import ConditionalRetrieveMixin, ValuesListMixin
+from core.pagination import KeysetPagination
 from .serializers import (
-    OfferDetailSerializer, OfferSerializer, OfferListSerializer,
+    OfferDetailSerializer, OfferSerializer, OfferListSerializer, OfferListReader,
     OfferRetrieveSerializer, OfferUpdateSerializer
 )
 from ..models import Offer, OfferDetail
 from ..filters import OfferFilter
-from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
+from ..search import OfferSearchFilter
+from rest_framework.permissions import IsAdminUser, IsAuthenticated, IsAuthenticatedOrReadOnly
+from rest_framework.views import APIView
+from .. import cache as offer_list_cache
+from ..detail_cache import offer_detail_cache
+from ..facets import get_facets
+from ..importer import OfferImporter
 from .permissions import IsBusinessUser, IsOwner
-from django_filters.rest_framework import DjangoFilterBackend, Filter
-import django_filters
+from django_filters.rest_framework import DjangoFilterBackend
+
+
+class PresetCountPaginator(DjangoPaginator):
+    """
+    Django paginator that uses a count computed beforehand instead of running COUNT(*).
+    """
+
+    def __init__(self, object_list, per_page, count, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.__dict__['count'] = count
 
 
 class OfferPagination(PageNumberPagination):
@@ -22,6 +44,11 @@ class OfferPagination(PageNumberPagination):
     Provides paginated responses with configurable page sizes.
     Default page size is 5 items per page, with user-configurable
     page_size parameter up to a maximum of 100 items per page.
+
+    The total count is cached per filter combination until offers change.
+    With OFFER_LIST_COUNT_ESTIMATE enabled, unfiltered listings use a
+    maintained offer counter instead. `count_estimated` in the response
+    tells whether `count` is exact.
     
     Query Parameters:
         page_size: Number of results per page (max 100)
@@ -31,23 +58,65 @@ class OfferPagination(PageNumberPagination):
     page_size_query_param = 'page_size'
     max_page_size = 100
 
+    def get_filter_params(self, request, view):
+        """
+        Return the (name, value) pairs of the request that affect which offers match.
+        """
+        names = set(view.filterset_class.base_filters) | {api_settings.SEARCH_PARAM}
+        return [(name, value) for name, values in request.query_params.lists() if name in names for value in values]
 
+    def get_count(self, queryset, request, view):
+        """
+        Return the total count and whether it is estimated.
+        """
+        params = self.get_filter_params(request, view)
+        if not params and getattr(settings, 'OFFER_LIST_COUNT_ESTIMATE', False):
+            return offer_list_cache.get_estimated_total(queryset), True
+        return offer_list_cache.get_count(params, queryset), False
 
+    def paginate_queryset(self, queryset, request, view=None):
+        count, self.count_estimated = self.get_count(queryset, request, view)
+        self.django_paginator_class = partial(PresetCountPaginator, count=count)
+        return super().paginate_queryset(queryset, request, view)
 
-class OfferFilter(django_filters.FilterSet):
-    creator_id = django_filters.NumberFilter(field_name='user__id')
-    min_price = django_filters.NumberFilter(field_name='details__price', lookup_expr='gte')
-    max_delivery_time = django_filters.NumberFilter(field_name='details__delivery_time_in_days', lookup_expr='lte')
+    def get_paginated_response(self, data):
+        return Response({
+            'count': self.page.paginator.count,
+            'count_estimated': self.count_estimated,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
+
+
+class OfferKeysetPagination(KeysetPagination):
+    """
+    Keyset pagination for offer listings, opted into with ?pagination=cursor.
+
+    Seeks on (updated_at, id) or (created_at, id) instead of counting and
+    offsetting, so deep pages cost the same as the first page.
+
+    Query Parameters:
+        cursor: Opaque cursor taken from the next/previous links
+        page_size: Number of results per page (max 100)
+        ordering: updated_at, created_at or their descending variants (default -updated_at)
+    """
+    ordering_fields = ['updated_at', 'created_at']
+    default_ordering = '-updated_at'
 
-    class Meta:
-        model = Offer
-        fields = ['creator_id']
-        
-    def filter_queryset(self, queryset):
-        queryset = super().filter_queryset(queryset)
-        return queryset.distinct()
 
-class OfferView(generics.ListCreateAPIView):
+def get_offer_summary_queryset():
+    """
+    Return offers prepared for list and retrieve serialization.
+
+    Joins the owning user and prefetches the details so a page of offers
+    is serialized with a constant number of queries. Price and delivery
+    summaries are read from the denormalized columns on Offer.
+    """
+    return Offer.objects.select_related('user').prefetch_related('details')
+
+
+class OfferView(ValuesListMixin, generics.ListCreateAPIView):
     """
     API view for listing and creating offers.
     
@@ -64,20 +133,50 @@ class OfferView(generics.ListCreateAPIView):
         - min_price: Minimum price filter
         - max_delivery_time: Maximum delivery time filter
         
-    Search: title, description fields
-    Ordering: updated_at, created_at, title fields  # <-- Korrigiert
-    Pagination: 5 items per page (configurable)
+    Search: title, description fields (SQLite FTS5 prefix search ranked by bm25)
+    Ordering: updated_at, created_at, title, min_price fields
+    Pagination: 5 items per page (configurable), keyset cursors with ?pagination=cursor
+    Caching: GET responses are cached per normalized query string until any offer changes
+    Rendering: list pages are read from the precomputed offer cards by OfferListReader,
+        a single query on the offer table per page
+    Sparse fieldsets: ?fields=id,title,min_price,image returns and selects only those fields
     """
     queryset = Offer.objects.all()
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        OfferSearchFilter,
         filters.OrderingFilter
     ]
     filterset_class = OfferFilter
     search_fields = ['title', 'description']
-    ordering_fields = ['updated_at', 'created_at', 'title']  # <-- 'price' entfernt
+    ordering_fields = ['updated_at', 'created_at', 'title', 'min_price']
     pagination_class = OfferPagination
+    values_reader_class = OfferListReader
+
+    def get_queryset(self):
+        """
+        List pages read the stored cards, so neither the user nor the details are loaded.
+        """
+        return Offer.objects.all()
+
+    def get_sparse_queryset(self, queryset, fields):
+        """
+        Load only the card and the columns pagination needs; fields are taken from the card.
+        """
+        return queryset.only('id', 'card', *self.get_required_lookups())
+
+    @property
+    def paginator(self):
+        """
+        Use keyset pagination when requested with ?pagination=cursor,
+        page number pagination otherwise.
+        """
+        if not hasattr(self, '_paginator'):
+            if self.request.query_params.get('pagination') == 'cursor':
+                self._paginator = OfferKeysetPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
 
     def get_permissions(self):
         if self.request.method == 'POST':
@@ -89,6 +188,23 @@ class OfferView(generics.ListCreateAPIView):
             return OfferListSerializer
         return OfferSerializer
 
+    def list(self, request, *args, **kwargs):
+        """
+        Return the offer list from the response cache or render and cache it.
+        The X-Cache header reports whether the response was a HIT or MISS.
+        """
+        key = offer_list_cache.get_key(request, offer_list_cache.get_generation())
+        data = offer_list_cache.get_response(key)
+        if data is not None:
+            response = Response(data)
+            response['X-Cache'] = 'HIT'
+            return response
+
+        response = super().list(request, *args, **kwargs)
+        offer_list_cache.set_response(key, response.data)
+        response['X-Cache'] = 'MISS'
+        return response
+
     def perform_create(self, serializer):
         """
         Set the user when creating an offer.
@@ -97,9 +213,16 @@ class OfferView(generics.ListCreateAPIView):
         serializer.save(user=self.request.user)
 
 
-class OfferDetailView(generics.RetrieveUpdateDestroyAPIView):
+class OfferDetailView(ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView):
+    """
+    API view for retrieving, updating and deleting a single offer.
+    GET supports conditional requests validated by the offer's updated_at.
+    """
     queryset = Offer.objects.all()
 
+    def get_queryset(self):
+        return get_offer_summary_queryset()
+
     def get_serializer_class(self):
         if self.request.method == 'GET':
             return OfferRetrieveSerializer
@@ -112,7 +235,130 @@ class OfferDetailView(generics.RetrieveUpdateDestroyAPIView):
             return [IsAuthenticated(), IsOwner()]
         return [IsAuthenticated()]
 
-class OfferDetailObjView(generics.RetrieveAPIView):
-    queryset = OfferDetail.objects.all()
+class OfferDetailObjView(ConditionalRetrieveMixin, generics.RetrieveAPIView):
+    """
+    API view for retrieving a single offer detail package.
+    OfferDetail has no timestamp of its own, so conditional requests are
+    validated by the parent offer's updated_at, which changes on every detail update
+    (serializer updates save the offer, direct detail writes touch it in a signal).
+    Responses and validators are served from the in-process offer detail cache.
+    """
     serializer_class = OfferDetailSerializer
     permission_classes = [IsAuthenticated]
+
+    def retrieve(self, request, *args, **kwargs):
+        entry = offer_detail_cache.get(self.kwargs['pk'])
+        if entry is None:
+            raise Http404("No OfferDetail matches the given query.")
+        obj = OfferDetail(pk=entry['data']['id'])
+        last_modified = entry['offer_updated_at']
+        if self.is_conditional_request(request):
+            not_modified = self.get_not_modified_response(obj, last_modified)
+            if not_modified is not None:
+                return not_modified
+        response = Response(entry['data'])
+        self.set_validators(response, obj, last_modified)
+        return response
+
+
+class OfferFacetView(generics.GenericAPIView):
+    """
+    API view returning price and delivery time distributions for the offer filter sidebar.
+
+    Honors the same filter and search parameters as GET /api/offers/ and
+    computes all buckets with one aggregate query over the denormalized
+    min_price and min_delivery_time_in_days columns. Responses are cached
+    like the offer list until any offer changes.
+
+    Permissions: Any authenticated user or read-only access
+
+    Response Format:
+        {"count": int,
+         "price": [{"min": 0, "max": 50, "count": int}, ..., {"min": 1000, "max": null, "count": int}],
+         "delivery_time": [{"min": 1, "max": 3, "count": int}, ...]}
+    """
+    queryset = Offer.objects.all()
+    permission_classes = [IsAuthenticatedOrReadOnly]
+    filter_backends = [DjangoFilterBackend, OfferSearchFilter]
+    filterset_class = OfferFilter
+    search_fields = ['title', 'description']
+    price_buckets = [0, 50, 100, 250, 500, 1000]
+    delivery_time_buckets = [1, 3, 7, 14, 30]
+
+    def get(self, request, *args, **kwargs):
+        namespace = offer_list_cache.FACETS_NAMESPACE
+        key = offer_list_cache.get_key(request, offer_list_cache.get_generation(), namespace=namespace)
+        data = offer_list_cache.get_response(key, namespace=namespace)
+        if data is None:
+            data = get_facets(self.filter_queryset(self.get_queryset()), {
+                'price': ('min_price', self.price_buckets),
+                'delivery_time': ('min_delivery_time_in_days', self.delivery_time_buckets),
+            })
+            offer_list_cache.set_response(key, data)
+        return Response(data, status=status.HTTP_200_OK)
+
+
+class OfferListCacheStatsView(APIView):
+    """
+    Returns hit/miss statistics of the offer list response cache.
+    Facet lookups are counted separately and reported under "facets".
+
+    Permissions: Admin users only
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(offer_list_cache.get_stats(), status=status.HTTP_200_OK)
+
+
+class OfferDetailCacheStatsView(APIView):
+    """
+    Returns hit/miss statistics of this worker process's offer detail cache.
+
+    Permissions: Admin users only
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(offer_detail_cache.get_stats(), status=status.HTTP_200_OK)
+
+
+class OfferImportView(APIView):
+    """
+    API view for importing many offers of the authenticated business user at once.
+
+    Accepts {"offers": [...]} where every entry has the same shape as the body
+    of POST /api/offers/. Rows are validated with the offer creation rules and
+    valid rows are written in chunks; invalid rows are reported and skipped.
+
+    Permissions: Business users only
+
+    Responses:
+        201: All rows were imported
+        207: Some rows were imported, see errors
+        400: No row was imported
+    """
+    permission_classes = [IsBusinessUser]
+    max_rows = 1000
+
+    def post(self, request):
+        rows = request.data.get('offers') if isinstance(request.data, dict) else None
+        if not isinstance(rows, list) or not rows:
+            return Response(
+                {"error": "Invalid request data. 'offers' must be a non-empty list."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(rows) > self.max_rows:
+            return Response(
+                {"error": f"At most {self.max_rows} offers can be imported per request."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        report = OfferImporter(request.user).run(rows)
+        if not report['errors']:
+            response_status = status.HTTP_201_CREATED
+        elif report['created']:
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_400_BAD_REQUEST
+        return Response(report, status=response_status)
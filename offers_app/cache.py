@@ -0,0 +1,174 @@
+import hashlib
+import time
+from urllib.parse import parse_qsl, urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+GENERATION_KEY = 'offers:list:generation'
+LIST_NAMESPACE = 'offers:list'
+FACETS_NAMESPACE = 'offers:facets'
+TOTAL_COUNT_KEY = 'offers:count:total'
+
+
+def get_cache():
+    """
+    Return the cache backend configured for the offer list (OFFER_LIST_CACHE_ALIAS in CACHES).
+    """
+    return caches[getattr(settings, 'OFFER_LIST_CACHE_ALIAS', 'default')]
+
+
+def get_timeout():
+    return getattr(settings, 'OFFER_LIST_CACHE_TIMEOUT', 60)
+
+
+def get_generation():
+    """
+    Return the current offer list generation.
+
+    A missing generation (e.g. evicted) is initialised from the clock, so it
+    never repeats a value that older cache entries may still be stored under.
+    """
+    cache = get_cache()
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        cache.add(GENERATION_KEY, time.time_ns(), None)
+        generation = cache.get(GENERATION_KEY)
+    return generation
+
+
+def _bump():
+    cache = get_cache()
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.add(GENERATION_KEY, time.time_ns(), None)
+
+
+def invalidate():
+    """
+    Invalidate all cached offer list responses by bumping the generation.
+
+    Bumps once immediately and once after the surrounding transaction commits,
+    so a response rendered from uncommitted state is never served afterwards.
+    """
+    _bump()
+    transaction.on_commit(_bump)
+
+
+def get_key(request, generation, namespace=LIST_NAMESPACE):
+    """
+    Return the cache key of an offer list (or other offer listing endpoint) request.
+
+    The query string is normalized by sorting its parameters, matching the
+    way pagination links are built. Scheme and host are part of the key
+    because responses contain absolute URLs.
+    """
+    query = urlencode(sorted(parse_qsl(request.META.get('QUERY_STRING', ''), keep_blank_values=True)))
+    url = f'{request.scheme}://{request.get_host()}/?{query}'
+    digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    return f'{namespace}:{generation}:{digest}'
+
+
+def get_response(key, namespace=LIST_NAMESPACE):
+    """
+    Return the cached response data for a key and count the hit or miss in the key's namespace.
+    """
+    cache = get_cache()
+    data = cache.get(key)
+    _count(f'{namespace}:hits' if data is not None else f'{namespace}:misses')
+    return data
+
+
+def set_response(key, data):
+    get_cache().set(key, data, get_timeout())
+
+
+def _count(counter_key):
+    cache = get_cache()
+    try:
+        cache.incr(counter_key)
+    except ValueError:
+        cache.add(counter_key, 0, None)
+        cache.incr(counter_key)
+
+
+def get_count_timeout():
+    return getattr(settings, 'OFFER_LIST_COUNT_TIMEOUT', 300)
+
+
+def get_count(params, queryset):
+    """
+    Return the exact number of offers matching a filter combination.
+
+    Counts are cached per generation, so any offer change recounts them.
+    The key only contains the filter parameters, so all pages and orderings
+    of the same filtered listing share one count.
+
+    Args:
+        params: (name, value) pairs of the filter parameters of the request
+        queryset: The filtered queryset, counted on a cache miss
+    """
+    query = urlencode(sorted(params))
+    digest = hashlib.sha256(query.encode('utf-8')).hexdigest()
+    key = f'offers:count:{get_generation()}:{digest}'
+    cache = get_cache()
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        cache.set(key, count, get_count_timeout())
+    return count
+
+
+def get_estimated_total(queryset):
+    """
+    Return the maintained estimate of the total number of offers.
+
+    The counter is adjusted by offer create and delete signals instead of
+    being invalidated, and recounted exactly once it expires, which bounds
+    the drift from writes that bypass signals or are rolled back.
+    """
+    cache = get_cache()
+    total = cache.get(TOTAL_COUNT_KEY)
+    if total is None:
+        total = queryset.count()
+        cache.add(TOTAL_COUNT_KEY, total, get_count_timeout())
+    return max(total, 0)
+
+
+def adjust_estimated_total(delta):
+    """
+    Add delta to the maintained offer counter if it is currently initialised.
+    """
+    try:
+        get_cache().incr(TOTAL_COUNT_KEY, delta)
+    except ValueError:
+        pass
+
+
+def get_namespace_stats(namespace):
+    """
+    Return the hit and miss counters of one namespace of cached responses.
+    """
+    cache = get_cache()
+    hits = cache.get(f'{namespace}:hits', 0)
+    misses = cache.get(f'{namespace}:misses', 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 4) if total else 0.0,
+    }
+
+
+def get_stats():
+    """
+    Return the hit and miss counters of the offer list cache, with those of the facets reported separately.
+    """
+    return {
+        **get_namespace_stats(LIST_NAMESPACE),
+        'generation': get_cache().get(GENERATION_KEY),
+        'facets': get_namespace_stats(FACETS_NAMESPACE),
+    }
@@ -0,0 +1,105 @@
+import json
+import threading
+from contextlib import contextmanager
+
+from rest_framework.renderers import JSONRenderer
+
+from .models import Offer
+
+_state = threading.local()
+
+
+def render_card(offer):
+    """
+    Render an offer like OfferListSerializer and return it as plain JSON data.
+
+    The card holds everything the offer list shows and nothing that depends
+    on the request: the image is stored as a relative URL and made absolute
+    when the card is read. Decimals and datetimes are stored as rendered.
+
+    Args:
+        offer: Offer with its user joined and its details prefetched
+    """
+    from .api.serializers import OfferListSerializer
+
+    data = OfferListSerializer(offer, context={'render_card': True}).data
+    return json.loads(JSONRenderer().render(data))
+
+
+def card_to_representation(card, field_names, request=None):
+    """
+    Return the given fields of a stored card, in order, as the list serializer would render them.
+    """
+    data = {name: card[name] for name in field_names}
+    if request is not None and data.get('image'):
+        data['image'] = request.build_absolute_uri(data['image'])
+    return data
+
+
+def refresh_cards(offer_ids):
+    """
+    Re-render and store the cards of the given offers.
+
+    Loads the offers with two queries and writes all cards with one
+    bulk_update, which does not send post_save and leaves updated_at alone.
+
+    Returns:
+        int: Number of refreshed offers
+    """
+    offer_ids = set(offer_ids)
+    if not offer_ids:
+        return 0
+    offers = list(
+        Offer.objects.filter(pk__in=offer_ids).defer('card')
+        .select_related('user').prefetch_related('details')
+    )
+    if not offers:
+        return 0
+    for offer in offers:
+        offer.card = render_card(offer)
+    Offer.objects.bulk_update(offers, ['card'])
+    return len(offers)
+
+
+def refresh_all_cards(chunk_size=500):
+    """
+    Rebuild the cards of every offer in chunks.
+
+    Returns:
+        int: Number of refreshed offers
+    """
+    offer_ids = list(Offer.objects.order_by('pk').values_list('pk', flat=True))
+    return sum(
+        refresh_cards(offer_ids[start:start + chunk_size])
+        for start in range(0, len(offer_ids), chunk_size)
+    )
+
+
+@contextmanager
+def batch():
+    """
+    Collect card refreshes requested inside the block and run them once on exit.
+
+    Nested blocks join the outermost one. Nothing is refreshed if the block
+    raises, since its transaction is rolled back anyway.
+    """
+    if getattr(_state, 'pending', None) is not None:
+        yield
+        return
+    _state.pending = pending = set()
+    try:
+        yield
+    finally:
+        _state.pending = None
+    refresh_cards(pending)
+
+
+def request_refresh(offer_ids):
+    """
+    Refresh the cards of the given offers now, or at the end of the current batch().
+    """
+    pending = getattr(_state, 'pending', None)
+    if pending is None:
+        refresh_cards(offer_ids)
+    else:
+        pending.update(offer_ids)
@@ -0,0 +1,179 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import transaction
+
+from .api.serializers import OfferDetailSerializer
+from .models import OfferDetail
+
+
+def get_max_size():
+    return getattr(settings, 'OFFER_DETAIL_CACHE_SIZE', 1024)
+
+
+def get_ttl():
+    return getattr(settings, 'OFFER_DETAIL_CACHE_TTL', 30)
+
+
+DETAIL_FIELDS = ['offer', 'title', 'revisions', 'delivery_time_in_days', 'price', 'features', 'offer_type']
+
+
+def get_detail_queryset():
+    """
+    Return offer details joined to their offer, reading only the offer columns
+    an entry needs, not the offer's description or stored card.
+    """
+    return OfferDetail.objects.select_related('offer').only(*DETAIL_FIELDS, 'offer__user', 'offer__updated_at')
+
+
+def build_entry(detail):
+    """
+    Return the cache entry of an offer detail loaded by get_detail_queryset().
+
+    Returns:
+        dict: {'data': OfferDetailSerializer output, 'fields': raw detail values
+            copied into orders, 'offer_id', 'business_user_id', 'offer_updated_at'}
+    """
+    return {
+        'data': OfferDetailSerializer(detail).data,
+        'fields': {
+            'title': detail.title,
+            'revisions': detail.revisions,
+            'delivery_time_in_days': detail.delivery_time_in_days,
+            'price': detail.price,
+            'features': detail.features,
+            'offer_type': detail.offer_type,
+        },
+        'offer_id': detail.offer_id,
+        'business_user_id': detail.offer.user_id,
+        'offer_updated_at': detail.offer.updated_at,
+    }
+
+
+def load_offer_detail(pk):
+    """
+    Load an offer detail with its offer in one joined query and return it as a
+    cache entry (see build_entry), or None if it does not exist.
+    """
+    detail = get_detail_queryset().filter(pk=pk).first()
+    return None if detail is None else build_entry(detail)
+
+
+def load_offer_details(pks):
+    """
+    Load many offer details with their offers in one joined IN query.
+
+    Bypasses the cache, so callers get the current rows.
+
+    Returns:
+        dict: {pk: cache entry}, without IDs that do not exist
+    """
+    return {detail.pk: build_entry(detail) for detail in get_detail_queryset().filter(pk__in=set(pks))}
+
+
+class OfferDetailCache:
+    """
+    Bounded, thread-safe, in-process LRU cache of offer details with a TTL.
+
+    Entries are shared by all threads of a worker process and must be treated
+    as read-only. Writes invalidate the affected entries in the writing
+    process immediately and again after commit; other processes see changes
+    once their copy expires after OFFER_DETAIL_CACHE_TTL seconds.
+    OFFER_DETAIL_CACHE_SIZE bounds the number of entries, 0 disables caching.
+
+    Database reads happen outside the lock. A load that overlaps an
+    invalidation is returned but not stored, so it cannot resurrect stale data.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.entries = OrderedDict()
+        self.keys_by_offer = {}
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, pk):
+        """
+        Return the cache entry of an offer detail, loading it on a miss, or None if it does not exist.
+        """
+        max_size = get_max_size()
+        now = time.monotonic()
+        with self.lock:
+            item = self.entries.get(pk)
+            if item is not None and item[0] > now:
+                self.entries.move_to_end(pk)
+                self.hits += 1
+                return item[1]
+            if item is not None:
+                self._remove(pk)
+            self.misses += 1
+            generation = self.generation
+
+        entry = load_offer_detail(pk)
+        if entry is None or max_size <= 0:
+            return entry
+        with self.lock:
+            if generation == self.generation:
+                self._remove(pk)
+                self.entries[pk] = (now + get_ttl(), entry)
+                self.keys_by_offer.setdefault(entry['offer_id'], set()).add(pk)
+                while len(self.entries) > max_size:
+                    self._remove(next(iter(self.entries)))
+        return entry
+
+    def _remove(self, pk):
+        item = self.entries.pop(pk, None)
+        if item is not None:
+            offer_id = item[1]['offer_id']
+            keys = self.keys_by_offer.get(offer_id)
+            if keys is not None:
+                keys.discard(pk)
+                if not keys:
+                    del self.keys_by_offer[offer_id]
+
+    def invalidate(self, detail_ids=(), offer_ids=()):
+        """
+        Drop the given details and all cached details of the given offers.
+        """
+        with self.lock:
+            self.generation += 1
+            for offer_id in offer_ids:
+                detail_ids = [*detail_ids, *self.keys_by_offer.get(offer_id, ())]
+            for pk in detail_ids:
+                self._remove(pk)
+
+    def invalidate_on_commit(self, detail_ids=(), offer_ids=()):
+        """
+        Invalidate now and again after commit, so a concurrent read of the
+        old row before commit does not stay cached.
+        """
+        self.invalidate(detail_ids, offer_ids)
+        transaction.on_commit(lambda: self.invalidate(detail_ids, offer_ids))
+
+    def clear(self):
+        with self.lock:
+            self.generation += 1
+            self.entries.clear()
+            self.keys_by_offer.clear()
+            self.hits = self.misses = 0
+
+    def get_stats(self):
+        """
+        Return hit/miss counters, the hit ratio and the current size.
+        """
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'size': len(self.entries),
+                'max_size': get_max_size(),
+                'ttl': get_ttl(),
+            }
+
+
+offer_detail_cache = OfferDetailCache()
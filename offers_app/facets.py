@@ -0,0 +1,44 @@
+from django.db.models import Count, Q
+
+
+def get_buckets(boundaries):
+    """
+    Turn ascending boundaries into (min, max) buckets, the last one open-ended.
+
+    Example: [0, 50, 100] -> [(0, 50), (50, 100), (100, None)]
+    """
+    return list(zip(boundaries, boundaries[1:] + [None]))
+
+
+def get_facets(queryset, facets):
+    """
+    Return bucketed counts of several offer columns with a single aggregate query.
+
+    Every bucket is a conditional COUNT over the (already filtered) queryset,
+    so the database scans the matching offers once for all facets. Buckets
+    include their min and exclude their max; offers without a value (e.g.
+    without details) are only part of the total count.
+
+    Args:
+        queryset: Filtered offer queryset
+        facets: Mapping of facet name to (column, boundaries)
+
+    Returns:
+        dict: {'count': int, <facet>: [{'min', 'max', 'count'}, ...]}
+    """
+    aggregates = {'count': Count('pk')}
+    for name, (column, boundaries) in facets.items():
+        for index, (low, high) in enumerate(get_buckets(boundaries)):
+            condition = Q(**{f'{column}__gte': low})
+            if high is not None:
+                condition &= Q(**{f'{column}__lt': high})
+            aggregates[f'{name}_{index}'] = Count('pk', filter=condition)
+
+    counts = queryset.order_by().aggregate(**aggregates)
+    data = {'count': counts['count']}
+    for name, (column, boundaries) in facets.items():
+        data[name] = [
+            {'min': low, 'max': high, 'count': counts[f'{name}_{index}']}
+            for index, (low, high) in enumerate(get_buckets(boundaries))
+        ]
+    return data
@@ -3,12 +3,16 @@ from .models import Offer
 
 
 class OfferFilter(django_filters.FilterSet):
+    """
+    Filters for the offer list.
 
-    creator_id = django_filters.NumberFilter(field_name='user')
-    min_price = django_filters.NumberFilter(
-        field_name='price', lookup_expr='gte')
-    max_delivery_time = django_filters.NumberFilter(
-        field_name='delivery_time', lookup_expr='lte')
+    min_price and max_delivery_time match offers where any detail matches.
+    They are answered by the denormalized summary columns on Offer, so they
+    are single-table index lookups.
+    """
+    creator_id = django_filters.NumberFilter(field_name='user__id')
+    min_price = django_filters.NumberFilter(field_name='max_price', lookup_expr='gte')
+    max_delivery_time = django_filters.NumberFilter(field_name='min_delivery_time_in_days', lookup_expr='lte')
 
     class Meta:
         model = Offer
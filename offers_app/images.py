@@ -0,0 +1,124 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import connections, transaction
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from .models import Offer
+from . import cache as offer_list_cache
+from . import cards
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_SIZE = (480, 360)
+WEBP_MAX_SIZE = (1600, 1600)
+WEBP_QUALITY = 80
+
+_executor = None
+
+
+def get_executor():
+    """
+    Return the shared thread pool that builds image variants outside the request thread.
+    """
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, 'OFFER_IMAGE_WORKERS', 2),
+            thread_name_prefix='offer-images',
+        )
+    return _executor
+
+
+def encode_webp(image):
+    buffer = BytesIO()
+    image.save(buffer, format='WEBP', quality=WEBP_QUALITY, method=4)
+    return ContentFile(buffer.getvalue())
+
+
+def render_variants(image):
+    """
+    Return the thumbnail and the WebP variant of a Pillow image as WebP files.
+
+    The thumbnail is cropped to exactly THUMBNAIL_SIZE for offer cards, the
+    WebP variant keeps the aspect ratio and is scaled down to WEBP_MAX_SIZE.
+    """
+    image = ImageOps.exif_transpose(image)
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if 'transparency' in image.info or 'A' in image.mode else 'RGB')
+    thumbnail = ImageOps.fit(image, THUMBNAIL_SIZE, Image.Resampling.LANCZOS)
+    webp = image.copy()
+    webp.thumbnail(WEBP_MAX_SIZE, Image.Resampling.LANCZOS)
+    return {'image_thumbnail': encode_webp(thumbnail), 'image_webp': encode_webp(webp)}
+
+
+def build_image_variants(offer_id):
+    """
+    Generate the thumbnail and WebP variant of an offer's current image.
+
+    The variants are only attached if the offer still has the image they were
+    built from, so a slow run never overwrites the variants of a newer upload.
+
+    Returns: True if variants were stored, otherwise False
+    """
+    offer = Offer.objects.filter(pk=offer_id).only('id', 'image').first()
+    if offer is None or not offer.image:
+        return False
+    source = offer.image.name
+    try:
+        with offer.image.open('rb') as file:
+            with Image.open(file) as image:
+                image.load()
+                files = render_variants(image)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        logger.exception("Could not build image variants for offer %s", offer_id)
+        return False
+
+    stem = os.path.splitext(os.path.basename(source))[0]
+    names = {}
+    for field_name, content in files.items():
+        field = Offer._meta.get_field(field_name)
+        names[field_name] = field.storage.save(field.generate_filename(offer, f'{stem}.webp'), content)
+
+    updated = Offer.objects.filter(pk=offer_id, image=source).update(updated_at=timezone.now(), **names)
+    if not updated:
+        for field_name, name in names.items():
+            Offer._meta.get_field(field_name).storage.delete(name)
+        return False
+    cards.refresh_cards([offer_id])
+    offer_list_cache.invalidate()
+    return True
+
+
+def _build_in_worker(offer_id):
+    try:
+        build_image_variants(offer_id)
+    except Exception:
+        logger.exception("Image variant worker failed for offer %s", offer_id)
+    finally:
+        connections.close_all()
+
+
+def schedule_image_variants(offer):
+    """
+    Build the image variants of an offer after the current transaction commits.
+
+    Runs in the background thread pool, or inline when OFFER_IMAGE_WORKERS is 0.
+    Until the variants exist, serializers fall back to the original image.
+    """
+    if not offer.image:
+        return
+    offer_id = offer.pk
+
+    def submit():
+        if getattr(settings, 'OFFER_IMAGE_WORKERS', 2) == 0:
+            build_image_variants(offer_id)
+        else:
+            get_executor().submit(_build_in_worker, offer_id)
+
+    transaction.on_commit(submit)
@@ -0,0 +1,140 @@
+import csv
+import json
+from itertools import islice
+
+from django.db import transaction
+from .api.serializers import OfferSerializer
+from .models import Offer, OfferDetail, summarize_details
+from . import cache as offer_list_cache
+from . import cards
+
+OFFER_TYPES = ['basic', 'standard', 'premium']
+CSV_DETAIL_FIELDS = ['title', 'revisions', 'delivery_time_in_days', 'price', 'features']
+
+
+class RowError:
+    """
+    Placeholder for a row that could not be parsed, carrying the reason.
+    """
+
+    def __init__(self, message):
+        self.message = message
+
+
+def read_ndjson(lines):
+    """
+    Yield one offer dictionary per non-empty line, in the same shape as POST /api/offers/.
+    Malformed lines yield a RowError so they are reported with their row number.
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError as error:
+            yield RowError(f"Invalid JSON: {error}")
+
+
+def read_csv(lines):
+    """
+    Yield one offer dictionary per CSV row.
+
+    Expected columns: title, description and for every offer type
+    (basic, standard, premium) <type>_title, <type>_revisions,
+    <type>_delivery_time_in_days, <type>_price and <type>_features,
+    where features are separated by '|'.
+    """
+    for row in csv.DictReader(lines):
+        details = []
+        for offer_type in OFFER_TYPES:
+            detail = {
+                field: row[f'{offer_type}_{field}']
+                for field in CSV_DETAIL_FIELDS
+                if row.get(f'{offer_type}_{field}') not in (None, '')
+            }
+            if not detail:
+                continue
+            detail['features'] = [f for f in detail.get('features', '').split('|') if f]
+            detail['offer_type'] = offer_type
+            details.append(detail)
+        yield {
+            'title': row.get('title') or '',
+            'description': row.get('description') or '',
+            'details': details,
+        }
+
+
+class OfferImporter:
+    """
+    Validates offer rows with OfferSerializer and writes them in chunks.
+
+    Every chunk of valid rows is written with one bulk_create for the offers
+    and one for their details inside a single transaction, followed by the
+    list cards of the new offers. Invalid rows are
+    skipped and reported with their 1-based row number and validation errors.
+    """
+
+    def __init__(self, user, chunk_size=500):
+        self.user = user
+        self.chunk_size = chunk_size
+
+    def run(self, rows):
+        """
+        Import all rows and return a report.
+
+        Returns:
+            dict: {'created': int, 'errors': [{'row': int, 'errors': ...}]}
+        """
+        report = {'created': 0, 'errors': []}
+        numbered_rows = enumerate(rows, start=1)
+        while True:
+            chunk = list(islice(numbered_rows, self.chunk_size))
+            if not chunk:
+                break
+            valid = []
+            for number, row in chunk:
+                if isinstance(row, RowError):
+                    report['errors'].append({'row': number, 'errors': row.message})
+                    continue
+                if not isinstance(row, dict):
+                    report['errors'].append({'row': number, 'errors': "Each row must be an object."})
+                    continue
+                serializer = OfferSerializer(data=row)
+                if serializer.is_valid():
+                    valid.append(serializer.validated_data)
+                else:
+                    report['errors'].append({'row': number, 'errors': serializer.errors})
+            report['created'] += self.write_chunk(valid)
+
+        if report['created']:
+            offer_list_cache.invalidate()
+            offer_list_cache.adjust_estimated_total(report['created'])
+        return report
+
+    def write_chunk(self, validated_rows):
+        """
+        Insert the offers and details of one chunk in a single transaction.
+
+        Returns:
+            int: Number of created offers
+        """
+        if not validated_rows:
+            return 0
+        offers, details_per_offer = [], []
+        for data in validated_rows:
+            data = dict(data)
+            details = [OfferDetail(**detail_data) for detail_data in data.pop('details')]
+            data.pop('image', None)
+            offers.append(Offer(user=self.user, **data, **summarize_details(details)))
+            details_per_offer.append(details)
+
+        with transaction.atomic():
+            Offer.objects.bulk_create(offers)
+            all_details = []
+            for offer, details in zip(offers, details_per_offer):
+                for detail in details:
+                    detail.offer = offer
+                all_details.extend(details)
+            OfferDetail.objects.bulk_create(all_details)
+            cards.refresh_cards([offer.pk for offer in offers])
+        return len(offers)
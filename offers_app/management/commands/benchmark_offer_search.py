@@ -0,0 +1,89 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from rest_framework import filters
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from offers_app.models import Offer
+from offers_app.search import OfferSearchFilter, search_index_available
+
+SYLLABLES = ['ba', 'ko', 'ri', 'ten', 'mo', 'sul', 'de', 'vin', 'la', 'pra', 'go', 'neu', 'xi', 'tor', 'fa']
+
+
+def build_vocabulary(size):
+    """
+    Return a reproducible vocabulary of pseudo words, so that search terms
+    match a realistic fraction of the offers instead of most of them.
+    """
+    words = set()
+    while len(words) < size:
+        words.add(''.join(random.choices(SYLLABLES, k=random.randint(2, 4))))
+    return sorted(words)
+
+
+class SearchView:
+    search_fields = ['title', 'description']
+
+
+class Command(BaseCommand):
+    """
+    Compare offer search latency of the LIKE based SearchFilter with the FTS5 index.
+
+    Generates the requested number of offers inside a transaction that is rolled
+    back afterwards, so the database is left unchanged.
+
+    Usage:
+        python manage.py benchmark_offer_search --offers 100000 --runs 20
+    """
+    help = "Benchmarks LIKE search against the FTS5 offer search index."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--offers', type=int, default=100000, help="Number of offers to generate.")
+        parser.add_argument('--runs', type=int, default=20, help="Number of searches per backend.")
+        parser.add_argument('--page-size', type=int, default=5, help="Number of results fetched per search.")
+        parser.add_argument('--vocabulary', type=int, default=5000, help="Number of distinct words in offer texts.")
+
+    def handle(self, *args, **options):
+        if not search_index_available(connection.alias):
+            raise CommandError("The FTS5 offer search index is not installed on this database.")
+
+        random.seed(42)
+        self.words = build_vocabulary(options['vocabulary'])
+        with transaction.atomic():
+            self.create_offers(options['offers'])
+            terms = [random.choice(self.words) for _ in range(options['runs'])]
+            for name, backend in [('LIKE', filters.SearchFilter()), ('FTS5', OfferSearchFilter())]:
+                timings = [self.time_search(backend, term, options['page_size']) for term in terms]
+                self.stdout.write(
+                    f"{name}: median {statistics.median(timings):.2f} ms, "
+                    f"max {max(timings):.2f} ms over {len(timings)} searches"
+                )
+            transaction.set_rollback(True)
+
+    def create_offers(self, count, batch_size=5000):
+        """
+        Bulk create offers with random titles and descriptions.
+        """
+        for start in range(0, count, batch_size):
+            Offer.objects.bulk_create([
+                Offer(
+                    title=' '.join(random.sample(self.words, 3)).title(),
+                    description=' '.join(random.choices(self.words, k=12)),
+                )
+                for _ in range(min(batch_size, count - start))
+            ])
+        self.stdout.write(f"Generated {count} offers.")
+
+    def time_search(self, backend, term, page_size):
+        """
+        Return the time in milliseconds to count the matches of a term and fetch the first page.
+        """
+        request = Request(APIRequestFactory().get('/api/offers/', {'search': term}))
+        started = time.perf_counter()
+        queryset = backend.filter_queryset(request, Offer.objects.all(), SearchView())
+        queryset.count()
+        list(queryset[:page_size])
+        return (time.perf_counter() - started) * 1000
@@ -0,0 +1,123 @@
+import random
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from offers_app.api.serializers import OfferListReader, OfferListSerializer
+from offers_app.api.views import get_offer_summary_queryset
+from offers_app.cards import refresh_all_cards
+from offers_app.models import Offer, OfferDetail
+from orders_app.api.serializers import OrderListReader, OrderListSerializer
+from orders_app.models import Order
+from reviews_app.api.serializers import ReviewReader, ReviewSerializer
+from reviews_app.models import Review
+
+
+class Command(BaseCommand):
+    """
+    Compare list rendering throughput of the serializers with the values() readers.
+
+    Generates offers, orders and reviews inside a transaction that is rolled
+    back afterwards and renders the same rows with OfferListSerializer,
+    OrderListSerializer and ReviewSerializer and with their ValuesReader,
+    including the queries. Offers are rendered from their stored cards.
+    Reports rows per second (median of all runs).
+
+    Usage:
+        python manage.py benchmark_read_path --rows 5000 --runs 5
+    """
+    help = "Benchmarks serializer rendering against the values() read path for offers, orders and reviews."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000, help="Number of rows generated per model.")
+        parser.add_argument('--runs', type=int, default=5, help="Number of timed renders per path.")
+
+    def handle(self, *args, **options):
+        random.seed(42)
+        rows = options['rows']
+        context = {'request': Request(APIRequestFactory().get('/api/offers/', HTTP_HOST='localhost'))}
+        with transaction.atomic():
+            self.create_data(rows)
+            benchmarks = [
+                ('offers', get_offer_summary_queryset().order_by('id'), OfferListSerializer, OfferListReader),
+                ('orders', Order.objects.order_by('id'), OrderListSerializer, OrderListReader),
+                ('reviews', Review.objects.order_by('id'), ReviewSerializer, ReviewReader),
+            ]
+            for name, queryset, serializer_class, reader_class in benchmarks:
+                serializer_rate = self.measure(
+                    lambda: serializer_class(queryset.all(), many=True, context=context).data, options['runs']
+                )
+                reader_rate = self.measure(
+                    lambda: self.read(reader_class, queryset.all(), context), options['runs']
+                )
+                self.stdout.write(
+                    f"{name}: serializer {serializer_rate:,.0f} rows/s, values() reader {reader_rate:,.0f} rows/s "
+                    f"({reader_rate / serializer_rate:.1f}x)"
+                )
+            transaction.set_rollback(True)
+
+    def read(self, reader_class, queryset, context):
+        reader = reader_class(context=context)
+        return reader.to_representation(reader.get_rows(queryset))
+
+    def measure(self, render, runs):
+        """
+        Return the median number of rendered rows per second.
+        """
+        rates = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            count = len(render())
+            rates.append(count / (time.perf_counter() - started))
+        return statistics.median(rates)
+
+    def create_data(self, count):
+        """
+        Bulk create business and customer users, offers with three details, orders and reviews.
+        """
+        business_users = User.objects.bulk_create([
+            User(username=f'benchmark-business-{index}', first_name='Business', last_name=str(index))
+            for index in range(20)
+        ])
+        customers = User.objects.bulk_create([
+            User(username=f'benchmark-customer-{index}') for index in range(count // 20 + 1)
+        ])
+        offers = Offer.objects.bulk_create([
+            Offer(
+                user=random.choice(business_users), title=f'Offer {index}', description='Benchmark offer',
+                image=f'offer_images/benchmark{index}.png', min_price=100, max_price=300,
+                min_delivery_time_in_days=3,
+            )
+            for index in range(count)
+        ])
+        OfferDetail.objects.bulk_create([
+            OfferDetail(
+                offer=offer, title=offer_type, revisions=2, delivery_time_in_days=3 + days,
+                price=100 * (days + 1), features=['Feature'], offer_type=offer_type,
+            )
+            for offer in offers
+            for days, offer_type in enumerate(['basic', 'standard', 'premium'])
+        ])
+        Order.objects.bulk_create([
+            Order(
+                customer_user=random.choice(customers), business_user=random.choice(business_users),
+                title=f'Order {index}', revisions=2, delivery_time_in_days=5, price='199.90',
+                features=['Feature'], offer_type='standard',
+                status=random.choice(['in_progress', 'completed', 'cancelled']),
+            )
+            for index in range(count)
+        ])
+        Review.objects.bulk_create([
+            Review(
+                business_user=business_users[index % len(business_users)],
+                reviewer=customers[index // len(business_users)],
+                rating=random.randint(1, 5), description='Benchmark review',
+            )
+            for index in range(count)
+        ])
+        refresh_all_cards()
+        self.stdout.write(f"Generated {count} offers, orders and reviews.")
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from offers_app.images import build_image_variants
+from offers_app.models import Offer
+
+
+class Command(BaseCommand):
+    """
+    Build missing thumbnails and WebP variants for offer images.
+
+    Covers images uploaded before the variants existed, or through paths that
+    do not schedule them (e.g. the admin). Runs synchronously.
+
+    Usage:
+        python manage.py build_offer_image_variants
+        python manage.py build_offer_image_variants --all
+    """
+    help = "Generates thumbnail and WebP variants for offer images that lack them."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help="Rebuild the variants of every offer image, not only missing ones.",
+        )
+
+    def handle(self, *args, **options):
+        offers = Offer.objects.exclude(image='').exclude(image__isnull=True)
+        if not options['all']:
+            offers = offers.filter(Q(image_thumbnail='') | Q(image_thumbnail__isnull=True))
+        built = failed = 0
+        for offer_id in offers.values_list('id', flat=True).iterator():
+            if build_image_variants(offer_id):
+                built += 1
+            else:
+                failed += 1
+                self.stderr.write(f"Offer {offer_id}: could not build image variants.")
+        self.stdout.write(self.style.SUCCESS(f"Built image variants for {built} offers ({failed} failed)."))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from offers_app import cache as offer_list_cache
+from offers_app.cards import refresh_all_cards
+
+
+class Command(BaseCommand):
+    """
+    Re-render the stored list cards of all offers.
+
+    Needed once after the card column is added, after changes to
+    OfferListSerializer, and after writes that bypass the model signals
+    (e.g. queryset.update() or raw SQL).
+
+    Usage:
+        python manage.py rebuild_offer_cards
+        python manage.py rebuild_offer_cards --chunk-size 1000
+    """
+    help = "Rebuilds the precomputed list card of every offer."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500, help="Number of offers rendered per query.")
+
+    def handle(self, *args, **options):
+        refreshed = refresh_all_cards(chunk_size=options['chunk_size'])
+        offer_list_cache.invalidate()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt the card of {refreshed} offers."))
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from offers_app.search import install_search_index, supports_search_index
+
+
+class Command(BaseCommand):
+    """
+    Recreate the SQLite FTS5 offer search index and its sync triggers.
+
+    Needed after a migration rebuilt the offers_app_offer table, which drops its triggers.
+
+    Usage:
+        python manage.py rebuild_offer_search_index
+    """
+    help = "Recreates the FTS5 offer search table and triggers and reindexes all offers."
+
+    def handle(self, *args, **options):
+        if not supports_search_index(connection):
+            raise CommandError("The offer search index requires SQLite with FTS5 support.")
+        install_search_index(connection)
+        self.stdout.write(self.style.SUCCESS("Rebuilt the offer search index."))
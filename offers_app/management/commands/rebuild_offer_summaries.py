@@ -0,0 +1,80 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Max, Min, OuterRef, Subquery
+from offers_app.models import Offer, OfferDetail
+from offers_app import cache as offer_list_cache
+from offers_app.cards import refresh_all_cards
+
+
+class Command(BaseCommand):
+    """
+    Rebuild or check the denormalized price and delivery summary of offers.
+
+    Usage:
+        python manage.py rebuild_offer_summaries
+        python manage.py rebuild_offer_summaries --check
+    """
+    help = "Rebuilds the min_price, max_price and min_delivery_time_in_days columns of all offers."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help="Only report offers whose summary columns are out of sync, without changing them.",
+        )
+
+    def handle(self, *args, **options):
+        if options['check']:
+            self.check_summaries()
+        else:
+            self.rebuild_summaries()
+
+    def rebuild_summaries(self):
+        """
+        Recalculate the summary columns of every offer in a single UPDATE statement
+        and re-render the list cards showing them.
+        """
+        updated = Offer.objects.update(
+            min_price=self.detail_aggregate(Min('price')),
+            max_price=self.detail_aggregate(Max('price')),
+            min_delivery_time_in_days=self.detail_aggregate(Min('delivery_time_in_days')),
+        )
+        refresh_all_cards()
+        offer_list_cache.invalidate()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt price summary of {updated} offers."))
+
+    def check_summaries(self):
+        """
+        Compare the stored summary columns with the values computed from the details.
+
+        Raises:
+            CommandError: If at least one offer is out of sync
+        """
+        offers = Offer.objects.annotate(
+            expected_min_price=Min('details__price'),
+            expected_max_price=Max('details__price'),
+            expected_min_delivery_time=Min('details__delivery_time_in_days'),
+        ).values_list(
+            'id', 'min_price', 'max_price', 'min_delivery_time_in_days',
+            'expected_min_price', 'expected_max_price', 'expected_min_delivery_time',
+        )
+        out_of_sync = [
+            offer_id
+            for offer_id, *stored_and_expected in offers
+            if stored_and_expected[:3] != stored_and_expected[3:]
+        ]
+        if out_of_sync:
+            raise CommandError(
+                f"{len(out_of_sync)} offers have an out of sync price summary: {out_of_sync}"
+            )
+        self.stdout.write(self.style.SUCCESS("All offer price summaries are in sync."))
+
+    def detail_aggregate(self, aggregate):
+        """
+        Return a correlated subquery computing the given aggregate over an offer's details.
+        """
+        return Subquery(
+            OfferDetail.objects.filter(offer=OuterRef('pk'))
+            .values('offer')
+            .annotate(value=aggregate)
+            .values('value')
+        )
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.5 on 2026-10-17 04:12
+
+from django.db import migrations, models
+from django.db.models import Max, Min, OuterRef, Subquery
+
+
+def populate_price_summary(apps, schema_editor):
+    Offer = apps.get_model('offers_app', 'Offer')
+    OfferDetail = apps.get_model('offers_app', 'OfferDetail')
+
+    def detail_aggregate(aggregate):
+        return Subquery(
+            OfferDetail.objects.filter(offer=OuterRef('pk'))
+            .values('offer')
+            .annotate(value=aggregate)
+            .values('value')
+        )
+
+    Offer.objects.update(
+        min_price=detail_aggregate(Min('price')),
+        max_price=detail_aggregate(Max('price')),
+        min_delivery_time_in_days=detail_aggregate(Min('delivery_time_in_days')),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0005_alter_offer_title_alter_offerdetail_title'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='max_price',
+            field=models.DecimalField(blank=True, db_index=True, decimal_places=2, max_digits=10, null=True),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='min_delivery_time_in_days',
+            field=models.IntegerField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='min_price',
+            field=models.DecimalField(blank=True, db_index=True, decimal_places=2, max_digits=10, null=True),
+        ),
+        migrations.RunPython(populate_price_summary, migrations.RunPython.noop),
+    ]
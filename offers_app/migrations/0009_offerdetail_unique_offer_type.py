@@ -0,0 +1,52 @@
+# Generated by Django 5.2.5 on 2026-10-17 04:26
+
+from django.db import migrations, models
+from django.db.models import Max, Min, OuterRef, Subquery
+
+
+def remove_duplicate_offer_types(apps, schema_editor):
+    """
+    Keep only the first detail per (offer, offer_type), which is the one
+    offer updates have been writing to so far.
+    """
+    Offer = apps.get_model('offers_app', 'Offer')
+    OfferDetail = apps.get_model('offers_app', 'OfferDetail')
+    keep_ids = (
+        OfferDetail.objects.values('offer', 'offer_type')
+        .annotate(keep_id=Min('id'))
+        .values('keep_id')
+    )
+    duplicates = OfferDetail.objects.exclude(id__in=keep_ids)
+    affected_offer_ids = list(duplicates.values_list('offer_id', flat=True).distinct())
+    if not affected_offer_ids:
+        return
+    duplicates.delete()
+
+    def detail_aggregate(aggregate):
+        return Subquery(
+            OfferDetail.objects.filter(offer=OuterRef('pk'))
+            .values('offer')
+            .annotate(value=aggregate)
+            .values('value')
+        )
+
+    Offer.objects.filter(id__in=affected_offer_ids).update(
+        min_price=detail_aggregate(Min('price')),
+        max_price=detail_aggregate(Max('price')),
+        min_delivery_time_in_days=detail_aggregate(Min('delivery_time_in_days')),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0008_offer_search_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_offer_types, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='offerdetail',
+            constraint=models.UniqueConstraint(fields=('offer', 'offer_type'), name='unique_offer_detail_type'),
+        ),
+    ]
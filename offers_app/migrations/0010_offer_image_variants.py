@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-17 04:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0009_offerdetail_unique_offer_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='image_thumbnail',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to='offer_images/thumbnails/'),
+        ),
+        migrations.AddField(
+            model_name='offer',
+            name='image_webp',
+            field=models.ImageField(blank=True, editable=False, null=True, upload_to='offer_images/webp/'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-17 04:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers_app', '0011_offer_user_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='offer',
+            name='card',
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+    ]
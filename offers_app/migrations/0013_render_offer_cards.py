@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-17 09:30
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    """
+    Cards are rendered by OfferListSerializer, which changes with the code, so
+    they are not built here. Offers without a card are rendered live until
+    `python manage.py rebuild_offer_cards` is run after deploying.
+    """
+
+    dependencies = [
+        ('offers_app', '0012_offer_card'),
+    ]
+
+    operations = []
@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Max, Min
 from django.contrib.auth.models import User
 from django.contrib import admin
 
@@ -6,9 +7,62 @@ class Offer(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='offers', null=True, blank=True)
     title = models.CharField(max_length=255, default='', blank=True)
     image = models.ImageField(upload_to='offer_images/', null=True, blank=True)
+    image_thumbnail = models.ImageField(upload_to='offer_images/thumbnails/', null=True, blank=True, editable=False)
+    image_webp = models.ImageField(upload_to='offer_images/webp/', null=True, blank=True, editable=False)
     description = models.TextField(max_length=255, default='', blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    min_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, db_index=True)
+    max_price = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, db_index=True)
+    min_delivery_time_in_days = models.IntegerField(null=True, blank=True, db_index=True)
+    card = models.JSONField(null=True, blank=True, editable=False)
+
+    SUMMARY_FIELDS = ['min_price', 'max_price', 'min_delivery_time_in_days']
+    IMAGE_VARIANT_FIELDS = ['image_thumbnail', 'image_webp']
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['updated_at', 'id'], name='offer_updated_at_id_idx'),
+            models.Index(fields=['created_at', 'id'], name='offer_created_at_id_idx'),
+            models.Index(fields=['user', 'updated_at'], name='offer_user_updated_at_idx'),
+        ]
+
+    def update_summary(self, details=None, save=True):
+        """
+        Recalculate the denormalized price and delivery summary from the details.
+        Must be called whenever details of this offer are created, updated or deleted.
+        Also touches updated_at, which validates cached copies of the offer and its details.
+
+        Args:
+            details: Complete list of the offer's details if already in memory,
+                otherwise the summary is aggregated in the database
+            save: Whether to write the summary fields immediately
+        """
+        if details is None:
+            summary = self.details.aggregate(
+                min_price=Min('price'),
+                max_price=Max('price'),
+                min_delivery_time_in_days=Min('delivery_time_in_days'),
+            )
+        else:
+            summary = summarize_details(details)
+        for field, value in summary.items():
+            setattr(self, field, value)
+        if save:
+            self.save(update_fields=self.SUMMARY_FIELDS + ['updated_at'])
+
+
+def summarize_details(details):
+    """
+    Return the price and delivery summary of in-memory OfferDetail objects.
+    """
+    prices = [detail.price for detail in details]
+    delivery_times = [detail.delivery_time_in_days for detail in details]
+    return {
+        'min_price': min(prices, default=None),
+        'max_price': max(prices, default=None),
+        'min_delivery_time_in_days': min(delivery_times, default=None),
+    }
 
 class OfferDetail(models.Model):
     offer = models.ForeignKey(Offer, related_name='details', on_delete=models.CASCADE)
@@ -19,5 +73,44 @@ class OfferDetail(models.Model):
     features = models.JSONField(default=list, blank=True) 
     offer_type = models.CharField(max_length=20)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['offer', 'offer_type'], name='unique_offer_detail_type'),
+        ]
+
+class SearchDocumentField(models.TextField):
+    """
+    Hidden FTS5 column named like its table, used as the left side of MATCH.
+    """
+
+
+@SearchDocumentField.register_lookup
+class FullTextMatch(models.Lookup):
+    lookup_name = 'match'
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f'{lhs} MATCH {rhs}', lhs_params + rhs_params
+
+
+class OfferSearchIndex(models.Model):
+    """
+    Read-only view of the SQLite FTS5 table indexing offer titles and descriptions.
+    The table and its sync triggers are created by offers_app.search, not by Django.
+    """
+    offer = models.OneToOneField(
+        Offer, primary_key=True, db_column='rowid', related_name='search_index',
+        on_delete=models.DO_NOTHING, db_constraint=False
+    )
+    title = models.TextField()
+    description = models.TextField()
+    document = SearchDocumentField(db_column='offers_app_offer_fts')
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = 'offers_app_offer_fts'
+
 admin.site.register(Offer)
 admin.site.register(OfferDetail)
\ No newline at end of file
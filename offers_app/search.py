@@ -0,0 +1,124 @@
+import re
+
+from django.db import connections
+from rest_framework import filters
+
+
+SEARCH_TABLE = 'offers_app_offer_fts'
+
+# External content FTS5 table over offers_app_offer, kept in sync by triggers
+# so that bulk writes which bypass model signals are indexed as well.
+CREATE_SEARCH_INDEX_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        title, description,
+        content='offers_app_offer', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ai AFTER INSERT ON offers_app_offer BEGIN
+        INSERT INTO {SEARCH_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_ad AFTER DELETE ON offers_app_offer BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEARCH_TABLE}_au AFTER UPDATE OF title, description ON offers_app_offer BEGIN
+        INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {SEARCH_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"INSERT INTO {SEARCH_TABLE}({SEARCH_TABLE}) VALUES ('rebuild')",
+]
+
+DROP_SEARCH_INDEX_SQL = [
+    f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {SEARCH_TABLE}_au",
+    f"DROP TABLE IF EXISTS {SEARCH_TABLE}",
+]
+
+_search_index_available = {}
+
+
+def supports_search_index(connection):
+    """
+    Return True if the connection is SQLite with the FTS5 extension compiled in.
+    """
+    if connection.vendor != 'sqlite':
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT sqlite_compileoption_used('ENABLE_FTS5')")
+        return bool(cursor.fetchone()[0])
+
+
+def install_search_index(connection):
+    """
+    Create the FTS5 table and its sync triggers if missing and rebuild its content.
+    Safe to call repeatedly, e.g. after a migration recreated offers_app_offer.
+    """
+    with connection.cursor() as cursor:
+        for statement in CREATE_SEARCH_INDEX_SQL:
+            cursor.execute(statement)
+    _search_index_available.clear()
+
+
+def uninstall_search_index(connection):
+    with connection.cursor() as cursor:
+        for statement in DROP_SEARCH_INDEX_SQL:
+            cursor.execute(statement)
+    _search_index_available.clear()
+
+
+def search_index_available(using='default'):
+    """
+    Return True if the FTS5 offer search table exists on the given database.
+    The result is cached per database so the check does not cost a query per request.
+    """
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return False
+    key = (using, str(connection.settings_dict['NAME']))
+    if key not in _search_index_available:
+        _search_index_available[key] = SEARCH_TABLE in connection.introspection.table_names()
+    return _search_index_available[key]
+
+
+def build_match_query(search_terms):
+    """
+    Turn search terms into an FTS5 query matching every word as a prefix.
+
+    Example: ['web des'] -> '"web"* "des"*'
+    Returns: Query string or None if the terms contain no words
+    """
+    words = [word for term in search_terms for word in re.findall(r'\w+', term)]
+    if not words:
+        return None
+    return ' '.join('"{}"*'.format(word.replace('"', '""')) for word in words)
+
+
+class OfferSearchFilter(filters.SearchFilter):
+    """
+    Search filter backed by the SQLite FTS5 offer index.
+
+    Matches every search word as a prefix of a word in title or description
+    and orders the results by bm25 relevance unless an explicit ordering is
+    applied afterwards. Falls back to the default LIKE based SearchFilter on
+    other database backends or when the index has not been installed.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        match_query = build_match_query(self.get_search_terms(request))
+        if match_query is None or not search_index_available(queryset.db):
+            return super().filter_queryset(request, queryset, view)
+        return queryset.filter(
+            search_index__document__match=match_query
+        ).order_by('search_index__rank')
@@ -0,0 +1,111 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .models import Offer, OfferDetail
+from . import cache as offer_list_cache
+from . import cards
+from .detail_cache import offer_detail_cache
+
+USER_DETAIL_FIELDS = {'first_name', 'last_name', 'username'}
+
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+def invalidate_offer_list_cache(sender, **kwargs):
+    """
+    Invalidate cached offer list responses whenever an offer or offer detail changes.
+    """
+    offer_list_cache.invalidate()
+
+
+@receiver(post_save, sender=Offer)
+def count_created_offer(sender, created, **kwargs):
+    """
+    Keep the estimated offer total in step with created offers.
+    """
+    if created:
+        offer_list_cache.adjust_estimated_total(1)
+
+
+@receiver(post_delete, sender=Offer)
+def count_deleted_offer(sender, **kwargs):
+    """
+    Keep the estimated offer total in step with deleted offers.
+    """
+    offer_list_cache.adjust_estimated_total(-1)
+
+
+@receiver(post_save, sender=User)
+def invalidate_offer_list_cache_on_user_change(sender, update_fields=None, **kwargs):
+    """
+    Invalidate cached offer list responses when a user's name changes,
+    because the list embeds the owner's user_details.
+    """
+    if update_fields is None or USER_DETAIL_FIELDS.intersection(update_fields):
+        offer_list_cache.invalidate()
+
+
+@receiver(post_save, sender=Offer)
+def refresh_offer_card(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    Re-render the stored list card after an offer is saved.
+    """
+    if raw or (update_fields is not None and set(update_fields) <= {'card'}):
+        return
+    cards.request_refresh([instance.pk])
+
+
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+def update_offer_on_detail_change(sender, instance, raw=False, origin=None, **kwargs):
+    """
+    Recalculate the offer's price and delivery summary and touch its
+    updated_at when one of its details is saved or deleted. Deletes that
+    cascade from another object (an offer, or a user owning offers) are
+    skipped, since the offer is going away as well.
+
+    The summary columns back the list filters, ordering and card, and
+    conditional requests for offers and offer details are validated by
+    updated_at. Saving the offer also re-renders its card, once at the end
+    of the batch, and drops its cached details (see refresh_offer_card and
+    invalidate_offer_detail_cache_on_offer_change).
+    """
+    if raw:
+        return
+    if origin is not None and not isinstance(origin, OfferDetail) and getattr(origin, 'model', None) is not OfferDetail:
+        return
+    with cards.batch():
+        instance.offer.update_summary()
+
+
+@receiver(post_save, sender=User)
+def refresh_offer_cards_on_user_change(sender, instance, created=False, raw=False, update_fields=None, **kwargs):
+    """
+    Re-render the cards of a user's offers when the user's name changes,
+    because every card embeds the owner's user_details.
+    """
+    if created or raw:
+        return
+    if update_fields is None or USER_DETAIL_FIELDS.intersection(update_fields):
+        cards.request_refresh(Offer.objects.filter(user=instance).values_list('pk', flat=True))
+
+
+@receiver(post_save, sender=OfferDetail)
+@receiver(post_delete, sender=OfferDetail)
+def invalidate_offer_detail_cache(sender, instance, **kwargs):
+    """
+    Drop a changed or deleted offer detail from the in-process detail cache.
+    """
+    offer_detail_cache.invalidate_on_commit(detail_ids=[instance.pk])
+
+
+@receiver(post_save, sender=Offer)
+@receiver(post_delete, sender=Offer)
+def invalidate_offer_detail_cache_on_offer_change(sender, instance, **kwargs):
+    """
+    Drop all cached details of a changed or deleted offer. Detail updates
+    written with bulk_update send no signals but always save their offer.
+    """
+    offer_detail_cache.invalidate_on_commit(offer_ids=[instance.pk])
@@ -3,9 +3,53 @@ from rest_framework import status
 from django.urls import reverse
 from django.contrib.auth.models import User
 from user_profile.models import Profile
+import base64
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from io import BytesIO, StringIO
+from urllib.parse import parse_qs, urlparse
+from PIL import Image
+from django.core.files.uploadedfile import SimpleUploadedFile
+from unittest import mock
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import IntegrityError, connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from offers_app import cache as offer_list_cache
+from offers_app.detail_cache import offer_detail_cache
+from offers_app.api.serializers import upsert_offer_details
+from offers_app.filters import OfferFilter
+from offers_app.images import THUMBNAIL_SIZE, build_image_variants
 from offers_app.models import Offer, OfferDetail
 
-class OfferTests(APITestCase):
+
+class UserFixtureMixin:
+    """
+    Creates the users and profiles most test cases in this module start from.
+    """
+
+    def create_user(self, username, profile_type, **user_fields):
+        """
+        Create a user whose email is its username, together with a profile of the given type.
+        """
+        user = User.objects.create_user(username=username, email=username, password='testpassword', **user_fields)
+        Profile.objects.create(user=user, type=profile_type)
+        return user
+
+    def create_business_and_customer(self):
+        """
+        Create a business user and a customer user.
+        """
+        self.business_user = self.create_user('business@test.com', 'business')
+        self.customer_user = self.create_user('customer@test.com', 'customer')
+
+
+class OfferTests(UserFixtureMixin, APITestCase):
     """
     Test suite for Offer API endpoints.
     
@@ -18,22 +62,13 @@ class OfferTests(APITestCase):
         Set up test data including users, profiles, offers and offer details.
         Creates customer and business users with authentication tokens.
         """
-        self.customer_user = User.objects.create_user(
-            username='customer@test.com', email='customer@test.com', password='testpassword'
-        )
-        Profile.objects.create(user=self.customer_user, type='customer')
+        self.customer_user = self.create_user('customer@test.com', 'customer')
         self.customer_token = self.get_auth_token(self.customer_user, 'testpassword')
 
-        self.business_user = User.objects.create_user(
-            username='business@test.com', email='business@test.com', password='testpassword'
-        )
-        Profile.objects.create(user=self.business_user, type='business')
+        self.business_user = self.create_user('business@test.com', 'business')
         self.business_token = self.get_auth_token(self.business_user, 'testpassword')
 
-        self.other_business_user = User.objects.create_user(
-            username='otherbusiness@test.com', email='otherbusiness@test.com', password='testpassword'
-        )
-        Profile.objects.create(user=self.other_business_user, type='business')
+        self.other_business_user = self.create_user('otherbusiness@test.com', 'business')
         self.other_business_token = self.get_auth_token(self.other_business_user, 'testpassword')
 
         self.offer = Offer.objects.create(
@@ -260,4 +295,1413 @@ class OfferTests(APITestCase):
         url = reverse('offerdetail-detail', kwargs={'pk': self.offer_detail_1.id})
         self.client.credentials()
         response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+class OfferQueryCountTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite locking in the number of queries used by the offer list
+    and retrieve endpoints, independent of the number of offers returned.
+    """
+
+    def setUp(self):
+        """
+        Set up a business user and a customer user without offers.
+        """
+        self.create_business_and_customer()
+
+    def create_offers(self, count):
+        """
+        Create the given number of offers with basic, standard and premium details.
+        """
+        offers = []
+        for index in range(count):
+            offer = Offer.objects.create(
+                user=self.business_user, title=f'Offer {index}', description='Description'
+            )
+            for days, (offer_type, price) in enumerate(
+                [('basic', 100), ('standard', 200), ('premium', 300)], start=1
+            ):
+                OfferDetail.objects.create(
+                    offer=offer, title=offer_type, revisions=1, delivery_time_in_days=days,
+                    price=price + index, features=[], offer_type=offer_type
+                )
+            offer.update_summary()
+            offers.append(offer)
+        return offers
+
+    def test_offer_list_query_count_is_constant(self):
+        """
+        Ensures that listing offers costs the same number of queries for 1 and 20 offers.
+        """
+        self.create_offers(1)
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('offer-list'), {'page_size': 100})
+        self.assertEqual(len(response.data['results']), 1)
+
+        self.create_offers(19)
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('offer-list'), {'page_size': 100})
+        self.assertEqual(len(response.data['results']), 20)
+
+    def test_offer_list_returns_min_values_and_user_details(self):
+        """
+        Ensures that annotated min values and user details are serialized correctly.
+        """
+        offer = self.create_offers(1)[0]
+        response = self.client.get(reverse('offer-list'))
+        result = response.data['results'][0]
+        self.assertEqual(result['id'], offer.id)
+        self.assertEqual(result['min_price'], 100)
+        self.assertEqual(result['min_delivery_time'], 1)
+        self.assertEqual(len(result['details']), 3)
+        self.assertEqual(result['user_details']['username'], self.business_user.username)
+
+    def test_offer_retrieve_query_count(self):
+        """
+        Ensures that retrieving a single offer uses a fixed number of queries.
+        """
+        offer = self.create_offers(1)[0]
+        self.client.force_authenticate(user=self.customer_user)
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('offer-detail', kwargs={'pk': offer.id}))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['min_price'], 100)
+        self.assertEqual(response.data['min_delivery_time'], 1)
+
+
+class OfferPriceSummaryTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for the denormalized price and delivery summary columns on Offer.
+    """
+
+    def setUp(self):
+        """
+        Set up an authenticated business user.
+        """
+        self.business_user = self.create_user('business@test.com', 'business')
+        self.client.force_authenticate(user=self.business_user)
+
+    def create_offer(self, title, prices, delivery_times):
+        """
+        Create an offer through the API with the given detail prices and delivery times.
+        """
+        data = {
+            'title': title,
+            'description': 'Description',
+            'details': [
+                {'title': offer_type, 'revisions': 1, 'delivery_time_in_days': days,
+                 'price': price, 'features': [], 'offer_type': offer_type}
+                for offer_type, price, days in zip(['basic', 'standard', 'premium'], prices, delivery_times)
+            ]
+        }
+        response = self.client.post(reverse('offer-list'), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        return Offer.objects.get(id=response.data['id'])
+
+    def test_create_offer_populates_summary(self):
+        """
+        Ensures that creating an offer fills the summary columns from its details.
+        """
+        offer = self.create_offer('Logo', [200, 100, 300], [5, 3, 7])
+        self.assertEqual(offer.min_price, 100)
+        self.assertEqual(offer.max_price, 300)
+        self.assertEqual(offer.min_delivery_time_in_days, 3)
+
+    def test_update_offer_details_refreshes_summary(self):
+        """
+        Ensures that updating details through PATCH refreshes the summary columns.
+        """
+        offer = self.create_offer('Logo', [100, 200, 300], [3, 5, 7])
+        data = {'details': [{'offer_type': 'basic', 'price': 50, 'delivery_time_in_days': 1},
+                            {'offer_type': 'premium', 'price': 500}]}
+        response = self.client.patch(reverse('offer-detail', kwargs={'pk': offer.id}), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        offer.refresh_from_db()
+        self.assertEqual(offer.min_price, 50)
+        self.assertEqual(offer.max_price, 500)
+        self.assertEqual(offer.min_delivery_time_in_days, 1)
+
+    def test_list_can_be_ordered_and_filtered_by_price(self):
+        """
+        Ensures that the offer list can be ordered by min_price and filtered by the summary columns.
+        """
+        cheap = self.create_offer('Cheap', [10, 20, 30], [10, 12, 14])
+        expensive = self.create_offer('Expensive', [100, 200, 300], [2, 4, 6])
+
+        response = self.client.get(reverse('offer-list'), {'ordering': 'min_price'})
+        self.assertEqual([offer['id'] for offer in response.data['results']], [cheap.id, expensive.id])
+
+        response = self.client.get(reverse('offer-list'), {'ordering': '-min_price'})
+        self.assertEqual([offer['id'] for offer in response.data['results']], [expensive.id, cheap.id])
+
+        response = self.client.get(reverse('offer-list'), {'min_price': 250})
+        self.assertEqual([offer['id'] for offer in response.data['results']], [expensive.id])
+
+        response = self.client.get(reverse('offer-list'), {'max_delivery_time': 11})
+        self.assertEqual(
+            sorted(offer['id'] for offer in response.data['results']), [cheap.id, expensive.id]
+        )
+
+        response = self.client.get(reverse('offer-list'), {'max_delivery_time': 5})
+        self.assertEqual([offer['id'] for offer in response.data['results']], [expensive.id])
+
+    def test_rebuild_offer_summaries_command(self):
+        """
+        Ensures that the management command detects and repairs out of sync summaries.
+        """
+        offer = self.create_offer('Logo', [100, 200, 300], [3, 5, 7])
+        call_command('rebuild_offer_summaries', '--check', stdout=StringIO())
+
+        Offer.objects.filter(id=offer.id).update(min_price=None, max_price=1, min_delivery_time_in_days=None)
+        with self.assertRaises(CommandError):
+            call_command('rebuild_offer_summaries', '--check', stdout=StringIO())
+
+        call_command('rebuild_offer_summaries', stdout=StringIO())
+        offer.refresh_from_db()
+        self.assertEqual(offer.min_price, 100)
+        self.assertEqual(offer.max_price, 300)
+        self.assertEqual(offer.min_delivery_time_in_days, 3)
+        call_command('rebuild_offer_summaries', '--check', stdout=StringIO())
+
+
+class OfferKeysetPaginationTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for the opt-in keyset pagination of the offer list.
+    """
+
+    def setUp(self):
+        """
+        Create 12 offers, half of them sharing the same updated_at timestamp
+        to exercise the id tie-breaker.
+        """
+        self.business_user = self.create_user('business@test.com', 'business')
+        self.offers = [
+            Offer.objects.create(user=self.business_user, title=f'Offer {index}')
+            for index in range(12)
+        ]
+        shared_timestamp = self.offers[3].updated_at
+        Offer.objects.filter(id__in=[offer.id for offer in self.offers[3:9]]).update(updated_at=shared_timestamp)
+        self.expected_ids = list(
+            Offer.objects.order_by('-updated_at', '-id').values_list('id', flat=True)
+        )
+
+    def collect_pages(self, params, link='next'):
+        """
+        Follow the given link until the end and return the ids of all pages.
+        """
+        response = self.client.get(reverse('offer-list'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        pages = [[offer['id'] for offer in response.data['results']]]
+        while response.data[link]:
+            response = self.client.get(response.data[link])
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append([offer['id'] for offer in response.data['results']])
+        return pages, response
+
+    def test_page_number_pagination_remains_default(self):
+        """
+        Ensures that clients without the opt-in still receive count and page links.
+        """
+        response = self.client.get(reverse('offer-list'))
+        self.assertEqual(response.data['count'], 12)
+        self.assertEqual(len(response.data['results']), 5)
+
+    def test_cursor_pages_cover_all_offers_in_order(self):
+        """
+        Ensures that following the next links returns every offer exactly once in keyset order.
+        """
+        pages, _ = self.collect_pages({'pagination': 'cursor', 'page_size': 5})
+        self.assertEqual([len(page) for page in pages], [5, 5, 2])
+        self.assertEqual(sum(pages, []), self.expected_ids)
+
+    def test_cursor_previous_links_walk_back(self):
+        """
+        Ensures that the previous links return the same pages in reverse.
+        """
+        forward_pages, last_response = self.collect_pages({'pagination': 'cursor', 'page_size': 5})
+        self.assertIsNone(last_response.data['next'])
+        self.assertIsNotNone(last_response.data['previous'])
+        backward_pages = []
+        response = last_response
+        while response.data['previous']:
+            response = self.client.get(response.data['previous'])
+            backward_pages.append([offer['id'] for offer in response.data['results']])
+        self.assertEqual(backward_pages, forward_pages[-2::-1])
+
+    def test_cursor_ascending_created_at(self):
+        """
+        Ensures that ascending created_at ordering is supported.
+        """
+        pages, _ = self.collect_pages({'pagination': 'cursor', 'ordering': 'created_at', 'page_size': 4})
+        self.assertEqual(
+            sum(pages, []), list(Offer.objects.order_by('created_at', 'id').values_list('id', flat=True))
+        )
+
+    def test_deep_cursor_page_query_count(self):
+        """
+        Ensures that a deep cursor page costs no more queries than the first page and runs no COUNT.
+        """
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('offer-list'), {'pagination': 'cursor', 'page_size': 2})
+        while response.data['next']:
+            next_link = response.data['next']
+            with self.assertNumQueries(1):
+                response = self.client.get(next_link)
+        self.assertNotIn('count', response.data)
+
+    def test_cursor_rejects_unsupported_ordering(self):
+        """
+        Ensures that orderings which cannot be used as a keyset are rejected.
+        """
+        response = self.client.get(reverse('offer-list'), {'pagination': 'cursor', 'ordering': 'title'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_cursor_returns_not_found(self):
+        """
+        Ensures that a malformed cursor returns 404.
+        """
+        response = self.client.get(reverse('offer-list'), {'pagination': 'cursor', 'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_cursor_with_invalid_values_returns_not_found(self):
+        """
+        Ensures that well-formed cursors carrying values of the wrong type or format return 404.
+        """
+        for data in [{'v': {}, 'id': 1}, {'v': [], 'id': 1}, {'v': True, 'id': 1},
+                     {'v': '2024-01-01T00:00:00Z', 'id': {}}, {'v': 'yesterday', 'id': 1}, ['v', 'id']]:
+            cursor = base64.urlsafe_b64encode(json.dumps(data).encode('utf-8')).decode('ascii')
+            response = self.client.get(reverse('offer-list'), {'pagination': 'cursor', 'cursor': cursor})
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, data)
+
+
+class OfferSearchTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for the FTS5 backed offer search and its LIKE fallback.
+    """
+
+    def setUp(self):
+        """
+        Create offers with distinct titles and descriptions.
+        """
+        self.business_user = self.create_user('business@test.com', 'business')
+        self.website = Offer.objects.create(
+            user=self.business_user, title='Website Design', description='Responsive website for your business'
+        )
+        self.logo = Offer.objects.create(
+            user=self.business_user, title='Logo Design', description='Logo and website header graphics'
+        )
+        self.video = Offer.objects.create(
+            user=self.business_user, title='Video Editing', description='Editing of marketing videos'
+        )
+
+    def search(self, term, **params):
+        response = self.client.get(reverse('offer-list'), {'search': term, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [offer['id'] for offer in response.data['results']]
+
+    def test_search_matches_word_prefixes(self):
+        """
+        Ensures that search words match as prefixes in title and description.
+        """
+        self.assertEqual(self.search('vid'), [self.video.id])
+        self.assertEqual(sorted(self.search('desi')), sorted([self.website.id, self.logo.id]))
+        self.assertEqual(self.search('logo web'), [self.logo.id])
+
+    def test_search_orders_by_relevance(self):
+        """
+        Ensures that results are ranked by bm25 unless an explicit ordering is requested.
+        """
+        self.assertEqual(self.search('website'), [self.website.id, self.logo.id])
+        self.assertEqual(self.search('website', ordering='-created_at'), [self.logo.id, self.website.id])
+
+    def test_search_index_follows_updates_and_deletes(self):
+        """
+        Ensures that the triggers keep the index in sync with offer writes.
+        """
+        self.video.title = 'Podcast Production'
+        self.video.save()
+        self.assertEqual(self.search('podcast'), [self.video.id])
+        self.assertEqual(self.search('video'), [self.video.id])
+        self.video.description = 'Audio only'
+        self.video.save()
+        self.assertEqual(self.search('video'), [])
+
+        self.logo.delete()
+        self.assertEqual(self.search('logo'), [])
+
+    def test_search_falls_back_to_like_without_index(self):
+        """
+        Ensures that the default SearchFilter is used when the FTS5 index is unavailable.
+        """
+        with mock.patch('offers_app.search.search_index_available', return_value=False):
+            self.assertEqual(self.search('ebsit'), [self.website.id, self.logo.id])
+        offer_list_cache.invalidate()
+        self.assertEqual(self.search('ebsit'), [])
+
+
+class OfferFilterQueryPlanTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite verifying that offer filters never join and deduplicate details.
+    """
+
+    def setUp(self):
+        """
+        Create two offers with three details each.
+        """
+        self.business_user = self.create_user('business@test.com', 'business')
+        self.offers = []
+        for title, revisions, price in [('Small', 1, 50), ('Large', 10, 500)]:
+            offer = Offer.objects.create(user=self.business_user, title=title)
+            for days, offer_type in enumerate(['basic', 'standard', 'premium'], start=1):
+                OfferDetail.objects.create(
+                    offer=offer, title=offer_type, revisions=revisions * days, delivery_time_in_days=days,
+                    price=price * days, features=[], offer_type=offer_type
+                )
+            offer.update_summary()
+            self.offers.append(offer)
+
+    def filter_offers(self, **params):
+        return OfferFilter(params, queryset=Offer.objects.all()).qs
+
+    def test_filters_return_each_offer_once(self):
+        """
+        Ensures that filtered offers are not multiplied by their details.
+        """
+        small, large = self.offers
+        self.assertEqual(list(self.filter_offers(min_price=100).order_by('id')), [small, large])
+        self.assertEqual(list(self.filter_offers(min_price=200)), [large])
+        self.assertEqual(list(self.filter_offers(max_delivery_time=3).order_by('id')), [small, large])
+        self.assertEqual(self.filter_offers(min_price=100, max_delivery_time=1).count(), 2)
+
+    def test_summary_filters_use_single_table_index_lookup(self):
+        """
+        Ensures that price and delivery filters neither touch details nor deduplicate rows.
+        """
+        for params in [{'min_price': 100}, {'max_delivery_time': 3}]:
+            plan = self.filter_offers(**params).explain()
+            self.assertNotIn('offers_app_offerdetail', plan)
+            self.assertNotIn('DISTINCT', plan)
+            self.assertIn('USING INDEX', plan)
+
+
+class OfferListCacheTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for the offer list response cache and its invalidation.
+    """
+
+    def setUp(self):
+        """
+        Create an offer with one detail and clear the cache.
+        """
+        offer_list_cache.get_cache().clear()
+        self.business_user = self.create_user('business@test.com', 'business')
+        self.offer = Offer.objects.create(user=self.business_user, title='Website')
+        self.detail = OfferDetail.objects.create(
+            offer=self.offer, title='Basic', revisions=1, delivery_time_in_days=3,
+            price=100, features=[], offer_type='basic'
+        )
+
+    def get_list(self, query=''):
+        return self.client.get(f"{reverse('offer-list')}{query}")
+
+    def test_second_request_is_served_from_cache(self):
+        """
+        Ensures that repeating a request is a cache hit without database queries.
+        """
+        response = self.get_list('?ordering=title&page_size=10')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        with self.assertNumQueries(0):
+            cached = self.get_list('?page_size=10&ordering=title')
+        self.assertEqual(cached['X-Cache'], 'HIT')
+        self.assertEqual(cached.content, response.content)
+
+        self.assertEqual(self.get_list('?ordering=-title&page_size=10')['X-Cache'], 'MISS')
+
+    def test_offer_and_detail_writes_invalidate_cache(self):
+        """
+        Ensures that creating, updating and deleting offers or details invalidates cached pages.
+        """
+        self.get_list()
+        self.offer.title = 'Website Updated'
+        self.offer.save()
+        response = self.get_list()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['results'][0]['title'], 'Website Updated')
+
+        self.detail.delete()
+        response = self.get_list()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['results'][0]['details'], [])
+
+        Offer.objects.create(user=self.business_user, title='Logo')
+        response = self.get_list()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['count'], 2)
+
+    def test_owner_name_change_invalidates_cache(self):
+        """
+        Ensures that renaming the owner refreshes the embedded user_details.
+        """
+        self.get_list()
+        self.business_user.first_name = 'Max'
+        self.business_user.save(update_fields=['first_name'])
+        response = self.get_list()
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.data['results'][0]['user_details']['first_name'], 'Max')
+
+    def test_file_based_backend(self):
+        """
+        Ensures that the cache works with the file-based backend.
+        """
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location, ignore_errors=True)
+        with override_settings(CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': location,
+        }}):
+            self.assertEqual(self.get_list()['X-Cache'], 'MISS')
+            self.assertEqual(self.get_list()['X-Cache'], 'HIT')
+            self.offer.save()
+            self.assertEqual(self.get_list()['X-Cache'], 'MISS')
+
+    def test_cache_stats_for_admin_only(self):
+        """
+        Ensures that hit/miss counters are exposed to admin users only.
+        """
+        self.get_list()
+        self.get_list()
+        self.get_list()
+        url = reverse('offer-list-cache-stats')
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        admin = User.objects.create_superuser(username='admin', email='admin@test.com', password='adminpassword')
+        self.client.force_authenticate(user=admin)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['hits'], 2)
+        self.assertEqual(response.data['misses'], 1)
+        self.assertEqual(response.data['hit_ratio'], 0.6667)
+
+
+class OfferConditionalGetTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for ETag / Last-Modified support of the offer and offer detail endpoints.
+    """
+
+    def setUp(self):
+        """
+        Create an offer with one detail and authenticate a customer.
+        """
+        self.create_business_and_customer()
+        self.offer = Offer.objects.create(user=self.business_user, title='Website')
+        self.detail = OfferDetail.objects.create(
+            offer=self.offer, title='Basic', revisions=1, delivery_time_in_days=3,
+            price=100, features=[], offer_type='basic'
+        )
+        self.offer.update_summary()
+        self.offer_url = reverse('offer-detail', kwargs={'pk': self.offer.id})
+        self.detail_url = reverse('offerdetail-detail', kwargs={'pk': self.detail.id})
+        self.client.force_authenticate(user=self.customer_user)
+
+    def test_offer_not_modified_after_single_query(self):
+        """
+        Ensures that a matching If-None-Match returns 304 after one timestamp lookup.
+        """
+        response = self.client.get(self.offer_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('Last-Modified', response)
+        with self.assertNumQueries(1):
+            response = self.client.get(self.offer_url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_offer_if_modified_since(self):
+        """
+        Ensures that If-Modified-Since is honored.
+        """
+        response = self.client.get(self.offer_url)
+        response = self.client.get(self.offer_url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_offer_detail_etag_changes_when_detail_is_updated(self):
+        """
+        Ensures that updating a detail through the offer invalidates the detail's ETag.
+        """
+        etag = self.client.get(self.detail_url)['ETag']
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.force_authenticate(user=self.business_user)
+        self.client.patch(self.offer_url, {'details': [{'offer_type': 'basic', 'price': 80}]}, format='json')
+        self.client.force_authenticate(user=self.customer_user)
+
+        response = self.client.get(self.detail_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['price'], '80.00')
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_offer_detail_etag_changes_when_detail_is_written_directly(self):
+        """
+        Ensures that saving or deleting a detail directly invalidates the ETags of the offer and all its details.
+        """
+        sibling = OfferDetail.objects.create(
+            offer=self.offer, title='Standard', revisions=2, delivery_time_in_days=5,
+            price=200, features=[], offer_type='standard'
+        )
+        sibling_url = reverse('offerdetail-detail', kwargs={'pk': sibling.id})
+        etags = {url: self.client.get(url)['ETag'] for url in [self.detail_url, sibling_url, self.offer_url]}
+
+        self.detail.price = 10
+        self.detail.save()
+        for url, etag in etags.items():
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_200_OK, url)
+            self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(self.client.get(self.detail_url).data['price'], '10.00')
+
+        etag = self.client.get(sibling_url)['ETag']
+        self.detail.delete()
+        response = self.client.get(sibling_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_missing_offer_returns_not_found(self):
+        """
+        Ensures that conditional requests for missing offers still return 404.
+        """
+        url = reverse('offer-detail', kwargs={'pk': 9999})
+        response = self.client.get(url, HTTP_IF_NONE_MATCH='W/"abc"')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class OfferNestedWriteTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for the batched, transactional offer create and update paths.
+    """
+
+    def setUp(self):
+        """
+        Set up an authenticated business user.
+        """
+        self.business_user = self.create_user('business@test.com', 'business')
+        self.client.force_authenticate(user=self.business_user)
+        self.offer_data = {
+            'title': 'Website',
+            'description': 'Description',
+            'details': [
+                {'title': offer_type, 'revisions': 1, 'delivery_time_in_days': days,
+                 'price': price, 'features': [], 'offer_type': offer_type}
+                for offer_type, price, days in [('basic', 100, 3), ('standard', 200, 5), ('premium', 300, 7)]
+            ]
+        }
+
+    def write_statements(self, queries):
+        return [
+            query['sql'].split()[0] for query in queries
+            if query['sql'].split()[0] in ('INSERT', 'UPDATE', 'DELETE')
+        ]
+
+    def test_create_inserts_offer_and_details_in_two_statements(self):
+        """
+        Ensures that creating an offer runs one INSERT for the offer, one for all details
+        and one UPDATE storing the card.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(reverse('offer-list'), self.offer_data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.write_statements(queries), ['INSERT', 'INSERT', 'UPDATE'])
+        self.assertEqual(OfferDetail.objects.filter(offer_id=response.data['id']).count(), 3)
+
+    def test_update_writes_details_in_one_statement(self):
+        """
+        Ensures that updating several details runs one UPDATE for the details, one for the offer
+        and one for its card.
+        """
+        offer_id = self.client.post(reverse('offer-list'), self.offer_data, format='json').data['id']
+        data = {'title': 'Website Pro', 'details': [
+            {'offer_type': 'basic', 'price': 50}, {'offer_type': 'premium', 'price': 500},
+        ]}
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(reverse('offer-detail', kwargs={'pk': offer_id}), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.write_statements(queries), ['UPDATE', 'UPDATE', 'UPDATE'])
+        prices = dict(OfferDetail.objects.filter(offer_id=offer_id).values_list('offer_type', 'price'))
+        self.assertEqual(prices, {'basic': 50, 'standard': 200, 'premium': 500})
+        offer = Offer.objects.get(id=offer_id)
+        self.assertEqual((offer.title, offer.min_price, offer.max_price), ('Website Pro', 50, 500))
+
+    def test_update_creates_missing_offer_type(self):
+        """
+        Ensures that a detail with a new offer_type is inserted for the offer.
+        """
+        offer = Offer.objects.create(user=self.business_user, title='Website')
+        data = {'details': [{'title': 'Basic', 'revisions': 1, 'delivery_time_in_days': 4,
+                             'price': 90, 'features': [], 'offer_type': 'basic'}]}
+        response = self.client.patch(reverse('offer-detail', kwargs={'pk': offer.id}), data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(offer.details.get().price, 90)
+        offer.refresh_from_db()
+        self.assertEqual(offer.min_delivery_time_in_days, 4)
+
+    def test_update_is_atomic(self):
+        """
+        Ensures that a failing detail write rolls back the offer changes.
+        """
+        offer_id = self.client.post(reverse('offer-list'), self.offer_data, format='json').data['id']
+        data = {'title': 'Changed', 'details': [{'offer_type': 'basic', 'price': 1}]}
+        with mock.patch.object(OfferDetail.objects, 'bulk_update', side_effect=IntegrityError):
+            with self.assertRaises(IntegrityError):
+                self.client.patch(reverse('offer-detail', kwargs={'pk': offer_id}), data, format='json')
+        self.assertEqual(Offer.objects.get(id=offer_id).title, 'Website')
+
+    def test_upsert_tolerates_a_concurrently_created_offer_type(self):
+        """
+        Ensures that inserting an offer_type another request created meanwhile updates that detail.
+        """
+        offer = Offer.objects.prefetch_related('details').get(
+            id=Offer.objects.create(user=self.business_user, title='Website').id
+        )
+        self.assertEqual(list(offer.details.all()), [])
+        existing = OfferDetail.objects.create(
+            offer=offer, title='Basic', revisions=1, delivery_time_in_days=4,
+            price=90, features=[], offer_type='basic'
+        )
+        details = upsert_offer_details(offer, [{'title': 'Basic', 'revisions': 2, 'delivery_time_in_days': 4,
+                                                'price': 80, 'features': [], 'offer_type': 'basic'}])
+        self.assertEqual([detail.id for detail in details], [existing.id])
+        self.assertEqual(list(OfferDetail.objects.filter(offer=offer).values_list('id', 'price')), [(existing.id, 80)])
+
+    def test_offer_type_is_unique_per_offer(self):
+        """
+        Ensures that the database rejects a second detail with the same offer_type.
+        """
+        offer_id = self.client.post(reverse('offer-list'), self.offer_data, format='json').data['id']
+        with self.assertRaises(IntegrityError):
+            OfferDetail.objects.create(
+                offer_id=offer_id, title='Basic', revisions=1, delivery_time_in_days=1,
+                price=1, features=[], offer_type='basic'
+            )
+
+
+class OfferImportTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for the bulk offer import endpoint and management command.
+    """
+
+    def setUp(self):
+        """
+        Set up a business and a customer user.
+        """
+        self.create_business_and_customer()
+
+    def offer_row(self, title, types=('basic', 'standard', 'premium')):
+        return {
+            'title': title,
+            'description': 'Description',
+            'details': [
+                {'title': offer_type, 'revisions': 1, 'delivery_time_in_days': days,
+                 'price': 100 * days, 'features': ['Feature'], 'offer_type': offer_type}
+                for days, offer_type in enumerate(types, start=1)
+            ]
+        }
+
+    def test_import_creates_all_valid_offers(self):
+        """
+        Ensures that a business user can import several offers with their details and summaries.
+        """
+        self.client.force_authenticate(user=self.business_user)
+        rows = [self.offer_row(f'Offer {index}') for index in range(3)]
+        response = self.client.post(reverse('offer-import'), {'offers': rows}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data, {'created': 3, 'errors': []})
+        self.assertEqual(Offer.objects.filter(user=self.business_user).count(), 3)
+        self.assertEqual(OfferDetail.objects.count(), 9)
+        offer = Offer.objects.get(title='Offer 0')
+        self.assertEqual((offer.min_price, offer.max_price, offer.min_delivery_time_in_days), (100, 300, 1))
+
+    def test_import_reports_invalid_rows(self):
+        """
+        Ensures that invalid rows are skipped and reported with their row number.
+        """
+        self.client.force_authenticate(user=self.business_user)
+        rows = [self.offer_row('Valid'), self.offer_row('Invalid', types=('basic', 'standard')), 'text']
+        response = self.client.post(reverse('offer-import'), {'offers': rows}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_207_MULTI_STATUS)
+        self.assertEqual(response.data['created'], 1)
+        self.assertEqual([error['row'] for error in response.data['errors']], [2, 3])
+        self.assertIn('details', response.data['errors'][0]['errors'])
+        self.assertEqual(list(Offer.objects.values_list('title', flat=True)), ['Valid'])
+
+    def test_import_without_valid_rows_fails(self):
+        """
+        Ensures that a request without any valid row returns 400.
+        """
+        self.client.force_authenticate(user=self.business_user)
+        response = self.client.post(
+            reverse('offer-import'), {'offers': [self.offer_row('Invalid', types=('basic',))]}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post(reverse('offer-import'), {'offers': []}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_customer_cannot_import(self):
+        """
+        Ensures that only business users can import offers.
+        """
+        self.client.force_authenticate(user=self.customer_user)
+        response = self.client.post(reverse('offer-import'), {'offers': [self.offer_row('Offer')]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_import_offers_command_reads_ndjson(self):
+        """
+        Ensures that the management command imports NDJSON in chunks and reports broken lines.
+        """
+        with tempfile.NamedTemporaryFile('w', suffix='.ndjson', delete=False) as handle:
+            for index in range(5):
+                handle.write(json.dumps(self.offer_row(f'Offer {index}')) + '\n')
+            handle.write('{broken\n')
+        self.addCleanup(os.remove, handle.name)
+        stdout, stderr = StringIO(), StringIO()
+        call_command('import_offers', handle.name, '--user', str(self.business_user.id),
+                     '--chunk-size', '2', stdout=stdout, stderr=stderr)
+        self.assertEqual(Offer.objects.count(), 5)
+        self.assertIn('Imported 5 offers with 1 invalid rows', stdout.getvalue())
+        self.assertIn('Row 6', stderr.getvalue())
+
+    def test_import_offers_command_reads_csv(self):
+        """
+        Ensures that the management command imports flat CSV rows.
+        """
+        header = ['title', 'description'] + [
+            f'{offer_type}_{field}' for offer_type in ['basic', 'standard', 'premium']
+            for field in ['title', 'revisions', 'delivery_time_in_days', 'price', 'features']
+        ]
+        values = ['Logo', 'Logo design', 'Basic', '1', '3', '50', 'Draft',
+                  'Standard', '2', '5', '100', 'Draft|Vector', 'Premium', '5', '7', '200', 'Draft|Vector|Print']
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, newline='') as handle:
+            handle.write(','.join(header) + '\n' + ','.join(values) + '\n')
+        self.addCleanup(os.remove, handle.name)
+        call_command('import_offers', handle.name, '--user', 'business@test.com', stdout=StringIO())
+        offer = Offer.objects.get(title='Logo')
+        self.assertEqual(offer.user, self.business_user)
+        self.assertEqual(offer.details.get(offer_type='standard').features, ['Draft', 'Vector'])
+        self.assertEqual(offer.min_price, 50)
+
+    def test_import_offers_command_requires_business_user(self):
+        """
+        Ensures that the command refuses users without a business profile.
+        """
+        with self.assertRaises(CommandError):
+            call_command('import_offers', 'missing.ndjson', '--user', str(self.customer_user.id))
+
+
+class OfferImageVariantTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for the offer image thumbnail and WebP variants.
+    """
+
+    def setUp(self):
+        """
+        Set up a temporary media root and a business user with an offer.
+        """
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=self.media_root, OFFER_IMAGE_WORKERS=0)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.business_user = self.create_user('business@test.com', 'business')
+        self.offer = Offer.objects.create(user=self.business_user, title='Website', description='Description')
+        self.client.force_authenticate(user=self.business_user)
+
+    def upload(self, size=(2000, 1000), name='photo.png'):
+        buffer = BytesIO()
+        Image.new('RGB', size, 'red').save(buffer, format='PNG')
+        return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+    def patch_image(self, execute):
+        with self.captureOnCommitCallbacks(execute=execute):
+            response = self.client.patch(
+                reverse('offer-detail', kwargs={'pk': self.offer.id}), {'image': self.upload()}, format='multipart'
+            )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.offer.refresh_from_db()
+
+    def test_upload_builds_thumbnail_and_webp_after_commit(self):
+        """
+        Ensures that an uploaded image gets a fixed-size thumbnail and a scaled WebP variant.
+        """
+        self.patch_image(execute=True)
+        with Image.open(self.offer.image_thumbnail.path) as thumbnail:
+            self.assertEqual((thumbnail.format, thumbnail.size), ('WEBP', THUMBNAIL_SIZE))
+        with Image.open(self.offer.image_webp.path) as webp:
+            self.assertEqual((webp.format, webp.size), ('WEBP', (1600, 800)))
+
+    def test_list_falls_back_to_original_until_variants_exist(self):
+        """
+        Ensures that the list returns the original image until the thumbnail is built, then the thumbnail.
+        """
+        self.patch_image(execute=False)
+        response = self.client.get(reverse('offer-list'))
+        self.assertTrue(response.data['results'][0]['image'].endswith(self.offer.image.url))
+
+        build_image_variants(self.offer.id)
+        self.offer.refresh_from_db()
+        response = self.client.get(reverse('offer-list'))
+        self.assertTrue(response.data['results'][0]['image'].endswith(self.offer.image_thumbnail.url))
+        response = self.client.get(reverse('offer-detail', kwargs={'pk': self.offer.id}))
+        self.assertTrue(response.data['image'].endswith(self.offer.image_webp.url))
+
+    def test_new_upload_resets_variants(self):
+        """
+        Ensures that replacing the image clears the old variants and stale builds are discarded.
+        """
+        self.patch_image(execute=True)
+        self.patch_image(execute=False)
+        self.assertFalse(self.offer.image_thumbnail)
+        Offer.objects.filter(pk=self.offer.pk).update(image='offer_images/other.png')
+        self.assertFalse(build_image_variants(self.offer.id))
+
+    def test_build_offer_image_variants_command_fills_missing_variants(self):
+        """
+        Ensures that the management command builds variants for images without them.
+        """
+        self.offer.image.save('photo.png', self.upload())
+        stdout = StringIO()
+        call_command('build_offer_image_variants', stdout=stdout)
+        self.offer.refresh_from_db()
+        self.assertTrue(self.offer.image_thumbnail)
+        self.assertIn('Built image variants for 1 offers (0 failed)', stdout.getvalue())
+
+
+class OfferReadPathParityTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite ensuring the values() read path renders the offer list byte for byte like OfferListSerializer.
+    """
+
+    def setUp(self):
+        """
+        Set up offers with and without owner, image, thumbnail and details.
+        """
+        self.business_user = self.create_user(
+            'business@test.com', 'business', first_name='Jörg', last_name='Müller'
+        )
+        for index in range(7):
+            offer = Offer.objects.create(
+                user=self.business_user if index % 3 else None,
+                title=f'Design {index} – “Logo”',
+                description=f'Beschreibung {index}',
+                image=f'offer_images/photo{index}.png' if index % 2 else None,
+                image_thumbnail=f'offer_images/thumbnails/photo{index}.webp' if index == 3 else None,
+            )
+            details = [
+                OfferDetail(offer=offer, title=offer_type, revisions=index, delivery_time_in_days=index + days,
+                            price=f'{index * 10 + days}.5', features=['A', 'ß'], offer_type=offer_type)
+                for days, offer_type in enumerate(['basic', 'standard', 'premium'][:index % 4], start=1)
+            ]
+            OfferDetail.objects.bulk_create(details)
+            offer.update_summary()
+
+    def get_both(self, params):
+        """
+        Return the response bodies of the serializer and of the values() read path.
+        """
+        bodies = []
+        for enabled in [False, True]:
+            offer_list_cache.invalidate()
+            with override_settings(VALUES_READ_PATH=enabled):
+                response = self.client.get(reverse('offer-list'), params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            bodies.append(response.content)
+        return bodies
+
+    def test_list_output_is_identical(self):
+        """
+        Ensures that both paths return identical bytes for pagination, ordering, filters and search.
+        """
+        for params in [
+            {'ordering': 'created_at'},
+            {'ordering': '-min_price', 'page': 2, 'page_size': 3},
+            {'ordering': 'title', 'creator_id': self.business_user.id, 'max_delivery_time': 5},
+            {'ordering': 'created_at', 'min_price': 200},
+            {'search': 'Design'},
+            {'pagination': 'cursor', 'page_size': 2},
+        ]:
+            with self.subTest(params=params):
+                serializer_body, reader_body = self.get_both(params)
+                self.assertEqual(serializer_body, reader_body)
+
+    def test_cursor_links_are_identical(self):
+        """
+        Ensures that keyset cursors built from values() rows match those built from instances.
+        """
+        serializer_body, reader_body = self.get_both({'pagination': 'cursor', 'page_size': 2})
+        cursor = json.loads(reader_body)['next']
+        self.assertIsNotNone(cursor)
+        self.assertEqual(json.loads(serializer_body)['next'], cursor)
+        params = {key: values[0] for key, values in parse_qs(urlparse(cursor).query).items()}
+        serializer_body, reader_body = self.get_both(params)
+        self.assertEqual(serializer_body, reader_body)
+
+    @override_settings(VALUES_READ_PATH=True)
+    def test_read_path_keeps_query_count(self):
+        """
+        Ensures that the read path needs one query each for count and page.
+        """
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('offer-list'), {'ordering': 'created_at'})
+        self.assertEqual(len(response.data['results']), 5)
+
+
+class OfferSparseFieldsTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for ?fields= sparse fieldsets on the offer list.
+    """
+
+    def setUp(self):
+        """
+        Set up a business user with offers and details.
+        """
+        self.business_user = self.create_user('business@test.com', 'business')
+        for index in range(3):
+            offer = Offer.objects.create(user=self.business_user, title=f'Offer {index}', description='Long text')
+            OfferDetail.objects.bulk_create([
+                OfferDetail(offer=offer, title=offer_type, revisions=1, delivery_time_in_days=days,
+                            price=100 * days, features=['Feature'], offer_type=offer_type)
+                for days, offer_type in enumerate(['basic', 'standard', 'premium'], start=1)
+            ])
+            offer.update_summary()
+
+    def get_list(self, params, enabled=True):
+        offer_list_cache.invalidate()
+        with override_settings(VALUES_READ_PATH=enabled):
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(reverse('offer-list'), params)
+        return response, queries
+
+    def test_fields_trim_response_and_columns(self):
+        """
+        Ensures that only the requested fields are returned and selected, on both read paths.
+        """
+        for enabled in [True, False]:
+            with self.subTest(values_read_path=enabled):
+                response, queries = self.get_list({'fields': 'id,title,min_price,image'}, enabled)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(list(response.data['results'][0]), ['id', 'title', 'image', 'min_price'])
+                self.assertEqual(len(queries), 2)
+                page_query = queries[-1]['sql']
+                self.assertNotIn('description', page_query)
+                self.assertNotIn('auth_user', page_query)
+
+    def test_nested_fields_are_loaded_only_when_requested(self):
+        """
+        Ensures that details and user_details are read from the card without joins or prefetches.
+        """
+        for enabled in [True, False]:
+            with self.subTest(values_read_path=enabled):
+                response, queries = self.get_list({'fields': 'id,details,user_details'}, enabled)
+                result = response.data['results'][0]
+                self.assertEqual(list(result), ['id', 'details', 'user_details'])
+                self.assertEqual(len(result['details']), 3)
+                self.assertEqual(result['user_details']['username'], 'business@test.com')
+                self.assertEqual(len(queries), 2)
+                self.assertNotIn('offers_app_offerdetail', queries[-1]['sql'])
+                self.assertNotIn('auth_user', queries[-1]['sql'])
+
+    def test_fields_work_with_cursor_pagination(self):
+        """
+        Ensures that keyset cursors can be built although the ordering field is not requested.
+        """
+        response, _ = self.get_list({'fields': 'title', 'pagination': 'cursor', 'page_size': 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [{'title': 'Offer 2'}, {'title': 'Offer 1'}])
+        self.assertIsNotNone(response.data['next'])
+
+    def test_unknown_field_returns_400(self):
+        """
+        Ensures that unknown field names are rejected.
+        """
+        response, _ = self.get_list({'fields': 'id,secret'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('secret', response.data['fields'])
+
+
+class OfferListCountTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for cached and estimated offer list counts.
+    """
+
+    def setUp(self):
+        """
+        Set up offers of two business users and start with an empty cache.
+        """
+        offer_list_cache.get_cache().clear()
+        self.users = []
+        for index in range(2):
+            user = self.create_user(f'business{index}@test.com', 'business')
+            self.users.append(user)
+            for number in range(3):
+                Offer.objects.create(user=user, title=f'Offer {number}')
+
+    def get_list(self, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('offer-list'), params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        count_queries = [query for query in queries if 'COUNT(' in query['sql']]
+        return response.data, len(count_queries)
+
+    def test_count_is_cached_per_filter_combination(self):
+        """
+        Ensures that pages and orderings of the same filters share one exact count.
+        """
+        data, counts = self.get_list({'creator_id': self.users[0].id, 'page_size': 2})
+        self.assertEqual((data['count'], data['count_estimated'], counts), (3, False, 1))
+        data, counts = self.get_list({'creator_id': self.users[0].id, 'page_size': 2, 'page': 2, 'ordering': 'title'})
+        self.assertEqual((data['count'], counts), (3, 0))
+        data, counts = self.get_list({'creator_id': self.users[1].id})
+        self.assertEqual((data['count'], counts), (3, 1))
+
+    def test_offer_changes_invalidate_cached_counts(self):
+        """
+        Ensures that a new offer is counted on the next request.
+        """
+        self.assertEqual(self.get_list({})[0]['count'], 6)
+        Offer.objects.create(user=self.users[0], title='New offer')
+        data, counts = self.get_list({'page': 2})
+        self.assertEqual((data['count'], counts), (7, 1))
+
+    @override_settings(OFFER_LIST_COUNT_ESTIMATE=True)
+    def test_unfiltered_count_uses_maintained_counter(self):
+        """
+        Ensures that the estimated total follows creates and deletes without recounting.
+        """
+        data, counts = self.get_list({})
+        self.assertEqual((data['count'], data['count_estimated'], counts), (6, True, 1))
+        Offer.objects.create(user=self.users[0], title='New offer')
+        Offer.objects.filter(title='Offer 0').delete()
+        data, counts = self.get_list({})
+        self.assertEqual((data['count'], data['count_estimated'], counts), (5, True, 0))
+
+        data, counts = self.get_list({'search': 'New'})
+        self.assertEqual((data['count'], data['count_estimated'], counts), (1, False, 1))
+
+
+class OfferFacetTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for the offer price and delivery time facets endpoint.
+    """
+
+    def setUp(self):
+        """
+        Set up offers with different price and delivery summaries.
+        """
+        self.business_user = self.create_user('business@test.com', 'business')
+        for title, price, days in [('Logo', 40, 2), ('Logo Pro', 120, 5), ('Website', 800, 20), ('Shop', 1500, 40)]:
+            Offer.objects.create(
+                user=self.business_user, title=title, min_price=price, max_price=price * 2,
+                min_delivery_time_in_days=days
+            )
+        Offer.objects.create(user=self.business_user, title='Draft')
+        offer_list_cache.invalidate()
+
+    def bucket_counts(self, data, facet):
+        return [bucket['count'] for bucket in data[facet]]
+
+    def test_facets_are_computed_with_one_query(self):
+        """
+        Ensures that all buckets of both facets come from a single aggregate query.
+        """
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('offer-facets'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 5)
+        self.assertEqual(self.bucket_counts(response.data, 'price'), [1, 0, 1, 0, 1, 1])
+        self.assertEqual(response.data['price'][-1], {'min': 1000, 'max': None, 'count': 1})
+        self.assertEqual(self.bucket_counts(response.data, 'delivery_time'), [1, 1, 0, 1, 1])
+
+    def test_facets_honor_filters_and_search(self):
+        """
+        Ensures that offer filters and search narrow the facets like the offer list.
+        """
+        response = self.client.get(reverse('offer-facets'), {'max_delivery_time': 10})
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(self.bucket_counts(response.data, 'price'), [1, 0, 1, 0, 0, 0])
+        response = self.client.get(reverse('offer-facets'), {'search': 'logo'})
+        self.assertEqual(response.data['count'], 2)
+
+    def test_facets_are_cached_until_offers_change(self):
+        """
+        Ensures that repeated facet requests are served from the cache until an offer is written.
+        """
+        self.client.get(reverse('offer-facets'))
+        with self.assertNumQueries(0):
+            self.client.get(reverse('offer-facets'))
+        Offer.objects.create(user=self.business_user, title='Cheap', min_price=10, min_delivery_time_in_days=1)
+        response = self.client.get(reverse('offer-facets'))
+        self.assertEqual(response.data['price'][0]['count'], 2)
+
+
+    def test_facet_lookups_are_counted_separately(self):
+        """
+        Ensures that facet cache hits and misses do not change the offer list cache statistics.
+        """
+        offer_list_cache.get_cache().clear()
+        self.client.get(reverse('offer-facets'))
+        self.client.get(reverse('offer-facets'))
+        self.client.get(reverse('offer-list'))
+        stats = offer_list_cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses']), (0, 1))
+        self.assertEqual(stats['facets'], {'hits': 1, 'misses': 1, 'hit_ratio': 0.5})
+
+class OfferCardTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for the precomputed list card stored on offers.
+    """
+
+    def setUp(self):
+        """
+        Set up a business user with two offers created through the API.
+        """
+        self.business_user = self.create_user('business@test.com', 'business', first_name='Max', last_name='Muster')
+        self.client.force_authenticate(user=self.business_user)
+        self.offer_ids = [
+            self.client.post(reverse('offer-list'), {
+                'title': f'Offer {index}', 'description': 'Description',
+                'details': [
+                    {'title': offer_type, 'revisions': 1, 'delivery_time_in_days': days,
+                     'price': price, 'features': ['Feature'], 'offer_type': offer_type}
+                    for offer_type, price, days in [('basic', 100, 3), ('standard', 200, 5), ('premium', 300, 7)]
+                ],
+            }, format='json').data['id']
+            for index in range(2)
+        ]
+
+    def get_body(self, params=None, enabled=True):
+        offer_list_cache.invalidate()
+        with override_settings(VALUES_READ_PATH=enabled):
+            return self.client.get(reverse('offer-list'), params or {}).content
+
+    def get_card(self, offer_id):
+        return Offer.objects.get(id=offer_id).card
+
+    def test_card_matches_live_rendering(self):
+        """
+        Ensures that lists read from cards are identical to the live rendering, on both read paths.
+        """
+        for enabled in [True, False]:
+            with self.subTest(values_read_path=enabled):
+                from_cards = self.get_body(enabled=enabled)
+                Offer.objects.update(card=None)
+                live = self.get_body(enabled=enabled)
+                call_command('rebuild_offer_cards', stdout=StringIO())
+                self.assertEqual(from_cards, live)
+                self.assertEqual(self.get_body(enabled=enabled), live)
+
+    def test_list_page_reads_only_the_offer_table(self):
+        """
+        Ensures that a list page is a single query without joins on the offer table.
+        """
+        offer_list_cache.invalidate()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('offer-list'))
+        self.assertEqual(len(response.data['results']), 2)
+        page_query = queries[-1]['sql']
+        self.assertIn('"card"', page_query)
+        self.assertNotIn('JOIN', page_query)
+        self.assertNotIn('offers_app_offerdetail', ''.join(query['sql'] for query in queries))
+
+    def test_detail_changes_refresh_the_card(self):
+        """
+        Ensures that updated and deleted details are reflected in the card.
+        """
+        offer_id = self.offer_ids[0]
+        response = self.client.patch(
+            reverse('offer-detail', kwargs={'pk': offer_id}),
+            {'details': [{'offer_type': 'basic', 'price': 50}]}, format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        card = self.get_card(offer_id)
+        self.assertEqual(card['min_price'], 50)
+        self.assertEqual(card['updated_at'], self.client.get(reverse('offer-detail', kwargs={'pk': offer_id})).data['updated_at'])
+
+        OfferDetail.objects.get(offer_id=offer_id, offer_type='premium').delete()
+        self.assertEqual(len(self.get_card(offer_id)['details']), 2)
+
+    def test_direct_detail_writes_update_summary_and_card(self):
+        """
+        Ensures that saving or deleting a detail directly recalculates the offer summary and re-renders its card once.
+        """
+        offer_id = self.offer_ids[0]
+        detail = OfferDetail.objects.get(offer_id=offer_id, offer_type='basic')
+        detail.price = 1
+        with CaptureQueriesContext(connection) as queries:
+            detail.save()
+        card_writes = [query for query in queries if query['sql'].startswith('UPDATE "offers_app_offer" SET "card"')]
+        self.assertEqual(len(card_writes), 1)
+        offer = Offer.objects.get(id=offer_id)
+        self.assertEqual(offer.min_price, 1)
+        self.assertEqual(offer.card['min_price'], 1)
+        response = self.client.get(reverse('offer-list'), {'ordering': 'min_price'})
+        self.assertEqual([item['id'] for item in response.data['results']], [offer_id, self.offer_ids[1]])
+        self.assertEqual(response.data['results'][0]['min_price'], 1)
+
+        detail.delete()
+        offer.refresh_from_db()
+        self.assertEqual(offer.min_price, 200)
+        self.assertEqual(offer.card['min_price'], 200)
+
+    def test_deleting_the_owner_skips_summary_recalculation(self):
+        """
+        Ensures that deleting a user cascades to their offers and details without
+        recalculating a summary or re-rendering a card per detail.
+        """
+        for index in range(3):
+            offer = Offer.objects.create(user=self.business_user, title=f'Extra {index}')
+            for offer_type in ['basic', 'standard', 'premium']:
+                OfferDetail.objects.create(
+                    offer=offer, title=offer_type, revisions=1, delivery_time_in_days=2,
+                    price=100, features=[], offer_type=offer_type
+                )
+        user = User.objects.get(id=self.business_user.id)
+        with self.assertNumQueries(16):
+            user.delete()
+        self.assertFalse(Offer.objects.exists())
+
+    def test_owner_rename_refreshes_the_cards(self):
+        """
+        Ensures that renaming the owner updates user_details in all of their cards.
+        """
+        self.business_user.first_name = 'Erika'
+        self.business_user.save(update_fields=['first_name'])
+        for offer_id in self.offer_ids:
+            self.assertEqual(self.get_card(offer_id)['user_details']['first_name'], 'Erika')
+
+    def test_imported_offers_get_cards(self):
+        """
+        Ensures that offers written by the bulk importer are stored with their card.
+        """
+        response = self.client.post(reverse('offer-import'), {'offers': [{
+            'title': 'Imported', 'description': 'Description',
+            'details': [
+                {'title': offer_type, 'revisions': 1, 'delivery_time_in_days': 2,
+                 'price': 80, 'features': [], 'offer_type': offer_type}
+                for offer_type in ['basic', 'standard', 'premium']
+            ],
+        }]}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        card = Offer.objects.get(title='Imported').card
+        self.assertEqual(card['title'], 'Imported')
+        self.assertEqual(len(card['details']), 3)
+
+
+class OfferDetailCacheTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for the in-process LRU cache of offer details.
+    """
+
+    def setUp(self):
+        """
+        Set up an offer with two details, an admin and an authenticated customer.
+        """
+        offer_detail_cache.clear()
+        self.create_business_and_customer()
+        self.admin_user = User.objects.create_superuser(username='admin', password='testpassword')
+        self.offer = Offer.objects.create(user=self.business_user, title='Website')
+        self.details = [
+            OfferDetail.objects.create(
+                offer=self.offer, title=offer_type, revisions=1, delivery_time_in_days=3,
+                price=100, features=[], offer_type=offer_type
+            )
+            for offer_type in ['basic', 'standard']
+        ]
+        self.client.force_authenticate(user=self.customer_user)
+
+    def get_detail(self, detail):
+        return self.client.get(reverse('offerdetail-detail', kwargs={'pk': detail.id}))
+
+    def test_repeated_retrieve_is_served_from_cache(self):
+        """
+        Ensures that the second retrieve runs no query and returns the same body and ETag.
+        """
+        first = self.get_detail(self.details[0])
+        with self.assertNumQueries(0):
+            second = self.get_detail(self.details[0])
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second['ETag'], first['ETag'])
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                reverse('offerdetail-detail', kwargs={'pk': self.details[0].id}), HTTP_IF_NONE_MATCH=first['ETag']
+            )
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_update_and_delete_invalidate_the_entry(self):
+        """
+        Ensures that detail updates through the offer and deletes are visible immediately.
+        """
+        self.get_detail(self.details[0])
+        self.client.force_authenticate(user=self.business_user)
+        self.client.patch(
+            reverse('offer-detail', kwargs={'pk': self.offer.id}),
+            {'details': [{'offer_type': 'basic', 'price': 80}]}, format='json'
+        )
+        self.assertEqual(self.get_detail(self.details[0]).data['price'], '80.00')
+
+        url = reverse('offerdetail-detail', kwargs={'pk': self.details[0].id})
+        self.details[0].delete()
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_size_and_ttl_bound_the_cache(self):
+        """
+        Ensures that the least recently used entry is evicted and expired entries are reloaded.
+        """
+        extra = OfferDetail.objects.create(
+            offer=self.offer, title='premium', revisions=1, delivery_time_in_days=3,
+            price=100, features=[], offer_type='premium'
+        )
+        with override_settings(OFFER_DETAIL_CACHE_SIZE=2, OFFER_DETAIL_CACHE_TTL=30):
+            for detail in [self.details[0], self.details[1], self.details[0], extra]:
+                self.get_detail(detail)
+            self.assertEqual(list(offer_detail_cache.entries), [self.details[0].id, extra.id])
+
+            now = time.monotonic()
+            with mock.patch('offers_app.detail_cache.time.monotonic', return_value=now + 31):
+                with self.assertNumQueries(1):
+                    self.get_detail(extra)
+
+    def test_concurrent_access_keeps_the_cache_consistent(self):
+        """
+        Ensures that many threads reading overlapping keys keep the size bound and the counters exact.
+        """
+        def load(pk):
+            return {'data': {'id': pk}, 'offer_id': pk % 3}
+
+        def read(seed):
+            for index in range(200):
+                offer_detail_cache.get((seed + index) % 10)
+
+        with override_settings(OFFER_DETAIL_CACHE_SIZE=5), \
+                mock.patch('offers_app.detail_cache.load_offer_detail', side_effect=load):
+            threads = [threading.Thread(target=read, args=(seed,)) for seed in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            offer_detail_cache.invalidate(offer_ids=[0, 1, 2])
+            stats = offer_detail_cache.get_stats()
+        self.assertEqual(stats['hits'] + stats['misses'], 1600)
+        self.assertEqual(stats['size'], 0)
+        self.assertEqual(offer_detail_cache.keys_by_offer, {})
+
+    def test_stats_endpoint_reports_hit_ratio(self):
+        """
+        Ensures that admins can read the hit ratio of the offer detail cache.
+        """
+        for _ in range(4):
+            self.get_detail(self.details[0])
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.get(reverse('offerdetail-cache-stats'))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data['hits'], response.data['misses']), (3, 1))
+        self.assertEqual(response.data['hit_ratio'], 0.75)
+
+        self.client.force_authenticate(user=self.customer_user)
+        response = self.client.get(reverse('offerdetail-cache-stats'))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
@@ -23,4 +23,4 @@ class IsBusinessUser(permissions.BasePermission):
         user = request.user
         if not user.is_authenticated:
             return False
-        return obj.business_user == user
\ No newline at end of file
+        return obj.business_user_id == user.id
\ No newline at end of file
@@ -1,7 +1,13 @@
+from collections import Counter
+
 from rest_framework import serializers
 from orders_app.models import Order
 from django.contrib.auth.models import User
-from offers_app.models import OfferDetail, Offer
+from django.db import transaction
+from rest_framework.exceptions import NotFound
+from offers_app.detail_cache import load_offer_detail, load_offer_details
+from orders_app.counters import adjust_counter
+from core.readers import ValuesReader
 
 class UserDetailsSerializer(serializers.ModelSerializer):
     class Meta:
@@ -40,39 +46,104 @@ class OrderSerializer(serializers.ModelSerializer):
         Create a new order from an offer detail.
         
         Args:
-            validated_data: Dictionary containing offer_detail_id
+            validated_data: Dictionary containing offer_detail_id and optionally
+                offer_detail, the entry already loaded by the view
             
         Returns:
             Order: Newly created order instance with data copied from offer detail
             
         Process:
             1. Extracts offer_detail_id from validated data
-            2. Retrieves the corresponding OfferDetail and Offer objects
+            2. Uses the offer detail handed over by the view, or reads it and its
+               offer owner from the database, bypassing the offer detail cache
             3. Sets customer_user from request context (authenticated user)
             4. Sets business_user from offer owner
             5. Copies all relevant fields from offer detail to order
-            6. Creates and returns the new order
+            6. Creates the order and updates the order counters in one transaction
         """
         offer_detail_id = validated_data.pop('offer_detail_id')
-        offer_detail = OfferDetail.objects.get(id=offer_detail_id)
-        offer = offer_detail.offer
+        offer_detail = validated_data.pop('offer_detail', None)
+        # Joins the view's transaction without a savepoint of its own
+        with transaction.atomic(savepoint=False):
+            if offer_detail is None:
+                offer_detail = load_offer_detail(offer_detail_id)
+            if offer_detail is None:
+                raise NotFound(detail="The specified offer detail was not found.")
 
-        customer_user = self.context['request'].user
-        business_user = offer.user
-
-        order_data = {
-            'customer_user': customer_user,
-            'business_user': business_user,
-            'title': offer_detail.title,
-            'revisions': offer_detail.revisions,
-            'delivery_time_in_days': offer_detail.delivery_time_in_days,
-            'price': offer_detail.price,
-            'features': offer_detail.features,
-            'offer_type': offer_detail.offer_type,
-        }
-        order = Order.objects.create(**order_data)
+            order_data = {
+                **offer_detail['fields'],
+                'features': list(offer_detail['fields']['features']),
+                'customer_user': self.context['request'].user,
+                'business_user_id': offer_detail['business_user_id'],
+            }
+            order = Order.objects.create(**order_data)
         return order
 
+
+class OrderCheckoutSerializer(serializers.Serializer):
+    """
+    Serializer for placing orders for several offer details at once.
+
+    All offer details are resolved with one IN query and all orders are
+    inserted with one bulk_create in a single transaction. Either every
+    order is created or none is. An offer detail listed twice is ordered twice.
+
+    Fields:
+        offer_detail_ids: IDs of the offer details to order (at most max_items)
+    """
+    max_items = 20
+    offer_detail_ids = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False)
+
+    def validate_offer_detail_ids(self, value):
+        if len(value) > self.max_items:
+            raise serializers.ValidationError(f"At most {self.max_items} offer details can be ordered at once.")
+        return value
+
+    def validate(self, attrs):
+        """
+        Load all offer details and check that each of them can be ordered.
+
+        Raises:
+            NotFound: If any offer detail does not exist
+            ValidationError: If any offer has no associated business user
+        """
+        ids = attrs['offer_detail_ids']
+        offer_details = load_offer_details(ids)
+        missing = [pk for pk in dict.fromkeys(ids) if pk not in offer_details]
+        if missing:
+            raise NotFound(detail=f"The specified offer details were not found: {', '.join(map(str, missing))}.")
+        if any(not offer_details[pk]['business_user_id'] for pk in ids):
+            raise serializers.ValidationError({'offer_detail_ids': "The offer has no associated business user."})
+        attrs['offer_details'] = [offer_details[pk] for pk in ids]
+        return attrs
+
+    def create(self, validated_data):
+        """
+        Create one order per requested offer detail.
+
+        bulk_create does not send post_save, so the order counters of the
+        business users are adjusted explicitly, once per business user.
+
+        Returns:
+            list: Created orders, in request order
+        """
+        customer_user = self.context['request'].user
+        orders = [
+            Order(**{
+                **offer_detail['fields'],
+                'features': list(offer_detail['fields']['features']),
+                'customer_user': customer_user,
+                'business_user_id': offer_detail['business_user_id'],
+            })
+            for offer_detail in validated_data['offer_details']
+        ]
+        with transaction.atomic():
+            orders = Order.objects.bulk_create(orders)
+            new_orders = Counter(order.business_user_id for order in orders)
+            for business_user_id, count in new_orders.items():
+                adjust_counter(business_user_id, 'in_progress', count)
+        return orders
+
 class OrderUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Order
@@ -102,4 +173,11 @@ class OrderListSerializer(serializers.ModelSerializer):
             'revisions', 'delivery_time_in_days', 'price', 'features',
             'offer_type', 'status', 'created_at', 'updated_at'
         ]
-        read_only_fields = fields
\ No newline at end of file
+        read_only_fields = fields
+
+
+class OrderListReader(ValuesReader):
+    """
+    values() fast path producing the same output as OrderListSerializer.
+    """
+    serializer_class = OrderListSerializer
@@ -1,14 +1,18 @@
 from django.urls import path
 from .views import (
     OrderListView,
+    OrderCheckoutView,
     OrderDetailView,
     OrderCountView,
-    CompletedOrderCountView
+    CompletedOrderCountView,
+    OrderCountBatchView
 )
 
 urlpatterns = [
     path('orders/', OrderListView.as_view(), name='order-list'),
+    path('orders/checkout/', OrderCheckoutView.as_view(), name='order-checkout'),
     path('orders/<int:pk>/', OrderDetailView.as_view(), name='order-detail'),
     path('order-count/<int:business_user_id>/', OrderCountView.as_view(), name='order-count'),
+    path('order-counts/', OrderCountBatchView.as_view(), name='order-count-batch'),
     path('completed-order-count/<int:business_user_id>/', CompletedOrderCountView.as_view(), name='completed-order-count'),
 ]
\ No newline at end of file
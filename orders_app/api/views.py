@@ -1,20 +1,77 @@
 from rest_framework import generics, status
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated, IsAdminUser
-from rest_framework.exceptions import NotFound  # <-- Hinzugefügt
-from django.shortcuts import get_object_or_404
-from django.db.models import Q
-from orders_app.models import Order
-from offers_app.models import OfferDetail
-from user_profile.models import Profile
+from rest_framework.permissions import IsAuthenticated, IsAdminUser, SAFE_METHODS
+from rest_framework.views import APIView
+from rest_framework.exceptions import NotFound, ValidationError  # <-- Hinzugefügt
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.http import Http404
+from orders_app.archive import get_archive_queryset
+from orders_app.models import ArchivedOrder, Order
+from offers_app.detail_cache import load_offer_detail
+from orders_app.counters import get_order_counts, get_order_counts_for
+from orders_app.transitions import change_status
 from .serializers import (
     OrderSerializer,
+    OrderCheckoutSerializer,
     OrderUpdateSerializer,
-    OrderListSerializer
+    OrderListSerializer,
+    OrderListReader
 )
 from .permissions import IsCustomerUser, IsBusinessUser
+from core.mixins import ConditionalRetrieveMixin, ValuesListMixin
+from core.pagination import KeysetPagination
 
-class OrderListView(generics.ListCreateAPIView):
+
+class OrderKeysetPagination(KeysetPagination):
+    """
+    Keyset pagination for order listings, newest orders first.
+
+    Seeks on (created_at, id), so old orders cost the same to page through
+    as recent ones. The default and maximum page size are configured with
+    ORDER_LIST_PAGE_SIZE and ORDER_LIST_MAX_PAGE_SIZE.
+
+    Query Parameters:
+        cursor: Opaque cursor taken from the next/previous links
+        page_size: Number of results per page (max ORDER_LIST_MAX_PAGE_SIZE)
+        ordering: created_at or -created_at (default)
+    """
+    ordering_fields = ['created_at']
+    default_ordering = '-created_at'
+
+    def __init__(self):
+        self.page_size = getattr(settings, 'ORDER_LIST_PAGE_SIZE', 20)
+        self.max_page_size = getattr(settings, 'ORDER_LIST_MAX_PAGE_SIZE', 100)
+
+
+def get_visible_order_branches(queryset, user):
+    """
+    Return the orders visible to a user as two disjoint querysets, one per role.
+
+    SQLite cannot serve `customer_user = ? OR business_user = ?` in created_at
+    order from indexes and sorts every matching order. Each branch instead
+    reads its own (role, created_at) index in order, and their UNION ALL is
+    merged without a sort. Orders where the user is both customer and
+    business user only appear in the customer branch.
+    """
+    return [
+        queryset.filter(customer_user=user),
+        queryset.filter(business_user=user).exclude(customer_user=user),
+    ]
+
+
+def include_archived(request):
+    """
+    Return True if a read request asks for archived orders with ?include_archived=true.
+    """
+    return (
+        request.method in SAFE_METHODS
+        and request.query_params.get('include_archived', '').lower() in ('1', 'true')
+    )
+
+
+class OrderListView(ValuesListMixin, generics.ListCreateAPIView):
     """
     API view for listing and creating orders.
     
@@ -26,9 +83,30 @@ class OrderListView(generics.ListCreateAPIView):
         GET: Authenticated users can view their orders
         POST: Only customer users can create new orders
         
-    Queryset: Orders where user is customer_user OR business_user
+    Queryset: Orders where user is customer_user OR business_user, paged as a
+        UNION ALL of one indexed query per role
+    Pagination: keyset cursors over (created_at, id), newest first; the full
+        unpaginated list is only returned with ORDER_LIST_PAGINATION = False
+    Rendering: GET responses are built from values() rows by OrderListReader
+    Sparse fieldsets: ?fields=id,status returns and selects only those fields
+    Archive: ?include_archived=true also lists archived orders, merged into
+        the same UNION ALL (paginated lists only)
     """
     permission_classes = [IsAuthenticated]
+    values_reader_class = OrderListReader
+    pagination_class = OrderKeysetPagination
+
+    @property
+    def paginator(self):
+        """
+        Return the keyset paginator, or None if ORDER_LIST_PAGINATION is disabled.
+        """
+        if not hasattr(self, '_paginator'):
+            if getattr(settings, 'ORDER_LIST_PAGINATION', True):
+                self._paginator = self.pagination_class()
+            else:
+                self._paginator = None
+        return self._paginator
 
     def get_queryset(self):
         """
@@ -40,6 +118,32 @@ class OrderListView(generics.ListCreateAPIView):
         user = self.request.user
         return Order.objects.filter(Q(customer_user=user) | Q(business_user=user))
 
+    def get_keyset_branches(self, queryset):
+        """
+        Split the visible orders into one index-backed query per role for the keyset pagination.
+
+        Returns:
+            list: Orders of the user as customer, and as business user
+                without those already returned as customer
+        """
+        branches = get_visible_order_branches(queryset, self.request.user)
+        if include_archived(self.request):
+            branches += get_visible_order_branches(get_archive_queryset(queryset), self.request.user)
+        return branches
+
+    def list(self, request, *args, **kwargs):
+        """
+        List the visible orders.
+
+        Raises:
+            400: include_archived requested while ORDER_LIST_PAGINATION is disabled
+        """
+        if include_archived(request) and self.paginator is None:
+            raise ValidationError({
+                'include_archived': "Archived orders can only be listed with ORDER_LIST_PAGINATION enabled."
+            })
+        return super().list(request, *args, **kwargs)
+
     def get_serializer_class(self):
         """
         Return appropriate serializer based on request method.
@@ -79,6 +183,10 @@ class OrderListView(generics.ListCreateAPIView):
         Raises:
             400: Invalid offer_detail_id or missing business user
             404: Offer detail not found
+
+        The offer detail is read once, fresh from the database inside the
+        order transaction so price and features are never stale, and handed
+        to the serializer instead of being looked up again.
         """
         offer_detail_id = request.data.get('offer_detail_id')
         if not offer_detail_id:
@@ -92,20 +200,50 @@ class OrderListView(generics.ListCreateAPIView):
                  status=status.HTTP_400_BAD_REQUEST
             )
 
-        try:
-            offer_detail = OfferDetail.objects.get(id=offer_detail_id)
-        except OfferDetail.DoesNotExist:
-            raise NotFound(detail="The specified offer detail was not found.")
+        with transaction.atomic():
+            offer_detail = load_offer_detail(offer_detail_id)
+            if offer_detail is None:
+                raise NotFound(detail="The specified offer detail was not found.")
 
-        if not offer_detail.offer.user:
-            return Response({"error": "The offer has no associated business user."}, status=status.HTTP_400_BAD_REQUEST)
+            if not offer_detail['business_user_id']:
+                return Response({"error": "The offer has no associated business user."}, status=status.HTTP_400_BAD_REQUEST)
 
-        serializer = self.get_serializer(data={'offer_detail_id': offer_detail_id})
-        serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
+            serializer = self.get_serializer(data={'offer_detail_id': offer_detail_id})
+            serializer.is_valid(raise_exception=True)
+            serializer.save(offer_detail=offer_detail)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
-class OrderDetailView(generics.RetrieveUpdateDestroyAPIView):
+class OrderCheckoutView(generics.GenericAPIView):
+    """
+    API view placing orders for several offer details in one request.
+
+    Replaces one POST /api/orders/ per package when a customer checks out a
+    cart. All offer details are resolved with one query and all orders are
+    inserted together: if any offer detail cannot be ordered, no order is created.
+
+    Permissions:
+        POST: Only customer users can place orders
+
+    Request Format:
+        {"offer_detail_ids": [1, 2, 3]}
+
+    Response Format:
+        List of the created orders, in request order (201)
+
+    Raises:
+        400: Missing, invalid or too many IDs, or an offer without business user
+        404: Any offer detail not found
+    """
+    serializer_class = OrderCheckoutSerializer
+    permission_classes = [IsAuthenticated, IsCustomerUser]
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        orders = serializer.save()
+        return Response(OrderListSerializer(orders, many=True).data, status=status.HTTP_201_CREATED)
+
+class OrderDetailView(ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     API view for retrieving, updating, and deleting individual orders.
     
@@ -121,6 +259,9 @@ class OrderDetailView(generics.RetrieveUpdateDestroyAPIView):
     Serializers:
         GET: OrderListSerializer (complete order data)
         PATCH/PUT: OrderUpdateSerializer (status updates only)
+
+    GET supports conditional requests (ETag / Last-Modified) validated by updated_at.
+    GET with ?include_archived=true also finds archived orders.
     """
     queryset = Order.objects.all()
     
@@ -166,28 +307,51 @@ class OrderDetailView(generics.RetrieveUpdateDestroyAPIView):
             404: If order not found
             403: If user lacks object-level permissions
         """
-        obj = get_object_or_404(self.get_queryset(), pk=self.kwargs['pk'])
+        obj = self.get_queryset().filter(pk=self.kwargs['pk']).first()
+        if obj is None and include_archived(self.request):
+            obj = ArchivedOrder.objects.filter(pk=self.kwargs['pk']).first()
+        if obj is None:
+            raise Http404("No Order matches the given query.")
         self.check_object_permissions(self.request, obj)
         return obj
 
+    def get_validator_object(self):
+        """
+        Return the timestamp lookup of the order, falling back to the archive if asked.
+        """
+        obj = super().get_validator_object()
+        if obj is None and include_archived(self.request):
+            obj = (
+                ArchivedOrder.objects.filter(pk=self.kwargs['pk'])
+                .annotate(last_modified=F(self.last_modified_field))
+                .only('pk', *self.validator_fields)
+                .first()
+            )
+        return obj
+
     def update(self, request, *args, **kwargs):
         """
         Update order status and return complete order data.
         
         Uses OrderUpdateSerializer for validation but returns complete order
         data using OrderListSerializer to match API documentation requirements.
+        The status is changed with a conditional UPDATE of status and
+        updated_at only (see orders_app.transitions.change_status).
         
         Args:
             request: HTTP request containing status update data
             
         Returns:
             Response: Complete updated order data with all fields
+
+        Raises:
+            409: Transition not allowed or order changed by a concurrent request
         """
         partial = kwargs.pop('partial', False)
         instance = self.get_object()
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
-        self.perform_update(serializer)
+        change_status(instance, serializer.validated_data.get('status', instance.status))
         
         full_serializer = OrderListSerializer(instance)
         return Response(full_serializer.data)
@@ -237,18 +401,11 @@ class OrderCountView(generics.RetrieveAPIView):
             
         Process:
             1. Extract business_user_id from URL parameters
-            2. Validate that user exists and has business profile type
-            3. Count orders with status 'in_progress' for that user
-            4. Return count as dictionary
+            2. Read the business profile and its order counter in one query
+            3. Return the 'in_progress' count as dictionary
         """
-        user_id = self.kwargs['business_user_id']
-        try:
-            user = Profile.objects.get(user__id=user_id, type='business').user
-        except Profile.DoesNotExist:
-            raise NotFound("No business user found with the specified ID.")
-        
-        order_count = Order.objects.filter(business_user=user, status='in_progress').count()
-        return {'order_count': order_count}
+        counts = get_order_counts(self.kwargs['business_user_id'])
+        return {'order_count': counts['in_progress']}
     
     def retrieve(self, request, *args, **kwargs):
         """
@@ -294,18 +451,11 @@ class CompletedOrderCountView(generics.RetrieveAPIView):
             
         Process:
             1. Extract business_user_id from URL parameters
-            2. Validate that user exists and has business profile type
-            3. Count orders with status 'completed' for that user
-            4. Return count as dictionary
+            2. Read the business profile and its order counter in one query
+            3. Return the 'completed' count as dictionary
         """
-        user_id = self.kwargs['business_user_id']
-        try:
-            user = Profile.objects.get(user__id=user_id, type='business').user
-        except Profile.DoesNotExist:
-            raise NotFound("No business user found with the specified ID.")
-        
-        completed_order_count = Order.objects.filter(business_user=user, status='completed').count()
-        return {'completed_order_count': completed_order_count}
+        counts = get_order_counts(self.kwargs['business_user_id'])
+        return {'completed_order_count': counts['completed']}
 
     def retrieve(self, request, *args, **kwargs):
         """
@@ -318,4 +468,61 @@ class CompletedOrderCountView(generics.RetrieveAPIView):
             Response: JSON response with completed order count and 200 status
         """
         instance = self.get_object()
-        return Response(instance, status=status.HTTP_200_OK)
\ No newline at end of file
+        return Response(instance, status=status.HTTP_200_OK)
+
+
+class OrderCountBatchView(APIView):
+    """
+    API view returning the order counts of many business users in one request.
+
+    Replaces one order-count and one completed-order-count request per
+    business user on directory pages. All counters are read with one query.
+
+    Permissions:
+        GET: Any authenticated user can view order counts
+
+    Query Parameters:
+        business_user_ids: Comma separated user IDs (at most max_ids)
+
+    Response Format:
+        {"<business_user_id>": {"order_count": int, "completed_order_count": int,
+                                "cancelled_order_count": int},
+         "<unknown or non-business id>": null}
+    """
+    permission_classes = [IsAuthenticated]
+    max_ids = 100
+
+    def get_business_user_ids(self, request):
+        """
+        Return the requested IDs in request order without duplicates.
+
+        Raises:
+            ValidationError: If the IDs are missing, not integers or too many
+        """
+        values = [
+            value.strip()
+            for param in request.query_params.getlist('business_user_ids')
+            for value in param.split(',') if value.strip()
+        ]
+        if not values:
+            raise ValidationError({'business_user_ids': "At least one business user ID is required."})
+        try:
+            ids = list(dict.fromkeys(int(value) for value in values))
+        except ValueError:
+            raise ValidationError({'business_user_ids': "Business user IDs must be numbers."})
+        if len(ids) > self.max_ids:
+            raise ValidationError({'business_user_ids': f"At most {self.max_ids} business user IDs are allowed."})
+        return ids
+
+    def get(self, request):
+        ids = self.get_business_user_ids(request)
+        counts = get_order_counts_for(ids)
+        data = {
+            str(user_id): {
+                'order_count': counts[user_id]['in_progress'],
+                'completed_order_count': counts[user_id]['completed'],
+                'cancelled_order_count': counts[user_id]['cancelled'],
+            } if user_id in counts else None
+            for user_id in ids
+        }
+        return Response(data, status=status.HTTP_200_OK)
@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from .counters import keep_counts
+from .models import ArchivedOrder, Order
+
+FINISHED_STATUSES = ['completed', 'cancelled']
+ARCHIVED_FIELDS = [field.attname for field in Order._meta.concrete_fields]
+
+
+def get_archive_after_days():
+    return getattr(settings, 'ORDER_ARCHIVE_AFTER_DAYS', 90)
+
+
+def get_archive_batch_size():
+    return getattr(settings, 'ORDER_ARCHIVE_BATCH_SIZE', 1000)
+
+
+def get_archivable_orders(days=None):
+    """
+    Return finished orders whose last change is older than the given number of days.
+    """
+    days = get_archive_after_days() if days is None else days
+    cutoff = timezone.now() - timedelta(days=days)
+    return Order.objects.filter(status__in=FINISHED_STATUSES, updated_at__lt=cutoff)
+
+
+def archive_orders(days=None, batch_size=None):
+    """
+    Move finished orders older than `days` from Order to ArchivedOrder in batches.
+
+    Every batch is copied with one bulk_create and deleted in its own
+    transaction, so a batch is either in the hot table or in the archive and
+    the write lock is only held per batch. Batches walk the primary key, so
+    each one continues where the previous one stopped. The business order
+    counters are left unchanged because archived orders are still counted.
+
+    Returns:
+        int: Number of archived orders
+    """
+    batch_size = get_archive_batch_size() if batch_size is None else batch_size
+    orders = get_archivable_orders(days).order_by('pk')
+    archived = 0
+    last_pk = 0
+    while True:
+        with transaction.atomic():
+            rows = list(orders.filter(pk__gt=last_pk).values(*ARCHIVED_FIELDS)[:batch_size])
+            if not rows:
+                return archived
+            ArchivedOrder.objects.bulk_create([ArchivedOrder(**row) for row in rows])
+            with keep_counts():
+                Order.objects.filter(pk__in=[row['id'] for row in rows]).delete()
+        archived += len(rows)
+        last_pk = rows[-1]['id']
+
+
+def get_archive_queryset(queryset):
+    """
+    Return all archived orders in the shape of an order queryset.
+
+    The archived orders get the same values() keys or the same deferred
+    fields (e.g. from ?fields= sparse fieldsets), so both select the same
+    columns and can be combined with union().
+    """
+    archived = ArchivedOrder.objects.all()
+    field_names, defer = queryset.query.deferred_loading
+    if field_names:
+        archived = archived.defer(*field_names) if defer else archived.only(*field_names)
+    if queryset._fields is not None:
+        archived = archived.values(*queryset._fields)
+    return archived
@@ -0,0 +1,129 @@
+import threading
+from contextlib import contextmanager
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+from rest_framework.exceptions import NotFound
+from user_profile.models import Profile
+from .models import ArchivedOrder, BusinessOrderCounter, Order
+
+_state = threading.local()
+
+
+@contextmanager
+def keep_counts():
+    """
+    Leave the counters unchanged for orders deleted inside the block.
+
+    Used when orders are moved rather than removed, e.g. into the archive.
+    """
+    _state.keep = True
+    try:
+        yield
+    finally:
+        _state.keep = False
+
+
+def keeping_counts():
+    return getattr(_state, 'keep', False)
+
+
+def adjust_counter(business_user_id, status, delta):
+    """
+    Add delta to the counter of one status of a business user with a single F() update.
+
+    The counter row is created on first use. If a concurrent request creates
+    it first, the increment is applied to that row instead.
+    """
+    if business_user_id is None or status not in BusinessOrderCounter.STATUS_FIELDS:
+        return
+    counters = BusinessOrderCounter.objects.filter(pk=business_user_id)
+    if counters.update(**{status: F(status) + delta}):
+        return
+    try:
+        with transaction.atomic():
+            BusinessOrderCounter.objects.create(business_user_id=business_user_id, **{status: delta})
+    except IntegrityError:
+        counters.update(**{status: F(status) + delta})
+
+
+COUNTER_LOOKUPS = [f'user__order_counter__{status}' for status in BusinessOrderCounter.STATUS_FIELDS]
+
+
+def get_order_counts(business_user_id):
+    """
+    Return the order counts per status of a business user with one indexed lookup.
+
+    Raises:
+        NotFound: If no business user exists with the given ID
+    """
+    row = Profile.objects.filter(user_id=business_user_id, type='business').values_list(*COUNTER_LOOKUPS).first()
+    if row is None:
+        raise NotFound("No business user found with the specified ID.")
+    return {status: count or 0 for status, count in zip(BusinessOrderCounter.STATUS_FIELDS, row)}
+
+
+def get_order_counts_for(business_user_ids):
+    """
+    Return the order counts per status of many business users with one query.
+
+    Returns:
+        dict: {business_user_id: {status: count}}, without IDs that are not business users
+    """
+    rows = Profile.objects.filter(user_id__in=business_user_ids, type='business').values_list('user_id', *COUNTER_LOOKUPS)
+    return {
+        user_id: {status: count or 0 for status, count in zip(BusinessOrderCounter.STATUS_FIELDS, counts)}
+        for user_id, *counts in rows
+    }
+
+
+def count_orders():
+    """
+    Return the actual order counts per status of every business user, computed from the current and archived orders.
+    """
+    counts = {}
+    for model in (Order, ArchivedOrder):
+        rows = (
+            model.objects.filter(business_user__isnull=False)
+            .values_list('business_user', 'status').annotate(count=Count('id')).order_by()
+        )
+        for business_user_id, status, count in rows:
+            counts.setdefault(business_user_id, dict.fromkeys(BusinessOrderCounter.STATUS_FIELDS, 0))
+            if status in counts[business_user_id]:
+                counts[business_user_id][status] += count
+    return counts
+
+
+def find_drift():
+    """
+    Return {business_user_id: (stored, expected)} for every counter that differs from the orders.
+    """
+    expected = count_orders()
+    zero = dict.fromkeys(BusinessOrderCounter.STATUS_FIELDS, 0)
+    stored = {
+        row.pop('business_user'): row
+        for row in BusinessOrderCounter.objects.values('business_user', *BusinessOrderCounter.STATUS_FIELDS)
+    }
+    return {
+        business_user_id: (stored.get(business_user_id, zero), expected.get(business_user_id, zero))
+        for business_user_id in stored.keys() | expected.keys()
+        if stored.get(business_user_id, zero) != expected.get(business_user_id, zero)
+    }
+
+
+def reconcile_counters():
+    """
+    Overwrite drifted counters with the counts computed from the orders.
+
+    Returns:
+        int: Number of repaired counters
+    """
+    with transaction.atomic():
+        drift = find_drift()
+        BusinessOrderCounter.objects.bulk_create(
+            [BusinessOrderCounter(business_user_id=pk, **expected) for pk, (_, expected) in drift.items()],
+            update_conflicts=True,
+            unique_fields=['business_user'],
+            update_fields=BusinessOrderCounter.STATUS_FIELDS,
+        )
+    return len(drift)
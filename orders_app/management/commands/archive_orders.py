@@ -0,0 +1,52 @@
+import time
+
+from django.core.management.base import BaseCommand
+from orders_app.archive import archive_orders, get_archivable_orders, get_archive_after_days, get_archive_batch_size
+
+
+class Command(BaseCommand):
+    """
+    Move completed and cancelled orders older than ORDER_ARCHIVE_AFTER_DAYS into the order archive.
+
+    Runs once by default, e.g. from cron. With --interval the command keeps
+    running and archives again every given number of seconds.
+
+    Usage:
+        python manage.py archive_orders
+        python manage.py archive_orders --days 30 --batch-size 500
+        python manage.py archive_orders --dry-run
+        python manage.py archive_orders --interval 3600
+    """
+    help = "Moves finished orders older than the configured age from the order table into the archive table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days', type=int, default=None,
+            help="Archive orders finished more than this many days ago (default: ORDER_ARCHIVE_AFTER_DAYS).",
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=None,
+            help="Number of orders moved per transaction (default: ORDER_ARCHIVE_BATCH_SIZE).",
+        )
+        parser.add_argument(
+            '--dry-run', action='store_true',
+            help="Only report how many orders would be archived.",
+        )
+        parser.add_argument(
+            '--interval', type=int, default=None,
+            help="Keep running and archive every INTERVAL seconds.",
+        )
+
+    def handle(self, *args, **options):
+        days = get_archive_after_days() if options['days'] is None else options['days']
+        batch_size = get_archive_batch_size() if options['batch_size'] is None else options['batch_size']
+        if options['dry_run']:
+            count = get_archivable_orders(days).count()
+            self.stdout.write(f"{count} finished orders older than {days} days would be archived.")
+            return
+        while True:
+            archived = archive_orders(days, batch_size)
+            self.stdout.write(self.style.SUCCESS(f"Archived {archived} finished orders older than {days} days."))
+            if options['interval'] is None:
+                return
+            time.sleep(options['interval'])
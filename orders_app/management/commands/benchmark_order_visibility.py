@@ -0,0 +1,84 @@
+import random
+import statistics
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from orders_app.api.views import OrderKeysetPagination, OrderListView
+from orders_app.models import Order
+
+
+class Command(BaseCommand):
+    """
+    Compare the first order list page read with the OR visibility query and with the UNION ALL branches.
+
+    Generates users and orders inside a transaction that is rolled back
+    afterwards and pages the same visible orders through OrderKeysetPagination
+    once as a single OR query and once split per role like OrderListView.
+    Reports the median and maximum latency for business users and customers.
+
+    Usage:
+        python manage.py benchmark_order_visibility --orders 1000000 --runs 20
+    """
+    help = "Benchmarks the OR order visibility query against the per-role UNION ALL."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--orders', type=int, default=1000000, help="Number of orders to generate.")
+        parser.add_argument('--business-users', type=int, default=500, help="Number of business users.")
+        parser.add_argument('--customers', type=int, default=20000, help="Number of customers.")
+        parser.add_argument('--runs', type=int, default=20, help="Number of users timed per role.")
+        parser.add_argument('--page-size', type=int, default=20, help="Number of orders per page.")
+
+    def handle(self, *args, **options):
+        random.seed(42)
+        with transaction.atomic():
+            business_users, customers = self.create_data(options)
+            for role, users in [('business users', business_users), ('customers', customers)]:
+                sample = random.sample(users, min(options['runs'], len(users)))
+                for name, split in [('OR', False), ('UNION ALL', True)]:
+                    timings = [self.time_page(user, split, options['page_size']) for user in sample]
+                    self.stdout.write(
+                        f"{role}, {name}: median {statistics.median(timings):.2f} ms, "
+                        f"max {max(timings):.2f} ms over {len(timings)} users"
+                    )
+            transaction.set_rollback(True)
+
+    def create_data(self, options, batch_size=10000):
+        """
+        Bulk create business users, customers and orders between random pairs of them.
+        """
+        business_users = User.objects.bulk_create([
+            User(username=f'benchmark-business-{index}') for index in range(options['business_users'])
+        ])
+        customers = User.objects.bulk_create([
+            User(username=f'benchmark-customer-{index}') for index in range(options['customers'])
+        ])
+        count = options['orders']
+        for start in range(0, count, batch_size):
+            Order.objects.bulk_create([
+                Order(
+                    customer_user=random.choice(customers), business_user=random.choice(business_users),
+                    title='Benchmark order', revisions=1, delivery_time_in_days=5, price='99.90',
+                    features=['Feature'], offer_type='basic',
+                    status=random.choice(['in_progress', 'completed', 'cancelled']),
+                )
+                for _ in range(min(batch_size, count - start))
+            ])
+        self.stdout.write(f"Generated {count} orders.")
+        return business_users, customers
+
+    def time_page(self, user, split, page_size):
+        """
+        Return the milliseconds needed to read the user's first page of orders.
+        """
+        request = Request(APIRequestFactory().get('/api/orders/', {'page_size': page_size}, HTTP_HOST='localhost'))
+        request.user = user
+        view = OrderListView(request=request, format_kwarg=None) if split else None
+        queryset = Order.objects.filter(Q(customer_user=user) | Q(business_user=user))
+        started = time.perf_counter()
+        OrderKeysetPagination().paginate_queryset(queryset, request, view)
+        return (time.perf_counter() - started) * 1000
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+from orders_app.counters import find_drift, reconcile_counters
+
+
+class Command(BaseCommand):
+    """
+    Repair or check the per-business order counters behind order-count and completed-order-count.
+
+    Usage:
+        python manage.py reconcile_order_counters
+        python manage.py reconcile_order_counters --check
+    """
+    help = "Recounts the orders per business user and status and repairs drifted counters."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help="Only report business users whose counters are out of sync, without changing them.",
+        )
+
+    def handle(self, *args, **options):
+        if options['check']:
+            self.check_counters()
+        else:
+            repaired = reconcile_counters()
+            self.stdout.write(self.style.SUCCESS(f"Repaired the order counters of {repaired} business users."))
+
+    def check_counters(self):
+        """
+        Compare the stored counters with the counts computed from the orders.
+
+        Raises:
+            CommandError: If at least one counter is out of sync
+        """
+        drift = find_drift()
+        if drift:
+            details = ', '.join(
+                f"{business_user_id}: stored {stored}, expected {expected}"
+                for business_user_id, (stored, expected) in sorted(drift.items())
+            )
+            raise CommandError(f"{len(drift)} business users have out of sync order counters: {details}")
+        self.stdout.write(self.style.SUCCESS("All business order counters are in sync."))
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.5 on 2026-10-17 05:16
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_order_counters(apps, schema_editor):
+    Order = apps.get_model('orders_app', 'Order')
+    BusinessOrderCounter = apps.get_model('orders_app', 'BusinessOrderCounter')
+
+    counters = {}
+    rows = (
+        Order.objects.filter(business_user__isnull=False)
+        .values_list('business_user', 'status').annotate(count=Count('id')).order_by()
+    )
+    for business_user_id, status, count in rows:
+        counter = counters.setdefault(business_user_id, BusinessOrderCounter(business_user_id=business_user_id))
+        if status in ('in_progress', 'completed', 'cancelled'):
+            setattr(counter, status, count)
+    BusinessOrderCounter.objects.bulk_create(counters.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('orders_app', '0003_order_business_created_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BusinessOrderCounter',
+            fields=[
+                ('business_user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='order_counter', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('in_progress', models.IntegerField(default=0)),
+                ('completed', models.IntegerField(default=0)),
+                ('cancelled', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(populate_order_counters, migrations.RunPython.noop),
+    ]
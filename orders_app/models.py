@@ -8,6 +8,10 @@ class Order(models.Model):
         ('completed', 'Completed'),
         ('cancelled', 'Cancelled'),
     ]
+    # Allowed status changes; completed and cancelled orders are final.
+    STATUS_TRANSITIONS = {
+        'in_progress': {'completed', 'cancelled'},
+    }
 
     customer_user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='customer_orders', null=True, blank=True)
     business_user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='business_orders', null=True, blank=True)
@@ -21,5 +25,80 @@ class Order(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['business_user', 'status'], name='order_business_status_idx'),
+            models.Index(fields=['customer_user', 'created_at'], name='order_customer_created_idx'),
+            models.Index(fields=['business_user', 'created_at'], name='order_business_created_idx'),
+        ]
+
+    def __str__(self):
+        return self.title
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Remember the loaded business user and status, so that saving the order
+        can move it between the order counters without reading them again.
+        """
+        instance = super().from_db(db, field_names, values)
+        loaded = instance.__dict__
+        if 'business_user_id' in loaded and 'status' in loaded:
+            instance._counted = (loaded['business_user_id'], loaded['status'])
+        return instance
+
+class BusinessOrderCounter(models.Model):
+    """
+    Number of orders per status of a business user.
+
+    Kept up to date by orders_app.signals with F() increments whenever an
+    order is created, changes its status or is deleted. Archived orders stay
+    counted until they are deleted from the archive. Writes that bypass
+    model signals (e.g. bulk_create or queryset.update()) are repaired by
+    the reconcile_order_counters management command.
+    """
+    business_user = models.OneToOneField(
+        User, primary_key=True, on_delete=models.CASCADE, related_name='order_counter'
+    )
+    in_progress = models.IntegerField(default=0)
+    completed = models.IntegerField(default=0)
+    cancelled = models.IntegerField(default=0)
+
+    STATUS_FIELDS = [status for status, _ in Order.STATUS_CHOICES]
+
+    def __str__(self):
+        return f"Order counter of user {self.business_user_id}"
+
+
+class ArchivedOrder(models.Model):
+    """
+    Finished order moved out of the Order table by the archive_orders command.
+
+    Has the same columns, in the same order, as Order and keeps the order's
+    ID, so archived and current orders can be read with one UNION ALL and
+    order URLs stay valid. Archived orders are read only and still counted
+    by BusinessOrderCounter.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    customer_user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_customer_orders', null=True, blank=True)
+    business_user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_business_orders', null=True, blank=True)
+    title = models.CharField(max_length=50)
+    revisions = models.IntegerField()
+    delivery_time_in_days = models.IntegerField()
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+    features = models.JSONField(blank=True, default=list)
+    offer_type = models.CharField(max_length=20)
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        # Unlike Order.id, a bigint primary key is not SQLite's rowid, so the
+        # (created_at, id) keyset needs id in the index to avoid a sort.
+        indexes = [
+            models.Index(fields=['customer_user', 'created_at', 'id'], name='archived_customer_created_idx'),
+            models.Index(fields=['business_user', 'created_at', 'id'], name='archived_business_created_idx'),
+        ]
+
     def __str__(self):
-        return self.title
\ No newline at end of file
+        return self.title
@@ -0,0 +1,61 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from .counters import adjust_counter, keeping_counts
+from .models import ArchivedOrder, Order
+
+
+COUNTED_FIELDS = {'business_user', 'status'}
+
+
+def writes_counted_fields(update_fields):
+    return update_fields is None or bool(COUNTED_FIELDS.intersection(update_fields))
+
+
+@receiver(pre_save, sender=Order)
+def remember_counted_status(sender, instance, raw=False, update_fields=None, **kwargs):
+    """
+    Remember the stored business user and status of an existing order before it is saved.
+
+    Orders loaded from the database already carry them (see Order.from_db),
+    so only orders built by hand are read again. Saves restricted to other
+    fields cannot change the counters and are skipped.
+    """
+    if raw or instance._state.adding:
+        instance._counted = None
+        return
+    if not writes_counted_fields(update_fields) or getattr(instance, '_counted', None) is not None:
+        return
+    instance._counted = Order.objects.filter(pk=instance.pk).values_list('business_user', 'status').first()
+
+
+@receiver(post_save, sender=Order)
+def count_saved_order(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    """
+    Move the order between the business order counters when it is created or its status changes.
+    """
+    if raw or not (created or writes_counted_fields(update_fields)):
+        return
+    current = (instance.business_user_id, instance.status)
+    previous = None if created else getattr(instance, '_counted', None)
+    if previous is not None and update_fields is not None:
+        current = (
+            current[0] if 'business_user' in update_fields else previous[0],
+            current[1] if 'status' in update_fields else previous[1],
+        )
+    instance._counted = current
+    if previous == current:
+        return
+    if previous is not None:
+        adjust_counter(*previous, -1)
+    adjust_counter(*current, 1)
+
+
+@receiver(post_delete, sender=Order)
+@receiver(post_delete, sender=ArchivedOrder)
+def count_deleted_order(sender, instance, **kwargs):
+    """
+    Remove a deleted order from its business user's counter, unless it is moved (see keep_counts).
+    """
+    if keeping_counts():
+        return
+    adjust_counter(instance.business_user_id, instance.status, -1)
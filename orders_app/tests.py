@@ -2,9 +2,42 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 from django.urls import reverse
 from django.contrib.auth.models import User
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import DatabaseError, connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from user_profile.models import Profile
+from offers_app.detail_cache import offer_detail_cache
 from offers_app.models import Offer, OfferDetail
-from orders_app.models import Order
+from orders_app.api.views import OrderDetailView
+from orders_app.models import ArchivedOrder, BusinessOrderCounter, Order
+
+
+class UserFixtureMixin:
+    """
+    Creates the users and profiles most test cases in this module start from.
+    """
+
+    def create_user(self, username, profile_type):
+        """
+        Create a user whose email is its username, together with a profile of the given type.
+        """
+        user = User.objects.create_user(username=username, email=username, password='testpassword')
+        Profile.objects.create(user=user, type=profile_type)
+        return user
+
+    def create_customer_and_business(self):
+        """
+        Create a customer user and a business user.
+        """
+        self.customer_user = self.create_user('customer@example.com', 'customer')
+        self.business_user = self.create_user('business@example.com', 'business')
+
 
 class OrderTests(APITestCase):
     """
@@ -99,8 +132,8 @@ class OrderTests(APITestCase):
         self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.customer_token}')
         response = self.client.get(reverse('order-list'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['id'], self.order.id)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['id'], self.order.id)
 
     def test_authenticated_user_can_list_their_orders_as_business_user(self):
         """
@@ -109,8 +142,8 @@ class OrderTests(APITestCase):
         self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.business_token}')
         response = self.client.get(reverse('order-list'))
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['id'], self.order.id)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['id'], self.order.id)
 
     def test_unauthenticated_cannot_list_orders(self):
         """
@@ -230,4 +263,765 @@ class OrderTests(APITestCase):
         Ensures that a request with an invalid ID returns a 404 error.
         """
         self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.customer_token}')
-        response = self.client
\ No newline at end of file
+        response = self.client
+
+class OrderConditionalGetTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for ETag / Last-Modified support of the order detail endpoint.
+    """
+
+    def setUp(self):
+        """
+        Create a customer, a business user and an order between them.
+        """
+        self.create_customer_and_business()
+        self.order = Order.objects.create(
+            customer_user=self.customer_user, business_user=self.business_user, title='Order',
+            revisions=1, delivery_time_in_days=2, price=100, features=[], offer_type='basic'
+        )
+        self.url = reverse('order-detail', kwargs={'pk': self.order.id})
+
+    def test_order_not_modified_until_status_changes(self):
+        """
+        Ensures that a cached order copy is validated until its status is updated.
+        """
+        self.client.force_authenticate(user=self.customer_user)
+        etag = self.client.get(self.url)['ETag']
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.force_authenticate(user=self.business_user)
+        self.client.patch(self.url, {'status': 'completed'}, format='json')
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'completed')
+
+
+class OrderReadPathParityTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite ensuring the values() read path renders the order list byte for byte like OrderListSerializer.
+    """
+
+    def setUp(self):
+        """
+        Create orders in every status, including one without customer.
+        """
+        self.create_customer_and_business()
+        for index, order_status in enumerate(['in_progress', 'completed', 'cancelled', 'in_progress']):
+            Order.objects.create(
+                customer_user=self.customer_user if index else None, business_user=self.business_user,
+                title=f'Auftrag {index} – Logo', revisions=index, delivery_time_in_days=index + 1,
+                price=f'{index}99.9', features=['Vektor', 'Ü'] if index else [], offer_type='premium',
+                status=order_status
+            )
+
+    def test_list_output_is_identical(self):
+        """
+        Ensures that both paths return identical bytes for customer and business users.
+        """
+        for user in [self.customer_user, self.business_user]:
+            self.client.force_authenticate(user=user)
+            bodies = []
+            for enabled in [False, True]:
+                with override_settings(VALUES_READ_PATH=enabled):
+                    response = self.client.get(reverse('order-list'))
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                bodies.append(response.content)
+            self.assertEqual(bodies[0], bodies[1])
+            self.assertEqual(len(response.data['results']), 3 if user == self.customer_user else 4)
+
+
+class OrderSparseFieldsTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for ?fields= sparse fieldsets on the order list.
+    """
+
+    def setUp(self):
+        """
+        Create an order between a customer and a business user.
+        """
+        self.create_customer_and_business()
+        Order.objects.create(
+            customer_user=self.customer_user, business_user=self.business_user, title='Order',
+            revisions=1, delivery_time_in_days=2, price=100, features=['Logo'], offer_type='basic'
+        )
+        self.client.force_authenticate(user=self.customer_user)
+
+    def test_fields_trim_response_and_columns(self):
+        """
+        Ensures that only the requested fields are returned and selected, on both read paths.
+        """
+        for enabled in [True, False]:
+            with self.subTest(values_read_path=enabled), override_settings(VALUES_READ_PATH=enabled):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(reverse('order-list'), {'fields': 'id,status,price'})
+                self.assertEqual(response.data['results'], [{'id': 1, 'price': '100.00', 'status': 'in_progress'}])
+                self.assertEqual(len(queries), 1)
+                self.assertNotIn('features', queries[0]['sql'])
+
+
+class OrderOfferDetailFreshReadTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for order creation reading offer details fresh instead of from the offer detail cache.
+    """
+
+    def setUp(self):
+        """
+        Set up a customer and a business user with an offer detail.
+        """
+        offer_detail_cache.clear()
+        self.create_customer_and_business()
+        offer = Offer.objects.create(user=self.business_user, title='Test Offer')
+        self.offer_detail = OfferDetail.objects.create(
+            offer=offer, title='Basic', revisions=3, delivery_time_in_days=5,
+            price=150, features=['Feature 1'], offer_type='basic'
+        )
+        self.client.force_authenticate(user=self.customer_user)
+
+    def create_order(self):
+        return self.client.post(reverse('order-list'), {'offer_detail_id': self.offer_detail.id}, format='json')
+
+    def test_create_ignores_a_stale_cache_entry(self):
+        """
+        Ensures that orders copy the current price even while the offer detail cache holds an older one.
+        """
+        detail_url = reverse('offerdetail-detail', kwargs={'pk': self.offer_detail.id})
+        self.assertEqual(self.client.get(detail_url).data['price'], '150.00')
+        # queryset.update() sends no signals, so the cached entry keeps the old price
+        OfferDetail.objects.filter(pk=self.offer_detail.pk).update(price=200, features=['Feature 2'])
+        self.assertEqual(self.client.get(detail_url).data['price'], '150.00')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.create_order()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(sum('offers_app_offerdetail' in query['sql'] for query in queries), 1)
+        self.assertEqual(response.data['business_user'], self.business_user.id)
+        self.assertEqual(response.data['price'], '200.00')
+        self.assertEqual(response.data['features'], ['Feature 2'])
+
+    def test_create_uses_updated_price(self):
+        """
+        Ensures that orders copy the new price after the offer detail changes.
+        """
+        self.create_order()
+        self.offer_detail.price = 200
+        self.offer_detail.save()
+        self.assertEqual(self.create_order().data['price'], '200.00')
+
+
+class OrderKeysetPaginationTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for keyset cursor pagination of the order list.
+    """
+
+    def setUp(self):
+        """
+        Create seven orders of one customer and one order of another customer.
+        """
+        self.customer_user = self.create_user('customer@example.com', 'customer')
+        other_customer = self.create_user('other@example.com', 'customer')
+        self.business_user = self.create_user('business@example.com', 'business')
+        for index, customer in enumerate([self.customer_user] * 7 + [other_customer]):
+            Order.objects.create(
+                customer_user=customer, business_user=self.business_user, title=f'Order {index}',
+                revisions=1, delivery_time_in_days=2, price=100, offer_type='basic'
+            )
+        self.client.force_authenticate(user=self.customer_user)
+
+    def collect_pages(self, params):
+        """
+        Follow the next links and return the order ids of every page.
+        """
+        pages = []
+        response = self.client.get(reverse('order-list'), params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append([order['id'] for order in response.data['results']])
+            if not response.data['next']:
+                return pages
+            response = self.client.get(response.data['next'])
+
+    def test_pages_cover_all_visible_orders_newest_first(self):
+        """
+        Ensures that following the cursors returns every visible order exactly once, newest first.
+        """
+        for enabled in [True, False]:
+            with self.subTest(values_read_path=enabled), override_settings(VALUES_READ_PATH=enabled):
+                pages = self.collect_pages({'page_size': 3})
+                self.assertEqual([len(page) for page in pages], [3, 3, 1])
+                expected = Order.objects.filter(customer_user=self.customer_user).order_by('-created_at', '-id')
+                self.assertEqual(sum(pages, []), list(expected.values_list('id', flat=True)))
+
+    def test_page_size_defaults_and_limit_are_configurable(self):
+        """
+        Ensures that ORDER_LIST_PAGE_SIZE sets the default and ORDER_LIST_MAX_PAGE_SIZE caps page_size.
+        """
+        with override_settings(ORDER_LIST_PAGE_SIZE=4, ORDER_LIST_MAX_PAGE_SIZE=5):
+            self.assertEqual(len(self.client.get(reverse('order-list')).data['results']), 4)
+            self.assertEqual(len(self.client.get(reverse('order-list'), {'page_size': 50}).data['results']), 5)
+
+    def test_deep_page_costs_one_query(self):
+        """
+        Ensures that every cursor page is read with a single query and no COUNT.
+        """
+        response = self.client.get(reverse('order-list'), {'page_size': 2})
+        while response.data['next']:
+            with self.assertNumQueries(1):
+                response = self.client.get(response.data['next'])
+        self.assertNotIn('count', response.data)
+
+    def test_pagination_can_be_disabled(self):
+        """
+        Ensures that ORDER_LIST_PAGINATION = False returns the full list without pagination.
+        """
+        with override_settings(ORDER_LIST_PAGINATION=False):
+            response = self.client.get(reverse('order-list'))
+        self.assertEqual(len(response.data), 7)
+        self.assertIsInstance(response.data, list)
+
+    def test_pages_merge_both_roles_without_duplicates(self):
+        """
+        Ensures that a user's orders as customer and as business user are paged together,
+        with orders they placed with themselves listed once.
+        """
+        Order.objects.create(
+            customer_user=self.business_user, business_user=self.business_user, title='Own order',
+            revisions=1, delivery_time_in_days=2, price=100, offer_type='basic'
+        )
+        Order.objects.create(
+            customer_user=None, business_user=self.business_user, title='Guest order',
+            revisions=1, delivery_time_in_days=2, price=100, offer_type='basic'
+        )
+        self.client.force_authenticate(user=self.business_user)
+        pages = self.collect_pages({'page_size': 4})
+        expected = Order.objects.order_by('-created_at', '-id').values_list('id', flat=True)
+        self.assertEqual(sum(pages, []), list(expected))
+
+
+class BusinessOrderCounterTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for the per-business order counters behind the order count endpoints.
+    """
+
+    def setUp(self):
+        """
+        Set up a customer, a business user with an offer detail and an admin.
+        """
+        self.create_customer_and_business()
+        self.admin_user = User.objects.create_superuser(username='admin', password='testpassword')
+        offer = Offer.objects.create(user=self.business_user, title='Test Offer')
+        self.offer_detail = OfferDetail.objects.create(
+            offer=offer, title='Basic', revisions=3, delivery_time_in_days=5,
+            price=150, features=[], offer_type='basic'
+        )
+
+    def get_counts(self):
+        kwargs = {'business_user_id': self.business_user.id}
+        with self.assertNumQueries(1):
+            order_count = self.client.get(reverse('order-count', kwargs=kwargs)).data['order_count']
+        with self.assertNumQueries(1):
+            completed = self.client.get(reverse('completed-order-count', kwargs=kwargs)).data['completed_order_count']
+        return order_count, completed
+
+    def test_counters_follow_create_status_change_and_delete(self):
+        """
+        Ensures that both endpoints reflect created, completed and deleted orders with one query each.
+        """
+        self.client.force_authenticate(user=self.customer_user)
+        self.assertEqual(self.get_counts(), (0, 0))
+        order_ids = [
+            self.client.post(reverse('order-list'), {'offer_detail_id': self.offer_detail.id}, format='json').data['id']
+            for _ in range(3)
+        ]
+        self.assertEqual(self.get_counts(), (3, 0))
+
+        self.client.force_authenticate(user=self.business_user)
+        response = self.client.patch(reverse('order-detail', kwargs={'pk': order_ids[0]}), {'status': 'completed'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_counts(), (2, 1))
+
+        self.client.force_authenticate(user=self.admin_user)
+        self.client.delete(reverse('order-detail', kwargs={'pk': order_ids[0]}))
+        self.client.delete(reverse('order-detail', kwargs={'pk': order_ids[1]}))
+        self.assertEqual(self.get_counts(), (1, 0))
+
+    def test_saving_a_loaded_order_does_not_read_its_status_again(self):
+        """
+        Ensures that saving a loaded order moves it between the counters without an extra SELECT,
+        and that saves of other fields leave the counters alone.
+        """
+        order = Order.objects.create(
+            customer_user=self.customer_user, business_user=self.business_user, title='Order',
+            revisions=1, delivery_time_in_days=2, price=100, offer_type='basic'
+        )
+        order = Order.objects.get(pk=order.pk)
+        order.title = 'Renamed'
+        with self.assertNumQueries(1):
+            order.save(update_fields=['title'])
+        order.status = 'completed'
+        with CaptureQueriesContext(connection) as queries:
+            order.save()
+        self.assertFalse([query for query in queries if query['sql'].startswith('SELECT')])
+        self.client.force_authenticate(user=self.customer_user)
+        self.assertEqual(self.get_counts(), (0, 1))
+        order.save()
+        self.assertEqual(self.get_counts(), (0, 1))
+
+    def test_non_business_user_returns_404(self):
+        """
+        Ensures that counts of customers or unknown users still return 404.
+        """
+        self.client.force_authenticate(user=self.customer_user)
+        for user_id in [self.customer_user.id, 9999]:
+            response = self.client.get(reverse('order-count', kwargs={'business_user_id': user_id}))
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_reconcile_command_repairs_drift(self):
+        """
+        Ensures that counters drifted by writes bypassing signals are reported and repaired.
+        """
+        Order.objects.create(
+            customer_user=self.customer_user, business_user=self.business_user, title='Order',
+            revisions=1, delivery_time_in_days=2, price=100, offer_type='basic'
+        )
+        Order.objects.bulk_create([
+            Order(customer_user=self.customer_user, business_user=self.business_user, title='Order',
+                  revisions=1, delivery_time_in_days=2, price=100, offer_type='basic', status='completed')
+        ])
+        Order.objects.filter(status='in_progress').update(status='cancelled')
+        with self.assertRaisesMessage(CommandError, '1 business users have out of sync order counters'):
+            call_command('reconcile_order_counters', '--check', stdout=StringIO())
+
+        stdout = StringIO()
+        call_command('reconcile_order_counters', stdout=stdout)
+        self.assertIn('Repaired the order counters of 1 business users', stdout.getvalue())
+        counter = BusinessOrderCounter.objects.get(business_user=self.business_user)
+        self.assertEqual((counter.in_progress, counter.completed, counter.cancelled), (0, 1, 1))
+        call_command('reconcile_order_counters', '--check', stdout=StringIO())
+
+
+class OrderCountBatchTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for the batch order count endpoint.
+    """
+
+    def setUp(self):
+        """
+        Set up two business users with orders in different states and a customer.
+        """
+        self.customer_user = self.create_user('customer@example.com', 'customer')
+        self.business_users = []
+        for index, statuses in enumerate([['in_progress', 'in_progress', 'completed'], ['cancelled']]):
+            business_user = self.create_user(f'business{index}@example.com', 'business')
+            for order_status in statuses:
+                Order.objects.create(
+                    customer_user=self.customer_user, business_user=business_user, title='Order',
+                    revisions=1, delivery_time_in_days=2, price=100, offer_type='basic', status=order_status
+                )
+            self.business_users.append(business_user)
+        self.client.force_authenticate(user=self.customer_user)
+
+    def test_batch_matches_single_endpoints_with_one_query(self):
+        """
+        Ensures that every per-id result matches order-count and completed-order-count.
+        """
+        ids = [user.id for user in self.business_users] + [self.customer_user.id, 9999]
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('order-count-batch'), {'business_user_ids': ','.join(map(str, ids))})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(response.data), [str(user_id) for user_id in ids])
+        for user in self.business_users:
+            kwargs = {'business_user_id': user.id}
+            result = response.data[str(user.id)]
+            self.assertEqual(result['order_count'], self.client.get(reverse('order-count', kwargs=kwargs)).data['order_count'])
+            self.assertEqual(
+                result['completed_order_count'],
+                self.client.get(reverse('completed-order-count', kwargs=kwargs)).data['completed_order_count']
+            )
+        self.assertEqual(response.data[str(self.business_users[1].id)]['cancelled_order_count'], 1)
+        self.assertIsNone(response.data[str(self.customer_user.id)])
+        self.assertIsNone(response.data['9999'])
+
+    def test_invalid_or_too_many_ids_return_400(self):
+        """
+        Ensures that missing, non-numeric and more than max_ids IDs are rejected.
+        """
+        for params in [{}, {'business_user_ids': '1,abc'}, {'business_user_ids': ','.join(map(str, range(1, 102)))}]:
+            with self.subTest(params=params):
+                response = self.client.get(reverse('order-count-batch'), params)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class OrderCreateQueryBudgetTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for the number of queries needed to place an order.
+    """
+
+    def setUp(self):
+        """
+        Set up a customer and a business user with an offer detail.
+        """
+        offer_detail_cache.clear()
+        self.create_customer_and_business()
+        offer = Offer.objects.create(user=self.business_user, title='Test Offer')
+        self.offer_detail = OfferDetail.objects.create(
+            offer=offer, title='Basic', revisions=3, delivery_time_in_days=5,
+            price=150, features=['Feature 1'], offer_type='basic'
+        )
+        self.client.force_authenticate(user=User.objects.get(pk=self.customer_user.pk))
+
+    def create_order(self):
+        return self.client.post(reverse('order-list'), {'offer_detail_id': self.offer_detail.id}, format='json')
+
+    def test_create_stays_within_query_budget(self):
+        """
+        Ensures that placing an order reads the offer detail with one joined query and stays within a fixed budget.
+        """
+        # Profile check, savepoint, offer detail with its offer, order insert,
+        # counter update, counter insert in its own savepoint, release.
+        with self.assertNumQueries(9) as queries:
+            response = self.create_order()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        reads = [query['sql'] for query in queries if 'offers_app_offerdetail' in query['sql']]
+        self.assertEqual(len(reads), 1)
+        self.assertIn('INNER JOIN "offers_app_offer"', reads[0])
+        self.assertNotIn('"card"', reads[0])
+
+    def test_create_with_existing_counter_stays_within_query_budget(self):
+        """
+        Ensures that placing another order reads the offer detail again and only updates the counter.
+        """
+        self.create_order()
+        self.client.force_authenticate(user=User.objects.get(pk=self.customer_user.pk))
+        # Profile check, savepoint, offer detail with its offer, order insert, counter update, release.
+        with self.assertNumQueries(6):
+            response = self.create_order()
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data['business_user'], self.business_user.id)
+        self.assertEqual(Order.objects.count(), 2)
+        self.assertEqual(BusinessOrderCounter.objects.get(pk=self.business_user.pk).in_progress, 2)
+
+    def test_create_rolls_back_order_when_counter_update_fails(self):
+        """
+        Ensures that the order insert and the counter update are committed together or not at all.
+        """
+        with patch('orders_app.signals.adjust_counter', side_effect=DatabaseError('counter unavailable')):
+            with self.assertRaises(DatabaseError):
+                self.create_order()
+        self.assertFalse(Order.objects.exists())
+
+
+class OrderCheckoutTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for placing orders for several offer details at once.
+    """
+
+    def setUp(self):
+        """
+        Set up a customer and two business users with one offer detail each.
+        """
+        self.customer_user = self.create_user('customer@example.com', 'customer')
+        self.business_users = []
+        self.offer_details = []
+        for index, price in enumerate([100, 250]):
+            business_user = self.create_user(f'business{index}@example.com', 'business')
+            offer = Offer.objects.create(user=business_user, title=f'Offer {index}')
+            self.business_users.append(business_user)
+            self.offer_details.append(OfferDetail.objects.create(
+                offer=offer, title='Basic', revisions=2, delivery_time_in_days=5,
+                price=price, features=['Logo'], offer_type='basic'
+            ))
+        self.url = reverse('order-checkout')
+        self.client.force_authenticate(user=self.customer_user)
+
+    def checkout(self, offer_detail_ids):
+        return self.client.post(self.url, {'offer_detail_ids': offer_detail_ids}, format='json')
+
+    def test_checkout_creates_all_orders(self):
+        """
+        Ensures that checkout creates one order per offer detail with the snapshot of its price and features.
+        """
+        ids = [self.offer_details[1].id, self.offer_details[0].id, self.offer_details[1].id]
+        with CaptureQueriesContext(connection) as queries:
+            response = self.checkout(ids)
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([order['price'] for order in response.data], ['250.00', '100.00', '250.00'])
+        self.assertEqual(
+            [order['business_user'] for order in response.data],
+            [self.business_users[1].id, self.business_users[0].id, self.business_users[1].id]
+        )
+        self.assertTrue(all(order['customer_user'] == self.customer_user.id for order in response.data))
+        self.assertTrue(all(order['features'] == ['Logo'] for order in response.data))
+        self.assertEqual(Order.objects.count(), 3)
+        self.assertEqual(sum('offers_app_offerdetail' in query['sql'] for query in queries), 1)
+        self.assertEqual(sum(query['sql'].startswith('INSERT INTO "orders_app_order"') for query in queries), 1)
+
+    def test_checkout_updates_order_counters(self):
+        """
+        Ensures that orders placed by checkout are counted for their business users.
+        """
+        self.checkout([self.offer_details[0].id, self.offer_details[1].id, self.offer_details[1].id])
+        self.assertEqual(BusinessOrderCounter.objects.get(pk=self.business_users[0].pk).in_progress, 1)
+        self.assertEqual(BusinessOrderCounter.objects.get(pk=self.business_users[1].pk).in_progress, 2)
+
+    def test_checkout_with_unknown_offer_detail_creates_nothing(self):
+        """
+        Ensures that checkout returns 404 and creates no order if any offer detail does not exist.
+        """
+        response = self.checkout([self.offer_details[0].id, 9999])
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertIn('9999', response.data['detail'])
+        self.assertFalse(Order.objects.exists())
+
+    def test_checkout_with_offer_without_business_user_creates_nothing(self):
+        """
+        Ensures that checkout returns 400 and creates no order if any offer has no business user.
+        """
+        Offer.objects.filter(pk=self.offer_details[1].offer_id).update(user=None)
+        response = self.checkout([self.offer_details[0].id, self.offer_details[1].id])
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(Order.objects.exists())
+
+    def test_checkout_rolls_back_when_counter_update_fails(self):
+        """
+        Ensures that no order is kept if updating the order counters fails.
+        """
+        with patch('orders_app.api.serializers.adjust_counter', side_effect=DatabaseError('counter unavailable')):
+            with self.assertRaises(DatabaseError):
+                self.checkout([self.offer_details[0].id, self.offer_details[1].id])
+        self.assertFalse(Order.objects.exists())
+
+    def test_checkout_validates_offer_detail_ids(self):
+        """
+        Ensures that checkout rejects missing, empty, non-numeric and too many offer detail IDs.
+        """
+        for payload in [{}, {'offer_detail_ids': []}, {'offer_detail_ids': ['abc']},
+                        {'offer_detail_ids': [self.offer_details[0].id] * 21}]:
+            response = self.client.post(self.url, payload, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST, payload)
+        self.assertFalse(Order.objects.exists())
+
+    def test_checkout_requires_customer_user(self):
+        """
+        Ensures that business users cannot check out.
+        """
+        self.client.force_authenticate(user=self.business_users[0])
+        response = self.checkout([self.offer_details[1].id])
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Order.objects.exists())
+
+
+class OrderStatusTransitionTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for order status changes as conditional updates.
+    """
+
+    def setUp(self):
+        """
+        Set up a customer and a business user with an order in progress.
+        """
+        self.create_customer_and_business()
+        self.order = Order.objects.create(
+            customer_user=self.customer_user, business_user=self.business_user, title='Logo Design',
+            revisions=1, delivery_time_in_days=2, price=100, features=['Logo'], offer_type='basic'
+        )
+        self.url = reverse('order-detail', kwargs={'pk': self.order.id})
+        self.client.force_authenticate(user=self.business_user)
+
+    def get_counter(self):
+        counter = BusinessOrderCounter.objects.get(pk=self.business_user.pk)
+        return counter.in_progress, counter.completed, counter.cancelled
+
+    def test_status_change_updates_only_status_and_updated_at(self):
+        """
+        Ensures that a status change is one conditional UPDATE of status and updated_at.
+        """
+        # Order lookup, savepoint, order update, two counter updates, release.
+        with self.assertNumQueries(6) as queries:
+            response = self.client.patch(self.url, {'status': 'completed'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], 'completed')
+        self.assertEqual(response.data['features'], ['Logo'])
+        updates = [query['sql'] for query in queries if query['sql'].startswith('UPDATE "orders_app_order"')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"status" = \'completed\', "updated_at" =', updates[0])
+        self.assertIn('"orders_app_order"."status" = \'in_progress\'', updates[0])
+        self.assertNotIn('"features"', updates[0])
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, 'completed')
+        self.assertGreater(self.order.updated_at, self.order.created_at)
+        self.assertEqual(self.get_counter(), (0, 1, 0))
+
+    def test_final_status_cannot_change(self):
+        """
+        Ensures that completed and cancelled orders cannot change their status again.
+        """
+        self.client.patch(self.url, {'status': 'cancelled'}, format='json')
+        for new_status in ['completed', 'in_progress']:
+            response = self.client.patch(self.url, {'status': new_status}, format='json')
+            self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, 'cancelled')
+        self.assertEqual(self.get_counter(), (0, 0, 1))
+
+    def test_concurrent_status_change_conflicts(self):
+        """
+        Ensures that a status change based on a stale read returns 409 and writes nothing.
+        """
+        stale_order = Order.objects.get(pk=self.order.pk)
+        self.client.patch(self.url, {'status': 'cancelled'}, format='json')
+        with patch.object(OrderDetailView, 'get_object', return_value=stale_order):
+            response = self.client.patch(self.url, {'status': 'completed'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.order.refresh_from_db()
+        self.assertEqual(self.order.status, 'cancelled')
+        self.assertEqual(self.get_counter(), (0, 0, 1))
+
+    def test_unchanged_status_writes_nothing(self):
+        """
+        Ensures that requesting the current status returns the order without a write.
+        """
+        with self.assertNumQueries(1):
+            response = self.client.patch(self.url, {'status': 'in_progress'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.get_counter(), (1, 0, 0))
+
+    def test_unknown_status_returns_400(self):
+        """
+        Ensures that statuses outside the choices are still rejected as invalid.
+        """
+        response = self.client.patch(self.url, {'status': 'shipped'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class OrderArchiveTests(UserFixtureMixin, APITestCase):
+    """
+    Test suite for moving finished orders into the archive table and reading them back.
+    """
+
+    def setUp(self):
+        """
+        Set up a customer and a business user with two old finished orders, a recent finished one and one in progress.
+        """
+        self.create_customer_and_business()
+        self.orders = {}
+        for name, order_status in [('old_completed', 'completed'), ('old_cancelled', 'cancelled'),
+                                   ('recent_completed', 'completed'), ('old_in_progress', 'in_progress')]:
+            self.orders[name] = Order.objects.create(
+                customer_user=self.customer_user, business_user=self.business_user, title=name,
+                revisions=1, delivery_time_in_days=2, price=100, features=['Logo'], offer_type='basic',
+                status=order_status,
+            )
+        old = timezone.now() - timedelta(days=120)
+        Order.objects.exclude(pk=self.orders['recent_completed'].pk).update(updated_at=old)
+        self.client.force_authenticate(user=self.customer_user)
+
+    def archive(self, *args):
+        out = StringIO()
+        call_command('archive_orders', *args, stdout=out)
+        return out.getvalue()
+
+    def get_ids(self, response):
+        return [order['id'] for order in response.data['results']]
+
+    def test_archive_moves_only_old_finished_orders(self):
+        """
+        Ensures that only completed and cancelled orders older than the configured age are moved, unchanged.
+        """
+        before = {
+            row['id']: row for row in Order.objects.filter(
+                pk__in=[self.orders['old_completed'].pk, self.orders['old_cancelled'].pk]
+            ).values()
+        }
+        self.assertIn('Archived 2 finished orders', self.archive('--batch-size', '1'))
+        self.assertEqual(
+            set(Order.objects.values_list('title', flat=True)), {'recent_completed', 'old_in_progress'}
+        )
+        self.assertEqual({row['id']: row for row in ArchivedOrder.objects.values()}, before)
+        self.assertIn('Archived 0 finished orders', self.archive())
+
+    def test_dry_run_moves_nothing(self):
+        """
+        Ensures that a dry run only reports the number of archivable orders.
+        """
+        self.assertIn('2 finished orders older than 90 days would be archived', self.archive('--dry-run'))
+        self.assertEqual(Order.objects.count(), 4)
+        self.assertFalse(ArchivedOrder.objects.exists())
+
+    def test_archived_orders_stay_counted(self):
+        """
+        Ensures that archiving keeps the order counts and that deleting archived orders updates them.
+        """
+        counts_url = reverse('completed-order-count', kwargs={'business_user_id': self.business_user.id})
+        self.archive()
+        self.assertEqual(self.client.get(counts_url).data['completed_order_count'], 2)
+        call_command('reconcile_order_counters', '--check', stdout=StringIO())
+
+        ArchivedOrder.objects.filter(pk=self.orders['old_completed'].pk).delete()
+        self.assertEqual(self.client.get(counts_url).data['completed_order_count'], 1)
+        call_command('reconcile_order_counters', '--check', stdout=StringIO())
+
+    def test_list_includes_archive_only_when_asked(self):
+        """
+        Ensures that the order list merges archived orders into its pages only with include_archived.
+        """
+        self.archive()
+        url = reverse('order-list')
+        all_ids = [order.pk for order in sorted(self.orders.values(), key=lambda order: order.pk, reverse=True)]
+        self.assertEqual(
+            self.get_ids(self.client.get(url)),
+            [self.orders['old_in_progress'].pk, self.orders['recent_completed'].pk]
+        )
+
+        first = self.client.get(url, {'include_archived': 'true', 'page_size': 3})
+        second = self.client.get(first.data['next'])
+        self.assertEqual(self.get_ids(first) + self.get_ids(second), all_ids)
+        self.assertEqual(first.data['results'][2]['features'], ['Logo'])
+
+        self.client.force_authenticate(user=self.business_user)
+        with override_settings(VALUES_READ_PATH=False):
+            response = self.client.get(url, {'include_archived': 'true'})
+        self.assertEqual(self.get_ids(response), all_ids)
+
+    def test_list_includes_archive_with_sparse_fields(self):
+        """
+        Ensures that sparse fieldsets select the same columns from both tables, on both read paths.
+        """
+        self.archive()
+        expected = [
+            {'id': order.pk, 'status': order.status}
+            for order in sorted(self.orders.values(), key=lambda order: order.pk, reverse=True)
+        ]
+        for enabled in [True, False]:
+            with self.subTest(values_read_path=enabled), override_settings(VALUES_READ_PATH=enabled):
+                response = self.client.get(reverse('order-list'), {'include_archived': 'true', 'fields': 'id,status'})
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data['results'], expected)
+
+    def test_unpaginated_list_rejects_include_archived(self):
+        """
+        Ensures that include_archived is rejected while the order list is not paginated.
+        """
+        with override_settings(ORDER_LIST_PAGINATION=False):
+            response = self.client.get(reverse('order-list'), {'include_archived': 'true'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_detail_reads_archive_only_when_asked(self):
+        """
+        Ensures that archived orders are found by GET with include_archived and cannot be changed.
+        """
+        self.archive()
+        url = reverse('order-detail', kwargs={'pk': self.orders['old_completed'].pk})
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get(url, {'include_archived': 'true'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], 'old_completed')
+        not_modified = self.client.get(url, {'include_archived': 'true'}, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.force_authenticate(user=self.business_user)
+        response = self.client.patch(f'{url}?include_archived=true', {'status': 'cancelled'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -0,0 +1,57 @@
+from django.db import transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from .counters import adjust_counter
+from .models import Order
+
+
+class StatusConflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "The order status cannot be changed."
+    default_code = 'conflict'
+
+
+def change_status(order, new_status):
+    """
+    Move an order to a new status with a single conditional UPDATE.
+
+    The UPDATE only matches while the order still has the status it was
+    loaded with and only writes status and updated_at. Since every allowed
+    transition leaves in_progress for a final status, the status itself acts
+    as the row version. The order counters are adjusted in the same
+    transaction, because a queryset update does not send post_save.
+
+    Requesting the current status is a no-op and writes nothing.
+
+    Args:
+        order: Order as loaded by the caller
+        new_status: Requested status
+
+    Returns:
+        Order: The given order with the new status and updated_at
+
+    Raises:
+        StatusConflict: If the transition is not allowed or another request
+            changed the order first
+    """
+    old_status = order.status
+    if new_status == old_status:
+        return order
+    if new_status not in Order.STATUS_TRANSITIONS.get(old_status, ()):
+        raise StatusConflict(f"An order cannot change from '{old_status}' to '{new_status}'.")
+
+    updated_at = timezone.now()
+    with transaction.atomic():
+        changed = Order.objects.filter(pk=order.pk, status=old_status).update(
+            status=new_status, updated_at=updated_at
+        )
+        if not changed:
+            raise StatusConflict("The order was changed by another request. Reload it and try again.")
+        adjust_counter(order.business_user_id, old_status, -1)
+        adjust_counter(order.business_user_id, new_status, 1)
+    order.status = new_status
+    order.updated_at = updated_at
+    # Keep the counted status in step, so a later save() of this instance does not count the change twice
+    order._counted = (order.business_user_id, new_status)
+    return order
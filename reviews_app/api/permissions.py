@@ -6,7 +6,7 @@ class IsReviewer(permissions.BasePermission):
     Permission that only allows access to the creator of the review.
     """
     def has_object_permission(self, request, view, obj):
-        return obj.reviewer == request.user
+        return obj.reviewer_id == request.user.id
 
 class IsCustomerUser(permissions.BasePermission):
     """
@@ -2,6 +2,7 @@ from rest_framework import serializers
 from ..models import Review
 from django.contrib.auth.models import User
 from django.db.models import F
+from core.readers import ValuesReader
 
 class ReviewSerializer(serializers.ModelSerializer):
     """
@@ -35,4 +36,11 @@ class ReviewSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("You have already left a review for this business user.")
 
         validated_data['reviewer'] = reviewer
-        return super().create(validated_data)
\ No newline at end of file
+        return super().create(validated_data)
+
+
+class ReviewReader(ValuesReader):
+    """
+    values() fast path producing the same output as ReviewSerializer.
+    """
+    serializer_class = ReviewSerializer
@@ -4,11 +4,12 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.filters import OrderingFilter
 from django_filters.rest_framework import DjangoFilterBackend
 from ..models import Review
-from .serializers import ReviewSerializer
+from .serializers import ReviewSerializer, ReviewReader
 from .permissions import IsReviewer, IsCustomerUser
 from django.db.models import F
+from core.mixins import ConditionalRetrieveMixin, ValuesListMixin
 
-class ReviewListView(generics.ListCreateAPIView):
+class ReviewListView(ValuesListMixin, generics.ListCreateAPIView):
     """
     API view for listing and creating reviews.
     
@@ -21,9 +22,12 @@ class ReviewListView(generics.ListCreateAPIView):
         
     Filters: business_user, reviewer (exact match)
     Ordering: updated_at, rating (default: -updated_at)
+    Rendering: GET responses are built from values() rows by ReviewReader
+    Sparse fieldsets: ?fields=id,rating returns and selects only those fields
     """
     queryset = Review.objects.all()
     serializer_class = ReviewSerializer
+    values_reader_class = ReviewReader
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = {
@@ -52,7 +56,7 @@ class ReviewListView(generics.ListCreateAPIView):
             ordering = '-updated_at'
         return queryset.order_by(ordering)
 
-class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
+class ReviewDetailView(ConditionalRetrieveMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     API view for retrieving, updating, and deleting individual reviews.
     
@@ -60,10 +64,12 @@ class ReviewDetailView(generics.RetrieveUpdateDestroyAPIView):
     Supports partial updates for rating and description fields only.
     
     Permissions: Authenticated users who own the review
+    GET supports conditional requests (ETag / Last-Modified) validated by updated_at.
     """
     queryset = Review.objects.all()
     serializer_class = ReviewSerializer
     permission_classes = [IsAuthenticated, IsReviewer]
+    validator_fields = ['reviewer']
     
     def update(self, request, *args, **kwargs):
         """
@@ -12,6 +12,12 @@ class Review(models.Model):
     class Meta:
         # Ein Benutzer kann ein Geschäft nur einmal bewerten
         unique_together = ('business_user', 'reviewer',)
+        indexes = [
+            models.Index(fields=['updated_at'], name='review_updated_at_idx'),
+            models.Index(fields=['business_user', 'updated_at'], name='review_business_updated_idx'),
+            models.Index(fields=['business_user', 'rating'], name='review_business_rating_idx'),
+            models.Index(fields=['reviewer', 'updated_at'], name='review_reviewer_updated_idx'),
+        ]
 
     def __str__(self):
         return f"Review for {self.business_user.username} by {self.reviewer.username}"
@@ -2,6 +2,7 @@ from rest_framework.test import APITestCase
 from rest_framework import status
 from django.urls import reverse
 from django.contrib.auth.models import User
+from django.test import override_settings
 from user_profile.models import Profile
 from .models import Review
 
@@ -172,4 +173,126 @@ class ReviewTests(APITestCase):
         """
         self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.business_token}')
         response = self.client.delete(reverse('review-detail', kwargs={'pk': self.review.id}))
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+class ReviewConditionalGetTests(APITestCase):
+    """
+    Test suite for ETag / Last-Modified support of the review detail endpoint.
+    """
+
+    def setUp(self):
+        """
+        Create a review and a second customer who did not write it.
+        """
+        self.reviewer_user = User.objects.create_user(
+            username='reviewer@test.com', email='reviewer@test.com', password='testpassword'
+        )
+        self.business_user = User.objects.create_user(
+            username='business@test.com', email='business@test.com', password='testpassword'
+        )
+        self.other_user = User.objects.create_user(
+            username='other@test.com', email='other@test.com', password='testpassword'
+        )
+        self.review = Review.objects.create(
+            business_user=self.business_user, reviewer=self.reviewer_user, rating=4, description='Good'
+        )
+        self.url = reverse('review-detail', kwargs={'pk': self.review.id})
+
+    def test_review_not_modified_for_reviewer(self):
+        """
+        Ensures that the reviewer receives 304 for an unchanged review and 200 after an update.
+        """
+        self.client.force_authenticate(user=self.reviewer_user)
+        etag = self.client.get(self.url)['ETag']
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.client.patch(self.url, {'rating': 5}, format='json')
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['rating'], 5)
+
+    def test_conditional_request_still_checks_permissions(self):
+        """
+        Ensures that a matching ETag does not bypass the reviewer permission.
+        """
+        self.client.force_authenticate(user=self.reviewer_user)
+        etag = self.client.get(self.url)['ETag']
+        self.client.force_authenticate(user=self.other_user)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ReviewReadPathParityTests(APITestCase):
+    """
+    Test suite ensuring the values() read path renders the review list byte for byte like ReviewSerializer.
+    """
+
+    def setUp(self):
+        """
+        Create reviews from several customers for two business users.
+        """
+        self.business_users = []
+        for index in range(2):
+            user = User.objects.create_user(username=f'business{index}@example.com', password='testpassword')
+            Profile.objects.create(user=user, type='business')
+            self.business_users.append(user)
+        for index in range(3):
+            reviewer = User.objects.create_user(username=f'customer{index}@example.com', password='testpassword')
+            Profile.objects.create(user=reviewer, type='customer')
+            for business_user in self.business_users:
+                Review.objects.create(
+                    business_user=business_user, reviewer=reviewer, rating=index + 2,
+                    description=f'Sehr gut – „{index}“'
+                )
+        self.client.force_authenticate(user=reviewer)
+
+    def test_list_output_is_identical(self):
+        """
+        Ensures that both paths return identical bytes for filters and orderings.
+        """
+        for params in [{}, {'ordering': 'rating'}, {'business_user': self.business_users[0].id}]:
+            bodies = []
+            for enabled in [False, True]:
+                with override_settings(VALUES_READ_PATH=enabled):
+                    response = self.client.get(reverse('review-list'), params)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                bodies.append(response.content)
+            with self.subTest(params=params):
+                self.assertEqual(bodies[0], bodies[1])
+
+    def test_timestamps_are_identical_in_local_timezone(self):
+        """
+        Ensures that timestamps are rendered identically outside UTC.
+        """
+        bodies = []
+        for enabled in [False, True]:
+            with override_settings(VALUES_READ_PATH=enabled, TIME_ZONE='Europe/Berlin'):
+                response = self.client.get(reverse('review-list'))
+            bodies.append(response.content)
+        self.assertEqual(bodies[0], bodies[1])
+        self.assertIn(b'+0', bodies[1])
+
+
+class ReviewSparseFieldsTests(APITestCase):
+    """
+    Test suite for ?fields= sparse fieldsets on the review list.
+    """
+
+    def test_fields_trim_response_and_columns(self):
+        """
+        Ensures that only the requested fields are returned and selected, and unknown fields are rejected.
+        """
+        business_user = User.objects.create_user(username='business@example.com', password='testpassword')
+        reviewer = User.objects.create_user(username='customer@example.com', password='testpassword')
+        Review.objects.create(business_user=business_user, reviewer=reviewer, rating=5, description='Great')
+        self.client.force_authenticate(user=reviewer)
+
+        with self.assertNumQueries(1) as queries:
+            response = self.client.get(reverse('review-list'), {'fields': 'rating,business_user'})
+        self.assertEqual(response.data, [{'business_user': business_user.id, 'rating': 5}])
+        self.assertNotIn('description', queries.captured_queries[0]['sql'])
+
+        response = self.client.get(reverse('review-list'), {'fields': 'rating,text'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -8,6 +8,7 @@ from django.contrib.auth.models import User
 from user_profile.models import Profile
 from user_profile.api.serializers import ProfileSerializer, CustomerSerializer, BusinessSerializer
 from .permissions import IsOwner
+from core.mixins import SparseFieldsMixin
 from rest_framework.generics import ListAPIView
 
 class ProfileView(generics.RetrieveUpdateAPIView):
@@ -45,13 +46,26 @@ class ProfileView(generics.RetrieveUpdateAPIView):
             self.check_object_permissions(self.request, obj)
             
         return obj
-    
-class BusinessApiListView(ListAPIView):
+
+
+PROFILE_USERNAME_LOOKUPS = {'username': ['user__first_name', 'user__last_name', 'user__username']}
+
+
+class BusinessApiListView(SparseFieldsMixin, ListAPIView):
+    """
+    List business profiles. Supports sparse fieldsets, e.g. ?fields=user,username,file.
+    """
     queryset = Profile.objects.filter(type='business')
     serializer_class = BusinessSerializer
     permission_classes = [IsAuthenticated]
-    
-class CustomerApiListView(ListAPIView):
+    sparse_field_lookups = PROFILE_USERNAME_LOOKUPS
+
+
+class CustomerApiListView(SparseFieldsMixin, ListAPIView):
+    """
+    List customer profiles. Supports sparse fieldsets, e.g. ?fields=user,username,file.
+    """
     queryset = Profile.objects.filter(type='customer')
     serializer_class = CustomerSerializer
-    permission_classes = [IsAuthenticated]
\ No newline at end of file
+    permission_classes = [IsAuthenticated]
+    sparse_field_lookups = PROFILE_USERNAME_LOOKUPS
\ No newline at end of file
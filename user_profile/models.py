@@ -13,4 +13,9 @@ class Profile(models.Model):
     working_hours = models.CharField(max_length=20, default='', blank=True)
     original_username = models.CharField(max_length=150, blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['type'], name='profile_type_idx'),
+        ]
+
 admin.site.register(Profile)
@@ -3,6 +3,8 @@ from rest_framework import status
 from django.urls import reverse
 from django.contrib.auth.models import User
 from user_profile.models import Profile
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 class UserProfileTests(APITestCase):
 
@@ -134,4 +136,46 @@ class UserProfileTests(APITestCase):
         """
         self.client.credentials()
         response = self.client.get(self.customer_list_url)
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ProfileSparseFieldsTests(APITestCase):
+    """
+    Test suite for ?fields= sparse fieldsets on the profile lists.
+    """
+
+    def setUp(self):
+        """
+        Create several business and customer profiles.
+        """
+        for index in range(3):
+            for profile_type in ['business', 'customer']:
+                user = User.objects.create_user(
+                    username=f'{profile_type}{index}@test.com', password='testpassword',
+                    first_name='Max', last_name=f'Muster{index}'
+                )
+                Profile.objects.create(user=user, type=profile_type, description='About me')
+        self.client.force_authenticate(user=user)
+
+    def test_fields_trim_response_and_join_user_once(self):
+        """
+        Ensures that requested fields are returned from one query joining only the needed user columns.
+        """
+        for url_name in ['all-business-user', 'all-customer-user']:
+            with self.subTest(url_name=url_name):
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(reverse(url_name), {'fields': 'user,username'})
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data[0], {'user': response.data[0]['user'], 'username': 'max_muster0'})
+                self.assertEqual(len(queries), 1)
+                self.assertNotIn('description', queries[0]['sql'])
+                self.assertNotIn('password', queries[0]['sql'])
+
+    def test_fields_without_user_columns_skip_the_join(self):
+        """
+        Ensures that profile-only fields do not join the user table.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('all-business-user'), {'fields': 'location,type'})
+        self.assertEqual(response.data[0], {'location': '', 'type': 'business'})
+        self.assertNotIn('auth_user', queries[0]['sql'])